@@ -0,0 +1,185 @@
+"""Benchmark cases for all conversions of Point and Tile, scalar at a low and a high zoom and batched with numpy
+
+The query cases measure single lookups in a TileSet of BATCH_SIZE tiles spread over all zooms up to the zoom and in
+the TileRanges of a region.
+"""
+from collections import namedtuple
+
+Case = namedtuple('Case', 'name statement setup size')
+
+ZOOMS = (3, 19)
+BATCH_SIZE = 10000
+
+SCALAR_SETUP = '''
+from pygeotile.point import Point
+from pygeotile.tile import Tile
+zoom = {zoom}
+latitude, longitude = 41.85, -87.65
+point = Point.from_latitude_longitude(latitude=latitude, longitude=longitude)
+pixel_x, pixel_y = point.pixels(zoom=zoom)
+meter_x, meter_y = point.meters
+tile = Tile.for_point(point=point, zoom=zoom)
+tms_x, tms_y = tile.tms
+google_x, google_y = tile.google
+quad_tree = tile.quad_tree
+quad_key_int = tile.quad_key_int
+from pygeotile.cache import TileCache
+cache = TileCache()
+cache.for_latitude_longitude(latitude=latitude, longitude=longitude, zoom=zoom)
+cache.bounds(tile)
+from pygeotile.url import TileUrlTemplate
+xyz_template, quad_tree_template = TileUrlTemplate('xyz'), TileUrlTemplate('quad_tree')
+'''
+
+BATCH_SETUP = '''
+import numpy
+from pygeotile.tile import Tile
+from pygeotile.tile_array import TileArray
+from pygeotile.point import (latitude_longitude_to_meters, meters_to_latitude_longitude, latitude_longitude_to_pixels,
+                             pixels_to_latitude_longitude, tiles_and_offsets)
+zoom = {zoom}
+random = numpy.random.RandomState(42)
+latitudes = random.uniform(-85.0, 85.0, {size})
+longitudes = random.uniform(-179.0, 179.0, {size})
+tile_array = TileArray.for_latitude_longitude(latitudes=latitudes, longitudes=longitudes, zoom=zoom)
+tiles = tile_array.to_tiles()
+quad_key_int = tile_array.quad_key_int
+meters_x, meters_y = latitude_longitude_to_meters(latitudes, longitudes)
+pixels_x, pixels_y = latitude_longitude_to_pixels(latitudes, longitudes, zoom=zoom)
+out = numpy.empty({size}), numpy.empty({size})
+from pygeotile.tile_set import TileSet
+levels = numpy.arange({size}) % (zoom + 1)
+tile_set = TileSet.from_tile_array(TileArray(tms_x=tile_array.tms_x >> levels, tms_y=tile_array.tms_y >> levels,
+                                             zoom=zoom - levels))
+other_tile_set = TileSet.from_tile_array(tile_array[::2])
+tile = tiles[0]
+parent = tile.parent(levels=min(zoom, 2))
+latitude, longitude = float(latitudes[0]), float(longitudes[0])
+from pygeotile.tile_ranges import TileRanges
+tile_ranges = TileRanges.for_bounds(47.32, 8.45, 47.43, 8.63, min_zoom=zoom, max_zoom=zoom)
+from pygeotile.aggregate import TileCounts
+tile_counts = TileCounts(zooms=zoom).add(latitudes=latitudes, longitudes=longitudes)
+from pygeotile.url import TileUrlTemplate
+xyz_template = TileUrlTemplate('xyz')
+import json
+from pygeotile import binary
+tms_json = json.dumps([list(tile.tms) + [tile.zoom] for tile in tiles])
+packed_tiles = binary.pack_tiles(tile_array)
+packed_quad_key_int = binary.pack_quad_key_int(tile_set.quad_key_int)
+from pygeotile.mbtiles import MBTiles
+mbtiles = MBTiles(':memory:')
+mbtiles.write((tile, b'') for tile in tiles[::2])
+'''
+
+SCALAR_STATEMENTS = (
+    ('Point.from_latitude_longitude', 'Point.from_latitude_longitude(latitude=latitude, longitude=longitude)'),
+    ('Point.from_pixel', 'Point.from_pixel(pixel_x=pixel_x, pixel_y=pixel_y, zoom=zoom)'),
+    ('Point.from_meters', 'Point.from_meters(meter_x=meter_x, meter_y=meter_y)'),
+    ('Point.from_meters unchecked', 'Point.from_meters(meter_x=meter_x, meter_y=meter_y, validate=False)'),
+    ('Point.latitude_longitude', 'point.latitude_longitude'),
+    ('Point.pixels', 'point.pixels(zoom=zoom)'),
+    ('Point.meters', 'point.meters'),
+    ('Point.tile_and_offset', 'point.tile_and_offset(zoom=zoom)'),
+    ('Point.pixels and Tile.for_pixels', 'Tile.for_pixels(*point.pixels(zoom=zoom), zoom=zoom)'),
+    ('Tile.from_quad_tree', 'Tile.from_quad_tree(quad_tree=quad_tree)'),
+    ('Tile.from_quad_key_int', 'Tile.from_quad_key_int(quad_key_int)'),
+    ('Tile.from_tms', 'Tile.from_tms(tms_x=tms_x, tms_y=tms_y, zoom=zoom)'),
+    ('Tile.from_tms unchecked', 'Tile.from_tms(tms_x=tms_x, tms_y=tms_y, zoom=zoom, validate=False)'),
+    ('Tile.from_google', 'Tile.from_google(google_x=google_x, google_y=google_y, zoom=zoom)'),
+    ('Tile.from_google unchecked', 'Tile.from_google(google_x=google_x, google_y=google_y, zoom=zoom, validate=False)'),
+    ('Tile.for_point', 'Tile.for_point(point=point, zoom=zoom)'),
+    ('Tile.for_pixels', 'Tile.for_pixels(pixel_x=pixel_x, pixel_y=pixel_y, zoom=zoom)'),
+    ('Tile.for_meters', 'Tile.for_meters(meter_x=meter_x, meter_y=meter_y, zoom=zoom)'),
+    ('Tile.for_latitude_longitude', 'Tile.for_latitude_longitude(latitude=latitude, longitude=longitude, zoom=zoom)'),
+    ('Tile.for_latitude_longitude unchecked',
+     'Tile.for_latitude_longitude(latitude=latitude, longitude=longitude, zoom=zoom, validate=False)'),
+    ('Tile.for_latitude_longitude_all_zooms',
+     'Tile.for_latitude_longitude_all_zooms(latitude=latitude, longitude=longitude, min_zoom=0, max_zoom=zoom)'),
+    ('TileCache.for_latitude_longitude hit',
+     'cache.for_latitude_longitude(latitude=latitude, longitude=longitude, zoom=zoom)'),
+    ('Tile.tms', 'tile.tms'),
+    ('Tile.quad_tree', 'tile.quad_tree'),
+    ('Tile.quad_key_int', 'tile.quad_key_int'),
+    ('Tile.google', 'tile.google'),
+    ('Tile.bounds', 'tile.bounds'),
+    ('TileCache.bounds hit', 'cache.bounds(tile)'),
+    ('Tile.bounds_meters', 'tile.bounds_meters'),
+    ('Tile.bounds_latitude_longitude', 'tile.bounds_latitude_longitude'),
+    ('TileUrlTemplate.format xyz', 'xyz_template.format(tile)'),
+    ('TileUrlTemplate.format quad_tree', 'quad_tree_template.format(tile)'),
+    ('Tile.parent', 'tile.parent()'),
+    ('Tile.children', 'tile.children()'),
+    ('Tile.ancestors', 'tile.ancestors()'),
+)
+
+BATCH_STATEMENTS = (
+    ('Tile.for_latitude_longitude_array',
+     'Tile.for_latitude_longitude_array(latitudes=latitudes, longitudes=longitudes, zoom=zoom)'),
+    ('Tile.for_latitude_longitude_array unchecked',
+     'Tile.for_latitude_longitude_array(latitudes=latitudes, longitudes=longitudes, zoom=zoom, validate=False)'),
+    ('Tile.for_latitude_longitude_all_zooms_array',
+     'Tile.for_latitude_longitude_all_zooms_array(latitudes=latitudes, longitudes=longitudes, min_zoom=0, '
+     'max_zoom=zoom)'),
+    ('latitude_longitude_to_meters', 'latitude_longitude_to_meters(latitudes, longitudes)'),
+    ('latitude_longitude_to_meters out', 'latitude_longitude_to_meters(latitudes, longitudes, out=out)'),
+    ('latitude_longitude_to_meters exact', 'latitude_longitude_to_meters(latitudes, longitudes, exact=True)'),
+    ('meters_to_latitude_longitude', 'meters_to_latitude_longitude(meters_x, meters_y)'),
+    ('meters_to_latitude_longitude out', 'meters_to_latitude_longitude(meters_x, meters_y, out=out)'),
+    ('latitude_longitude_to_pixels', 'latitude_longitude_to_pixels(latitudes, longitudes, zoom=zoom)'),
+    ('pixels_to_latitude_longitude', 'pixels_to_latitude_longitude(pixels_x, pixels_y, zoom=zoom)'),
+    ('tiles_and_offsets', 'tiles_and_offsets(latitudes, longitudes, zoom=zoom)'),
+    ('TileSet.from_tile_array', 'TileSet.from_tile_array(tile_array)'),
+    ('TileSet.contains', 'tile_set.contains(tile_array)'),
+    ('TileSet.deepest_tiles', 'tile_set.deepest_tiles(latitudes=latitudes, longitudes=longitudes)'),
+    ('TileSet.union', 'tile_set | other_tile_set'),
+    ('TileSet.intersection', 'tile_set & other_tile_set'),
+    ('TileRanges.from_tile_array', 'TileRanges.from_tile_array(tile_array)'),
+    ('TileRanges.contains', 'tile_ranges.contains(tile_array)'),
+    ('TileCounts.add', 'TileCounts(zooms=zoom).add(latitudes=latitudes, longitudes=longitudes)'),
+    ('TileCounts.add all zooms',
+     'TileCounts(zooms=range(zoom + 1)).add(latitudes=latitudes, longitudes=longitudes)'),
+    ('TileCounts.rollup', 'tile_counts.rollup()'),
+    ('TileUrlTemplate.format_tiles xyz', 'list(xyz_template.format_tiles(tile_array))'),
+    ('binary.pack_tiles', 'binary.pack_tiles(tile_array)'),
+    ('binary.unpack tiles', 'binary.unpack(packed_tiles)'),
+    ('binary.pack_quad_key_int', 'binary.pack_quad_key_int(tile_set.quad_key_int)'),
+    ('binary.unpack quad_key_int', 'binary.unpack(packed_quad_key_int)'),
+    ('json.loads tiles', 'json.loads(tms_json)'),
+    ('MBTiles.write', "mbtiles.write((tile, b'') for tile in tiles)"),
+    ('MBTiles.existing', 'mbtiles.existing(tiles)'),
+    ('MBTiles.tiles', 'list(mbtiles.tiles())'),
+    ('TileArray.from_tiles', 'TileArray.from_tiles(tiles)'),
+    ('TileArray.from_quad_key_int', 'TileArray.from_quad_key_int(quad_key_int)'),
+    ('TileArray.to_tiles', 'tile_array.to_tiles()'),
+    ('TileArray.google', 'tile_array.google'),
+    ('TileArray.quad_tree', 'tile_array.quad_tree'),
+    ('TileArray.quad_key_int', 'tile_array.quad_key_int'),
+    ('TileArray.bounds', 'tile_array.bounds'),
+    ('TileArray.bounds_meters', 'tile_array.bounds_meters'),
+    ('TileArray.centroids', 'tile_array.centroids'),
+    ('TileArray.corners', 'tile_array.corners'),
+)
+
+QUERY_STATEMENTS = (
+    ('TileSet.__contains__', 'tile in tile_set'),
+    ('TileSet.deepest_tile', 'tile_set.deepest_tile(latitude=latitude, longitude=longitude)'),
+    ('TileSet.count_within', 'tile_set.count_within(parent)'),
+    ('TileSet.within', 'tile_set.within(parent)'),
+    ('TileRanges.__contains__', 'tile in tile_ranges'),
+    ('TileRanges.for_bounds', 'TileRanges.for_bounds(47.32, 8.45, 47.43, 8.63, min_zoom=zoom, max_zoom=zoom)'),
+)
+
+
+def all_cases():
+    """Gets all benchmark cases, the batch cases measure the time per element and the query cases per call"""
+    cases = []
+    for zoom in ZOOMS:
+        cases.extend(Case(name='{}[zoom={}]'.format(name, zoom), statement=statement,
+                          setup=SCALAR_SETUP.format(zoom=zoom), size=1) for name, statement in SCALAR_STATEMENTS)
+        cases.extend(Case(name='batch {}[zoom={}]'.format(name, zoom), statement=statement,
+                          setup=BATCH_SETUP.format(zoom=zoom, size=BATCH_SIZE), size=BATCH_SIZE)
+                     for name, statement in BATCH_STATEMENTS)
+        cases.extend(Case(name='query {}[zoom={}]'.format(name, zoom), statement=statement,
+                          setup=BATCH_SETUP.format(zoom=zoom, size=BATCH_SIZE), size=1)
+                     for name, statement in QUERY_STATEMENTS)
+    return cases
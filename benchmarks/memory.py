@@ -0,0 +1,65 @@
+"""Memory benchmark of Point and Tile instances and of sets of tiles, run with: python -m benchmarks.memory"""
+import sys
+import tracemalloc
+
+from pygeotile.point import Point, BasePoint
+from pygeotile.tile import Tile, BaseTile
+from pygeotile.tile_set import TileSet
+from pygeotile.tile_ranges import TileRanges
+from pygeotile.compat import numpy
+
+
+class DictPoint(BasePoint):
+    """Point as it was before __slots__, every instance carries a __dict__"""
+
+
+class DictTile(BaseTile):
+    """Tile as it was before __slots__, every instance carries a __dict__"""
+
+
+def allocated_bytes(factory, count):
+    """Gets the bytes allocated per instance when creating count instances"""
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    instances = [factory(index) for index in range(count)]
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (end - start) / float(len(instances))
+
+
+def main(count=100000):
+    classes = (('Point with __dict__', DictPoint), ('Point', Point), ('Tile with __dict__', DictTile), ('Tile', Tile))
+    for name, cls in classes:
+        if issubclass(cls, BasePoint):
+            factory = lambda index: cls(latitude=index * 1e-3, longitude=-index * 1e-3)  # noqa: E731
+        else:
+            factory = lambda index: cls(tms_x=index + 300000, tms_y=index + 400000, zoom=19)  # noqa: E731
+        instance = factory(1)
+        instance_dict = getattr(instance, '__dict__', None)
+        size = sys.getsizeof(instance) + (sys.getsizeof(instance_dict) if instance_dict is not None else 0)
+        print('{:<20} getsizeof {:>4} bytes, allocated {:>6.1f} bytes per instance incl. values'.format(
+            name, size, allocated_bytes(factory, count)))
+    tile_sets(count)
+
+
+def tile_sets(count):
+    """Prints the bytes per tile of a Python set of Tile, of a TileSet and of TileRanges (requires numpy)"""
+    if numpy is None:
+        return
+    tiles = [Tile(tms_x=index + 300000, tms_y=index % 1000 + 400000, zoom=19) for index in range(count)]
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    python_set = set(Tile(*tile) for tile in tiles)
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    tile_set = TileSet.from_tiles(tiles)
+    print('{:<20} allocated {:>6.1f} bytes per tile incl. the set'.format('set of Tile',
+                                                                          (end - start) / float(len(python_set))))
+    print('{:<20} allocated {:>6.1f} bytes per tile'.format('TileSet', tile_set.nbytes / float(len(tile_set))))
+    tile_ranges = TileRanges.for_bounds(45.8, 5.9, 47.8, 10.5, min_zoom=18, max_zoom=18)
+    print('{:<20} allocated {:>6.3f} bytes per tile of a region of {} tiles at zoom 18'.format(
+        'TileRanges', tile_ranges.nbytes / float(len(tile_ranges)), len(tile_ranges)))
+
+
+if __name__ == '__main__':
+    main()
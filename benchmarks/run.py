@@ -0,0 +1,78 @@
+"""Runs the benchmark suite offline and compares it against a stored baseline
+
+Usage:
+    python -m benchmarks.run                                   # print ns per conversion
+    python -m benchmarks.run --save benchmarks/baseline.json   # store a new baseline
+    python -m benchmarks.run --compare benchmarks/baseline.json --threshold 1.5
+
+With --compare the exit code is 1 if any case is slower than threshold times its baseline.
+"""
+import argparse
+import json
+import sys
+import timeit
+
+from .cases import all_cases
+
+
+def _has_numpy():
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def measure(case, repeat=3, min_time=0.05):
+    """Gets the best time in nanoseconds per element of a case"""
+    timer = timeit.Timer(case.statement, setup=case.setup)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 4
+    return min(timer.repeat(repeat=repeat, number=number)) / number / case.size * 1e9
+
+
+def run(name_filter='', repeat=3, min_time=0.05):
+    """Gets a dict of case name and nanoseconds per element of all cases matching the filter"""
+    numpy_available = _has_numpy()
+    results = {}
+    for case in all_cases():
+        if name_filter not in case.name or (case.name.startswith('batch') and not numpy_available):
+            continue
+        results[case.name] = measure(case, repeat=repeat, min_time=min_time)
+        print('{:<60} {:>12.1f} ns'.format(case.name, results[case.name]))
+    return results
+
+
+def regressions(results, baseline, threshold):
+    """Gets the names and ratios of all results slower than threshold times their baseline"""
+    return [(name, nanoseconds / baseline[name]) for name, nanoseconds in sorted(results.items())
+            if name in baseline and nanoseconds > baseline[name] * threshold]
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description='Benchmarks all conversions of Point and Tile.')
+    parser.add_argument('--filter', default='', help='only run cases containing this text')
+    parser.add_argument('--repeat', type=int, default=3, help='repetitions per case, the best one is taken')
+    parser.add_argument('--min-time', type=float, default=0.05, help='minimal seconds per repetition')
+    parser.add_argument('--save', metavar='PATH', help='store the results as baseline')
+    parser.add_argument('--compare', metavar='PATH', help='compare the results against a baseline')
+    parser.add_argument('--threshold', type=float, default=1.5, help='allowed slowdown factor against the baseline')
+    arguments = parser.parse_args(arguments)
+
+    results = run(name_filter=arguments.filter, repeat=arguments.repeat, min_time=arguments.min_time)
+    if arguments.save:
+        with open(arguments.save, 'w') as baseline_file:
+            json.dump(results, baseline_file, indent=2, sort_keys=True)
+    if arguments.compare:
+        with open(arguments.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+        slower = regressions(results, baseline, threshold=arguments.threshold)
+        for name, ratio in slower:
+            print('REGRESSION {} is {:.2f}x slower than the baseline'.format(name, ratio))
+        return 1 if slower else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
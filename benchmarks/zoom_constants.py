@@ -0,0 +1,30 @@
+"""Micro-benchmark of the precomputed per zoom constants, run with: python benchmarks/zoom_constants.py"""
+import timeit
+
+SETUP = '''
+from pygeotile.meta import INITIAL_RESOLUTION, TILE_SIZE, resolution, zoom_constants
+from pygeotile.point import Point
+from pygeotile.tile import Tile
+zoom = 19
+point = Point(latitude=41.85, longitude=-87.65)
+'''
+
+STATEMENTS = [
+    ('computed resolution', 'INITIAL_RESOLUTION / (2 ** zoom)'),
+    ('resolution(zoom)', 'resolution(zoom)'),
+    ('computed half size', 'int((TILE_SIZE * 2 ** zoom) / 2)'),
+    ('zoom_constants(zoom).half_size', 'zoom_constants(zoom).half_size'),
+    ('Point.pixels', 'point.pixels(zoom=zoom)'),
+    ('Point.from_pixel', 'Point.from_pixel(pixel_x=34430575, pixel_y=49899071, zoom=zoom)'),
+    ('Tile.from_tms', 'Tile.from_tms(tms_x=134494, tms_y=329369, zoom=zoom)'),
+]
+
+
+def main(number=200000):
+    for name, statement in STATEMENTS:
+        seconds = min(timeit.repeat(statement, setup=SETUP, number=number, repeat=3))
+        print('{:<32} {:>8.1f} ns/call'.format(name, seconds / number * 1e9))
+
+
+if __name__ == '__main__':
+    main()
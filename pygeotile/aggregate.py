@@ -0,0 +1,177 @@
+from .tile import Tile, QUAD_KEY_MAX_ZOOM, QUAD_KEY_ZOOM_BITS, _QUAD_KEY_ZOOM_MASK, _interleave
+from .tile_array import TileArray
+from .meta import DEFAULT_TILE_GRID
+from .compat import require_numpy
+from .validation import check
+
+_MAX_PENDING_BATCHES = 16
+
+
+def _sum_by_key(quad_key_int, values):
+    """Gets the sorted unique keys and the sums of the values per key, keeping the dtype of values"""
+    np = require_numpy()
+    order = np.argsort(quad_key_int, kind='stable')
+    quad_key_int, values = quad_key_int[order], values[order]
+    if not len(quad_key_int):
+        return quad_key_int, values
+    first = np.ones(len(quad_key_int), dtype=bool)
+    first[1:] = quad_key_int[1:] != quad_key_int[:-1]
+    starts = np.flatnonzero(first)
+    return quad_key_int[starts], np.add.reduceat(values, starts)
+
+
+def _parent_quad_key_int(quad_key_int, zoom):
+    """Gets the integer quad keys of the ancestors at zoom, the keys being left aligned only the lower bits change"""
+    np = require_numpy()
+    shift = 2 * (QUAD_KEY_MAX_ZOOM - zoom) + QUAD_KEY_ZOOM_BITS
+    return (quad_key_int & ~np.uint64((1 << shift) - 1)) | np.uint64(zoom)
+
+
+def _rolled_up(quad_key_int, values, zooms):
+    """Gets keys and sums for every zoom of zooms from the keys and sums at a higher zoom"""
+    np = require_numpy()
+    parts = [_sum_by_key(_parent_quad_key_int(quad_key_int, zoom), values) for zoom in zooms]
+    return (np.concatenate([keys for keys, _ in parts] + [quad_key_int[:0]]),
+            np.concatenate([sums for _, sums in parts] + [values[:0]]))
+
+
+class TileCounts(object):
+    """Counts, or sums of weights, of points per tile at one or more zooms up to QUAD_KEY_MAX_ZOOM (requires numpy)
+
+    The points are binned like Tile.for_latitude_longitude at the highest zoom, the lower zooms are rolled up from the
+    tiles of the highest one. Counters are kept as sorted integer quad keys with int64 counts or float64 sums, batches
+    are aggregated on their own and merged lazily.
+    """
+
+    __slots__ = ('zooms', 'weighted', 'grid', '_quad_key_int', '_values', '_pending')
+
+    def __init__(self, zooms, weighted=False, grid=DEFAULT_TILE_GRID):
+        np = require_numpy()
+        zooms = sorted(set(int(zoom) for zoom in ([zooms] if np.ndim(zooms) == 0 else zooms)))
+        check(bool(zooms) and 0 <= zooms[0] and zooms[-1] <= QUAD_KEY_MAX_ZOOM,
+              'Zooms need to be values between 0 and {}.'.format(QUAD_KEY_MAX_ZOOM))
+        self.zooms = tuple(zooms)
+        self.weighted = weighted
+        self.grid = grid
+        self._quad_key_int = np.empty(0, dtype=np.uint64)
+        self._values = np.empty(0, dtype=np.float64 if weighted else np.int64)
+        self._pending = []
+
+    @classmethod
+    def from_quad_key_int(cls, quad_key_int, values, weighted=False, grid=DEFAULT_TILE_GRID):
+        """Creates tile counts from integer quad keys and their counts or sums, duplicate keys being summed up"""
+        np = require_numpy()
+        quad_key_int = np.asarray(quad_key_int, dtype=np.uint64)
+        zooms = np.unique(quad_key_int & np.uint64(_QUAD_KEY_ZOOM_MASK)).tolist()
+        tile_counts = cls(zooms=zooms or [0], weighted=weighted, grid=grid)
+        tile_counts._pending.append((quad_key_int, np.asarray(values, dtype=tile_counts._values.dtype)))
+        return tile_counts
+
+    def add(self, latitudes, longitudes, weights=None, validate=None):
+        """Adds a batch of lat/lon arrays in WGS84, with an array of weights for weighted tile counts
+
+        Invalid lat/lon raise a ValidationError holding the indices of all offending values, the batch is then not
+        added. Returns the tile counts.
+        """
+        np = require_numpy()
+        check((weights is not None) == self.weighted, 'Weights need to be given exactly for weighted tile counts.')
+        max_zoom = self.zooms[-1]
+        tms_x, tms_y, _ = Tile.for_latitude_longitude_array(latitudes=latitudes, longitudes=longitudes, zoom=max_zoom,
+                                                            grid=self.grid, validate=validate)
+        google_y = self.grid.zoom_constants(max_zoom).max_tile - tms_y
+        morton = _interleave(tms_x.astype(np.uint64), google_y.astype(np.uint64))
+        quad_key_int = (morton << np.uint64(2 * (QUAD_KEY_MAX_ZOOM - max_zoom) + QUAD_KEY_ZOOM_BITS)) | \
+            np.uint64(max_zoom)
+        if weights is None:
+            values = np.ones(len(quad_key_int), dtype=np.int64)
+        else:
+            values = np.asarray(weights, dtype=np.float64)
+            check(values.shape == quad_key_int.shape, 'Weights need to be an array of the length of the points.')
+        quad_key_int, values = _sum_by_key(quad_key_int, values)
+        lower_keys, lower_values = _rolled_up(quad_key_int, values, self.zooms[:-1])
+        self._pending.append((np.concatenate((lower_keys, quad_key_int)), np.concatenate((lower_values, values))))
+        if len(self._pending) >= _MAX_PENDING_BATCHES:
+            self._merge_pending()
+        return self
+
+    def merge(self, other):
+        """Adds the counts of other tile counts, for example the partial counts of another worker
+
+        Both tile counts need the same zooms and tile size, otherwise a ValidationError is raised. Returns the tile
+        counts.
+        """
+        check(other.weighted == self.weighted, 'Weighted and unweighted tile counts can not be merged.')
+        check(other.zooms == self.zooms and other.grid.tile_size == self.grid.tile_size,
+              'Tile counts need the same zooms and tile size to be merged.')
+        self._pending.append((other.quad_key_int, other.values))
+        self._merge_pending()
+        return self
+
+    def _merge_pending(self):
+        np = require_numpy()
+        if self._pending:
+            self._quad_key_int, self._values = _sum_by_key(
+                np.concatenate([self._quad_key_int] + [keys for keys, _ in self._pending]),
+                np.concatenate([self._values] + [values for _, values in self._pending]))
+            self._pending = []
+
+    def rollup(self, min_zoom=0):
+        """Gets new tile counts for every zoom from min_zoom to the highest zoom, rolled up from the highest zoom"""
+        np = require_numpy()
+        max_zoom = self.zooms[-1]
+        check(0 <= min_zoom <= max_zoom, 'Min zoom needs to be a value between 0 and the highest zoom.')
+        at_max_zoom = (self.quad_key_int & np.uint64(_QUAD_KEY_ZOOM_MASK)) == max_zoom
+        quad_key_int, values = self.quad_key_int[at_max_zoom], self.values[at_max_zoom]
+        tile_counts = TileCounts(zooms=range(min_zoom, max_zoom + 1), weighted=self.weighted, grid=self.grid)
+        tile_counts._pending.append(_rolled_up(quad_key_int, values, range(min_zoom, max_zoom + 1)))
+        tile_counts._merge_pending()
+        return tile_counts
+
+    @property
+    def quad_key_int(self):
+        """Gets the sorted uint64 array of integer quad keys of all tiles with points"""
+        self._merge_pending()
+        return self._quad_key_int
+
+    @property
+    def values(self):
+        """Gets the counts as int64 array or the sums of weights as float64 array in the order of quad_key_int"""
+        self._merge_pending()
+        return self._values
+
+    def to_tile_array(self):
+        """Gets the tiles with points as tile array in the order of quad_key_int"""
+        return TileArray.from_quad_key_int(self.quad_key_int, validate=False)
+
+    def at_zoom(self, zoom):
+        """Gets the tiles with points of a zoom as tile array and their counts or sums"""
+        np = require_numpy()
+        selected = (self.quad_key_int & np.uint64(_QUAD_KEY_ZOOM_MASK)) == zoom
+        return TileArray.from_quad_key_int(self.quad_key_int[selected], validate=False), self.values[selected]
+
+    def get(self, tile, default=0):
+        """Gets the count or sum of a tile, or default if there are no points in the tile"""
+        np = require_numpy()
+        if tile.zoom > QUAD_KEY_MAX_ZOOM:
+            return default
+        quad_key_int = tile.quad_key_int
+        index = int(self.quad_key_int.searchsorted(np.uint64(quad_key_int)))
+        if index < len(self) and int(self._quad_key_int[index]) == quad_key_int:
+            return self._values[index].item()
+        return default
+
+    def items(self):
+        """Yields every tile with points and its count or sum in the order of quad_key_int"""
+        return zip(self.to_tile_array(), self.values.tolist())
+
+    def __getitem__(self, tile):
+        return self.get(tile)
+
+    def __len__(self):
+        return len(self.quad_key_int)
+
+    def __repr__(self):
+        return 'TileCounts(zooms={}, tiles={})'.format(self.zooms, len(self))
+
+
+__all__ = ['TileCounts']
@@ -0,0 +1,50 @@
+"""Streaming of tile requests to asyncio clients with bounded concurrency (requires Python 3.6+)"""
+import asyncio
+
+from .url import TileUrlTemplate
+from .validation import check
+
+
+async def _tile_iterator(tiles):
+    if hasattr(tiles, '__aiter__'):
+        async for tile in tiles:
+            yield tile
+    else:
+        for tile in tiles:
+            yield tile
+
+
+async def fetch_tiles(tiles, fetch, template, concurrency=16):
+    """Yields every tile of an iterable or async iterable of tiles with the result of awaiting fetch(url) for its URL
+
+    The URLs are formatted by template, a TileUrlTemplate or its template. At most concurrency fetches run at once and
+    the next tile is only taken from tiles when a fetch is done, so lazy tile iterators are never read far ahead.
+    The tiles are yielded in the order their fetches complete. If a fetch fails, the fetches still running are
+    cancelled and the exception is raised.
+    """
+    check(concurrency > 0, 'Concurrency needs to be a value greater than 0.')
+    if not isinstance(template, TileUrlTemplate):
+        template = TileUrlTemplate(template)
+    tiles = _tile_iterator(tiles)
+    tiles_by_task = {}
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(tiles_by_task) < concurrency:
+                try:
+                    tile = await tiles.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                else:
+                    tiles_by_task[asyncio.ensure_future(fetch(template.format(tile)))] = tile
+            if not tiles_by_task:
+                return
+            done, _ = await asyncio.wait(tiles_by_task, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield tiles_by_task.pop(task), task.result()
+    finally:
+        for task in tiles_by_task:
+            task.cancel()
+
+
+__all__ = ['fetch_tiles']
@@ -0,0 +1,134 @@
+"""Compact binary formats of tiles, points and sorted integer quad keys (requires numpy)
+
+Every format starts with a 16 byte header of magic, version, kind and count. Tiles and points follow as little
+endian columns of fixed width, TMS X and TMS Y as uint32 and the zoom as uint8, latitudes and longitudes as float64,
+so unpacking them only creates views of the buffer, of a memory mapped file for example. Integer quad keys follow
+sorted as LEB128 varints of the differences between consecutive keys, which unpacking has to decode.
+"""
+import mmap
+import struct
+
+from .tile import QUAD_KEY_MAX_ZOOM, QUAD_KEY_ZOOM_BITS, _QUAD_KEY_ZOOM_MASK
+from .tile_array import TileArray
+from .tile_ranges import _ZOOM_SHIFT, _MORTON_MASK
+from .compat import require_numpy
+from .validation import check
+
+TILES = 1
+POINTS = 2
+QUAD_KEY_INT = 3
+
+_MAGIC = b'PGTB'
+_VERSION = 1
+_HEADER = struct.Struct('<4sBBxxQ')
+_KINDS = (TILES, POINTS, QUAD_KEY_INT)
+
+
+def _header(kind, count):
+    return _HEADER.pack(_MAGIC, _VERSION, kind, count)
+
+
+def pack_tiles(tiles):
+    """Gets the bytes of an iterable of tiles or of a TileArray, 9 bytes per tile"""
+    np = require_numpy()
+    tile_array = tiles if isinstance(tiles, TileArray) else TileArray.from_tiles(tiles)
+    return b''.join((_header(TILES, len(tile_array)), tile_array.tms_x.astype('<u4').tobytes(),
+                     tile_array.tms_y.astype('<u4').tobytes(), tile_array.zoom.astype(np.uint8).tobytes()))
+
+
+def pack_points(points):
+    """Gets the bytes of an iterable of points, 16 bytes per point"""
+    np = require_numpy()
+    values = np.array([tuple(point) for point in points], dtype=np.float64).reshape(-1, 2)
+    return pack_latitude_longitude(latitudes=values[:, 0], longitudes=values[:, 1])
+
+
+def pack_latitude_longitude(latitudes, longitudes):
+    """Gets the bytes of lat/lon arrays in WGS84 in the format of pack_points"""
+    np = require_numpy()
+    latitudes, longitudes = np.asarray(latitudes, dtype='<f8'), np.asarray(longitudes, dtype='<f8')
+    check(latitudes.ndim == 1 and latitudes.shape == longitudes.shape,
+          'Latitudes and longitudes need to be one dimensional arrays of the same length.')
+    return b''.join((_header(POINTS, len(latitudes)), latitudes.tobytes(), longitudes.tobytes()))
+
+
+def _positions(quad_key_int):
+    """Gets the zoom above the lowest 2 * QUAD_KEY_MAX_ZOOM bits and the Morton code at the zoom below, as TileRanges"""
+    np = require_numpy()
+    zoom = quad_key_int & np.uint64(_QUAD_KEY_ZOOM_MASK)
+    check(bool(np.all(zoom <= QUAD_KEY_MAX_ZOOM)), 'Integer quad keys need zooms up to {}.'.format(QUAD_KEY_MAX_ZOOM))
+    shift = np.uint64(2 * QUAD_KEY_MAX_ZOOM + QUAD_KEY_ZOOM_BITS) - np.uint64(2) * zoom
+    return (zoom << np.uint64(_ZOOM_SHIFT)) | (quad_key_int >> shift)
+
+
+def _quad_key_int(positions):
+    np = require_numpy()
+    zoom = positions >> np.uint64(_ZOOM_SHIFT)
+    shift = np.uint64(2 * QUAD_KEY_MAX_ZOOM + QUAD_KEY_ZOOM_BITS) - np.uint64(2) * zoom
+    return ((positions & np.uint64(_MORTON_MASK)) << shift) | zoom
+
+
+def pack_quad_key_int(quad_key_int):
+    """Gets the bytes of an array of integer quad keys as varints of the differences between consecutive keys
+
+    The keys are stored sorted by zoom and, within a zoom, ascending like TileSet.quad_key_int. Neighbouring tiles of
+    a zoom then differ by a small Morton code, so dense sets of tiles take little more than one byte per tile.
+    """
+    np = require_numpy()
+    quad_key_int = np.asarray(quad_key_int, dtype=np.uint64)
+    check(quad_key_int.ndim == 1, 'Integer quad keys need to be a one dimensional array.')
+    deltas = np.diff(np.sort(_positions(quad_key_int)), prepend=np.uint64(0))
+    lengths = np.ones(len(deltas), dtype=np.int64)
+    remaining = deltas >> np.uint64(7)
+    while remaining.any():
+        lengths += remaining > 0
+        remaining >>= np.uint64(7)
+    groups = np.repeat(np.arange(len(deltas)), lengths)
+    positions = np.arange(len(groups)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    data = ((deltas[groups] >> (np.uint64(7) * positions.astype(np.uint64))) & np.uint64(0x7F)).astype(np.uint8)
+    data[positions < lengths[groups] - 1] |= 0x80
+    return _header(QUAD_KEY_INT, len(deltas)) + data.tobytes()
+
+
+def unpack(buffer):
+    """Gets the contents of bytes, a memoryview or a memory map in any of the formats
+
+    Tiles are returned as TileArray and points as lat/lon arrays, both viewing the buffer without copying, integer
+    quad keys as uint64 array sorted by zoom first.
+    """
+    np = require_numpy()
+    check(len(buffer) >= _HEADER.size, 'Buffer needs to start with a header of pygeotile.binary.')
+    magic, version, kind, count = _HEADER.unpack_from(buffer)
+    check(magic == _MAGIC and version == _VERSION and kind in _KINDS,
+          'Buffer needs to start with a header of pygeotile.binary.')
+    offset = _HEADER.size
+    if kind == TILES:
+        check(len(buffer) == offset + 9 * count, 'Buffer needs to hold {} tiles.'.format(count))
+        return TileArray(tms_x=np.frombuffer(buffer, dtype='<u4', count=count, offset=offset),
+                         tms_y=np.frombuffer(buffer, dtype='<u4', count=count, offset=offset + 4 * count),
+                         zoom=np.frombuffer(buffer, dtype=np.uint8, count=count, offset=offset + 8 * count))
+    if kind == POINTS:
+        check(len(buffer) == offset + 16 * count, 'Buffer needs to hold {} points.'.format(count))
+        return (np.frombuffer(buffer, dtype='<f8', count=count, offset=offset),
+                np.frombuffer(buffer, dtype='<f8', count=count, offset=offset + 8 * count))
+    data = np.frombuffer(buffer, dtype=np.uint8, offset=offset)
+    ends = np.flatnonzero(data < 0x80)
+    check(len(ends) == count and (not count or ends[-1] == len(data) - 1),
+          'Buffer needs to hold {} integer quad keys.'.format(count))
+    if not count:
+        return np.empty(0, dtype=np.uint64)
+    starts = np.concatenate(([0], ends[:-1] + 1)).astype(np.int64)
+    positions = np.arange(len(data)) - np.repeat(starts, ends - starts + 1)
+    values = (data & 0x7F).astype(np.uint64) << (np.uint64(7) * positions.astype(np.uint64))
+    deltas = np.bitwise_or.reduceat(values, starts)
+    return _quad_key_int(np.cumsum(deltas, dtype=np.uint64))
+
+
+def load(path):
+    """Gets the contents of a file in any of the formats like unpack, memory mapping the file read only"""
+    with open(path, 'rb') as binary_file:
+        return unpack(mmap.mmap(binary_file.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+__all__ = ['pack_tiles', 'pack_points', 'pack_latitude_longitude', 'pack_quad_key_int', 'unpack', 'load', 'TILES',
+           'POINTS', 'QUAD_KEY_INT']
@@ -0,0 +1,134 @@
+"""Chunked bulk conversions of large arrays across a process pool (requires numpy and Python 3.8+)
+
+Inputs and outputs live in shared memory blocks, the workers only receive the block names and the bounds of their
+chunk and write their results in place, so no arrays or tiles are pickled and the output order is deterministic.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from .tile import Tile
+from .tile_array import TileArray
+from .meta import DEFAULT_TILE_GRID
+from .compat import require_numpy
+from .validation import is_enabled, check, check_array, _latitude_longitude_masks, _tiles_masks
+
+DEFAULT_CHUNK_SIZE = 2 ** 20
+
+
+def _tiles_for_latitude_longitude_kernel(latitudes, longitudes, zoom, grid):
+    tms_x, tms_y, _ = Tile.for_latitude_longitude_array(latitudes=latitudes, longitudes=longitudes, zoom=zoom,
+                                                        grid=grid, validate=False)
+    return tms_x, tms_y
+
+
+def _bounds_for_tiles_kernel(tms_x, tms_y, zoom):
+    (latitude_min, longitude_min), (latitude_max, longitude_max) = TileArray(tms_x=tms_x, tms_y=tms_y, zoom=zoom).bounds
+    return latitude_min, longitude_min, latitude_max, longitude_max
+
+
+def _attach(blocks, specs, start, stop):
+    np = require_numpy()
+    arrays = []
+    for name, dtype, length in specs:
+        block = shared_memory.SharedMemory(name=name)
+        blocks.append(block)
+        arrays.append(np.ndarray((length,), dtype=dtype, buffer=block.buf)[start:stop])
+    return arrays
+
+
+def _run_chunk(kernel, parameters, input_specs, output_specs, start, stop):
+    """Runs the kernel on one chunk of the shared inputs and writes the results into the shared outputs"""
+    blocks = []
+    try:
+        inputs = _attach(blocks, input_specs, start, stop)
+        outputs = _attach(blocks, output_specs, start, stop)
+        for output, result in zip(outputs, kernel(*inputs, **parameters)):
+            output[:] = result
+        del inputs, outputs
+    finally:
+        for block in blocks:
+            block.close()
+
+
+def _shared_array(blocks, array):
+    np = require_numpy()
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    blocks.append(block)
+    shared = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+    shared[:] = array
+    return shared, (block.name, array.dtype.str, len(array))
+
+
+def map_chunks(kernel, inputs, output_dtypes, parameters=None, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Applies kernel(*input_chunks, **parameters) -> output_chunks to equally long one dimensional arrays
+
+    The chunks are processed by a pool of workers processes (default: number of CPUs) through shared memory.
+    With a single worker or a single chunk the kernel runs in this process. kernel needs to be a module level
+    function so the workers can import it.
+    """
+    np = require_numpy()
+    parameters = parameters or {}
+    inputs = [np.ascontiguousarray(array) for array in inputs]
+    length = len(inputs[0])
+    check(all(array.ndim == 1 and len(array) == length for array in inputs),
+          'Inputs need to be one dimensional arrays of the same length.')
+    check(chunk_size > 0, 'Chunk size needs to be greater than 0.')
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or length <= chunk_size:
+        return tuple(np.asarray(result, dtype=dtype)
+                     for result, dtype in zip(kernel(*inputs, **parameters), output_dtypes))
+
+    blocks = []
+    try:
+        input_specs = [_shared_array(blocks, array)[1] for array in inputs]
+        shared_outputs = [_shared_array(blocks, np.empty(length, dtype=dtype)) for dtype in output_dtypes]
+        output_specs = [spec for _, spec in shared_outputs]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_run_chunk, kernel, parameters, input_specs, output_specs, start,
+                                       min(start + chunk_size, length))
+                       for start in range(0, length, chunk_size)]
+            for future in futures:
+                future.result()
+        return tuple(shared.copy() for shared, _ in shared_outputs)
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def tiles_for_latitude_longitude(latitudes, longitudes, zoom, workers=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                                 grid=DEFAULT_TILE_GRID, validate=None):
+    """Creates TMS X, TMS Y and zoom arrays from lat/lon arrays in WGS84 like Tile.for_latitude_longitude_array
+
+    The input is validated once as a whole, a ValidationError reports the indices within the full arrays.
+    """
+    np = require_numpy()
+    latitudes = np.asarray(latitudes, dtype=np.float64)
+    longitudes = np.asarray(longitudes, dtype=np.float64)
+    if is_enabled(validate):
+        valid_latitudes, valid_longitudes = _latitude_longitude_masks(latitudes, longitudes)
+        check_array(valid_longitudes, 'Longitude needs to be a value between -180.0 and 180.0.')
+        check_array(valid_latitudes, 'Latitude needs to be a value between -90.0 and 90.0.')
+    tms_x, tms_y = map_chunks(_tiles_for_latitude_longitude_kernel, inputs=(latitudes, longitudes),
+                              output_dtypes=(np.int64, np.int64), parameters={'zoom': zoom, 'grid': grid},
+                              workers=workers, chunk_size=chunk_size)
+    return tms_x, tms_y, np.full(tms_x.shape, zoom, dtype=np.uint8)
+
+
+def bounds_for_tiles(tms_x, tms_y, zoom, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, validate=None):
+    """Gets the bounds of tiles as lat/lon arrays of the most west and south and the most east and north"""
+    np = require_numpy()
+    tms_x, tms_y = np.asarray(tms_x), np.asarray(tms_y)
+    zoom = np.broadcast_to(np.asarray(zoom, dtype=np.uint8), tms_x.shape)
+    if is_enabled(validate):
+        valid_x, valid_y = _tiles_masks(tms_x, tms_y, zoom)
+        check_array(valid_x, 'TMS X needs to be a value between 0 and (2^zoom) -1.')
+        check_array(valid_y, 'TMS Y needs to be a value between 0 and (2^zoom) -1.')
+    latitude_min, longitude_min, latitude_max, longitude_max = map_chunks(
+        _bounds_for_tiles_kernel, inputs=(tms_x.astype(np.uint32), tms_y.astype(np.uint32), zoom),
+        output_dtypes=(np.float64,) * 4, workers=workers, chunk_size=chunk_size)
+    return (latitude_min, longitude_min), (latitude_max, longitude_max)
+
+
+__all__ = ['map_chunks', 'tiles_for_latitude_longitude', 'bounds_for_tiles']
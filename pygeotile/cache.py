@@ -0,0 +1,53 @@
+from .tile import Tile
+from .meta import DEFAULT_TILE_GRID
+from .compat import lru_cache
+
+
+class TileCache(object):
+    """Opt-in bounded LRU caches of Tile.for_latitude_longitude and Tile.bounds, safe to share between threads
+
+    Lat/lon are quantized to precision decimal places before the lookup and the tile is computed from the
+    quantized lat/lon, so repeated fixes of the same spot skip the projection. The default of 7 decimal places
+    quantizes to about 1 cm. Each cache holds at most max_size entries, the least recently used is dropped first.
+    """
+
+    def __init__(self, max_size=2 ** 16, precision=7, grid=DEFAULT_TILE_GRID):
+        self.max_size = max_size
+        self.precision = precision
+        self.grid = grid
+        self._scale = 10.0 ** precision
+        self._tile_for_quantized = lru_cache(maxsize=max_size)(self._compute_tile_for_quantized)
+        self._bounds_for_tile = lru_cache(maxsize=max_size)(self._compute_bounds_for_tile)
+
+    def _compute_tile_for_quantized(self, latitude, longitude, zoom):
+        return Tile.for_latitude_longitude(latitude=latitude / self._scale, longitude=longitude / self._scale,
+                                           zoom=zoom, grid=self.grid)
+
+    @staticmethod
+    def _compute_bounds_for_tile(tile):
+        return tile.bounds
+
+    def for_latitude_longitude(self, latitude, longitude, zoom):
+        """Gets the tile of lat/lon in WGS84 like Tile.for_latitude_longitude, cached by the quantized lat/lon"""
+        scale = self._scale
+        return self._tile_for_quantized(int(round(latitude * scale)), int(round(longitude * scale)), zoom)
+
+    def bounds(self, tile):
+        """Gets the bounds of a tile like Tile.bounds, cached by the tile"""
+        return self._bounds_for_tile(tile)
+
+    def cache_info(self):
+        """Gets hits, misses, max size and current size of both caches keyed by the name of the cached method"""
+        return {'for_latitude_longitude': self._tile_for_quantized.cache_info(),
+                'bounds': self._bounds_for_tile.cache_info()}
+
+    def clear(self):
+        """Empties both caches and resets their counters"""
+        self._tile_for_quantized.cache_clear()
+        self._bounds_for_tile.cache_clear()
+
+    def __repr__(self):
+        return 'TileCache(max_size={}, precision={})'.format(self.max_size, self.precision)
+
+
+__all__ = ['TileCache']
@@ -0,0 +1,166 @@
+"""Command line tool streaming coordinates from CSV or NDJSON to tiles (requires numpy)
+
+Records with a latitude beyond 85.0511 or a longitude of -180.0 get the tiles at the edge of the map, records out of
+the range of WGS84 are invalid.
+
+Examples:
+    pygeotile --zooms 12,14 points.csv
+    cat fixes.ndjson | pygeotile --input-format ndjson --tile-format quad_tree --zooms 18 --count
+"""
+import argparse
+import io
+import json
+import sys
+from collections import Counter
+from itertools import islice
+
+from .tile import Tile, QUAD_KEY_MAX_ZOOM, _MORTON_MAX_ZOOM
+from .tile_array import TileArray
+from .point import meters_to_latitude_longitude, pixels_to_latitude_longitude
+from .compat import require_numpy
+from .validation import _latitude_longitude_masks
+
+COORDINATES = ('latlon', 'lonlat', 'meters', 'pixels')
+TILE_FORMATS = ('tms', 'google', 'quad_tree', 'quad_key_int')
+DEFAULT_FIELDS = {'csv': '0,1', 'ndjson': None}
+DEFAULT_NDJSON_FIELDS = {'latlon': 'latitude,longitude', 'lonlat': 'longitude,latitude', 'meters': 'x,y',
+                         'pixels': 'x,y'}
+
+
+def _batches(files, batch_size, skip_header):
+    """Yields lists of at most batch_size non empty lines, reading the files one after another"""
+    for path in files:
+        stream = sys.stdin if path == '-' else io.open(path, encoding='utf-8')
+        try:
+            lines = (line for line in stream if line.strip())
+            if skip_header:
+                next(lines, None)
+            while True:
+                batch = list(islice(lines, batch_size))
+                if not batch:
+                    break
+                yield batch
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+
+def _parse(lines, input_format, fields, delimiter):
+    """Gets the two coordinate columns of the lines as float lists, unparseable records are NaN"""
+    first, second = [], []
+    for line in lines:
+        try:
+            if input_format == 'csv':
+                values = line.rstrip('\r\n').split(delimiter)
+                value_a, value_b = float(values[fields[0]]), float(values[fields[1]])
+            else:
+                record = json.loads(line)
+                value_a, value_b = float(record[fields[0]]), float(record[fields[1]])
+        except (ValueError, IndexError, KeyError, TypeError):
+            value_a = value_b = float('nan')
+        first.append(value_a)
+        second.append(value_b)
+    return first, second
+
+
+def _latitude_longitude(first, second, coordinates, pixel_zoom):
+    """Gets lat/lon arrays in WGS84 of two coordinate columns"""
+    np = require_numpy()
+    first, second = np.asarray(first, dtype=np.float64), np.asarray(second, dtype=np.float64)
+    if coordinates == 'latlon':
+        return first, second
+    if coordinates == 'lonlat':
+        return second, first
+    if coordinates == 'meters':
+        return meters_to_latitude_longitude(first, second, out=(second, first), validate=False)
+    return pixels_to_latitude_longitude(first, second, zoom=pixel_zoom, out=(second, first), validate=False)
+
+
+def _format_tiles(tile_array, tile_format):
+    """Gets the tiles as list of strings, zoom/x/y for tms and google"""
+    if tile_format == 'quad_tree':
+        return tile_array.quad_tree.tolist()
+    if tile_format == 'quad_key_int':
+        return [str(value) for value in tile_array.quad_key_int.tolist()]
+    tms_x, tms_y = tile_array.google if tile_format == 'google' else tile_array.tms
+    return ['{}/{}/{}'.format(zoom, x, y) for x, y, zoom in
+            zip(tms_x.tolist(), tms_y.tolist(), tile_array.zoom.tolist())]
+
+
+def _parse_arguments(arguments):
+    parser = argparse.ArgumentParser(prog='pygeotile', description='Streams coordinates to tiles, one output line per '
+                                     'record with a column per zoom, or counts per tile with --count.')
+    parser.add_argument('files', nargs='*', default=['-'], help='CSV or NDJSON files, - or nothing for stdin')
+    parser.add_argument('--input-format', choices=('csv', 'ndjson'), default='csv')
+    parser.add_argument('--coordinates', choices=COORDINATES, default='latlon',
+                        help='meaning of the two fields, meters are Spherical Mercator EPSG:900913')
+    parser.add_argument('--fields', help='the two CSV column indices or NDJSON keys, e.g. 0,1 or lat,lon')
+    parser.add_argument('--delimiter', default=',', help='CSV delimiter of input and output')
+    parser.add_argument('--header', action='store_true', help='skip the first line of every CSV file')
+    parser.add_argument('--pixel-zoom', type=int, help='zoom of the pixel coordinates')
+    parser.add_argument('--zooms', default='18', help='comma separated zooms, default 18')
+    parser.add_argument('--tile-format', choices=TILE_FORMATS, default='tms')
+    parser.add_argument('--count', action='store_true', help='output the number of records per tile instead')
+    parser.add_argument('--skip-invalid', action='store_true', help='drop invalid records instead of failing')
+    parser.add_argument('--batch-size', type=int, default=2 ** 16, help='records read and converted at once')
+    parsed = parser.parse_args(arguments)
+    try:
+        parsed.zooms = [int(zoom) for zoom in parsed.zooms.split(',')]
+    except ValueError:
+        parser.error('--zooms needs comma separated integers')
+    if parsed.batch_size <= 0:
+        parser.error('--batch-size needs to be greater than 0')
+    fields = (parsed.fields or DEFAULT_FIELDS[parsed.input_format] or
+              DEFAULT_NDJSON_FIELDS[parsed.coordinates]).split(',')
+    if len(fields) != 2:
+        parser.error('--fields needs exactly two comma separated values')
+    parsed.fields = [int(field) for field in fields] if parsed.input_format == 'csv' else fields
+    if parsed.coordinates == 'pixels' and parsed.pixel_zoom is None:
+        parser.error('--pixel-zoom is required for pixel coordinates')
+    if not all(0 <= zoom <= _MORTON_MAX_ZOOM for zoom in parsed.zooms):
+        parser.error('--zooms need to be values between 0 and {}'.format(_MORTON_MAX_ZOOM))
+    if (parsed.count or parsed.tile_format == 'quad_key_int') and max(parsed.zooms) > QUAD_KEY_MAX_ZOOM:
+        parser.error('--count and --tile-format quad_key_int support zooms up to {}'.format(QUAD_KEY_MAX_ZOOM))
+    return parsed
+
+
+def main(arguments=None, output=None):
+    np = require_numpy()
+    arguments = _parse_arguments(arguments)
+    output = output or sys.stdout
+    counts = Counter()
+    record_offset = 0
+    for lines in _batches(arguments.files, arguments.batch_size, skip_header=arguments.header):
+        first, second = _parse(lines, arguments.input_format, arguments.fields, arguments.delimiter)
+        latitudes, longitudes = _latitude_longitude(first, second, arguments.coordinates, arguments.pixel_zoom)
+        valid_latitudes, valid_longitudes = _latitude_longitude_masks(latitudes, longitudes)
+        valid = valid_latitudes & valid_longitudes
+        if not np.all(valid):
+            if not arguments.skip_invalid:
+                record = record_offset + int(np.flatnonzero(~valid)[0]) + 1
+                sys.stderr.write('pygeotile: invalid record {}, use --skip-invalid to drop it\n'.format(record))
+                return 1
+            latitudes, longitudes = latitudes[valid], longitudes[valid]
+        record_offset += len(lines)
+        columns = []
+        for zoom in arguments.zooms:
+            tms_x, tms_y, zooms = Tile.for_latitude_longitude_array(latitudes=latitudes, longitudes=longitudes,
+                                                                    zoom=zoom, validate=False)
+            tile_array = TileArray(tms_x=tms_x, tms_y=tms_y, zoom=zooms)
+            if arguments.count:
+                keys, key_counts = np.unique(tile_array.quad_key_int, return_counts=True)
+                counts.update(dict(zip(keys.tolist(), key_counts.tolist())))
+            else:
+                columns.append(_format_tiles(tile_array, arguments.tile_format))
+        if columns:
+            output.write(''.join(arguments.delimiter.join(row) + '\n' for row in zip(*columns)))
+    if arguments.count:
+        keys = sorted(counts)
+        tiles = TileArray.from_quad_key_int(np.array(keys, dtype=np.uint64))
+        output.write(''.join('{}{}{}\n'.format(tile, arguments.delimiter, counts[key]) for tile, key in
+                             zip(_format_tiles(tiles, arguments.tile_format), keys)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
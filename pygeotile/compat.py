@@ -0,0 +1,58 @@
+import threading
+from collections import OrderedDict, namedtuple
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+_CacheInfo = namedtuple('CacheInfo', 'hits misses maxsize currsize')
+
+
+def require_numpy():
+    """Gets the numpy module, raises an ImportError if the optional dependency is not installed"""
+    if numpy is None:
+        raise ImportError('numpy is required for array operations, install it with "pip install pyGeoTile[numpy]".')
+    return numpy
+
+
+def _lru_cache(maxsize=128):
+    """Minimal thread safe functools.lru_cache for Python 2, caching by positional arguments only"""
+    def decorator(function):
+        cache = OrderedDict()
+        lock = threading.Lock()
+        counters = [0, 0]
+
+        def wrapper(*args):
+            with lock:
+                if args in cache:
+                    value = cache.pop(args)
+                    cache[args] = value
+                    counters[0] += 1
+                    return value
+                counters[1] += 1
+            value = function(*args)
+            with lock:
+                cache[args] = value
+                if maxsize is not None and len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return value
+
+        def cache_info():
+            with lock:
+                return _CacheInfo(hits=counters[0], misses=counters[1], maxsize=maxsize, currsize=len(cache))
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+                counters[:] = [0, 0]
+
+        wrapper.cache_info, wrapper.cache_clear = cache_info, cache_clear
+        return wrapper
+    return decorator
+
+
+try:
+    from functools import lru_cache
+except ImportError:  # pragma: no cover
+    lru_cache = _lru_cache
@@ -0,0 +1,113 @@
+from .tile import Tile
+from .validation import check
+
+_AREA_TOLERANCE = 1e-9
+_ROUNDING_TOLERANCE = 1e-12
+
+
+def _polygons(geometry):
+    """Gets the polygons of a GeoJSON like Polygon, MultiPolygon or Feature as lists of rings of (lon, lat)"""
+    geometry = getattr(geometry, '__geo_interface__', geometry)
+    if geometry.get('type') == 'Feature':
+        return _polygons(geometry['geometry'])
+    check(geometry.get('type') in ('Polygon', 'MultiPolygon'), 'Geometry needs to be a Polygon or MultiPolygon.')
+    polygons = [geometry['coordinates']] if geometry['type'] == 'Polygon' else geometry['coordinates']
+    return [[[(float(position[0]), float(position[1])) for position in ring] for ring in polygon]
+            for polygon in polygons]
+
+
+def _signed_area(ring, origin_x=0.0, origin_y=0.0):
+    """Gets the signed area of a ring, positive if it is counterclockwise
+
+    The coordinates are taken relative to the origin, close to the ring the products of coordinates cancel out less.
+    """
+    area = 0.0
+    for index in range(len(ring)):
+        (x_1, y_1), (x_2, y_2) = ring[index - 1], ring[index]
+        area += (x_1 - origin_x) * (y_2 - origin_y) - (x_2 - origin_x) * (y_1 - origin_y)
+    return area / 2.0
+
+
+def _oriented_rings(geometry):
+    """Gets all rings with exteriors counterclockwise and holes clockwise, so signed areas sum up"""
+    rings = []
+    for polygon in _polygons(geometry):
+        for index, ring in enumerate(polygon):
+            if len(ring) > 1 and ring[0] == ring[-1]:
+                ring = ring[:-1]
+            if (_signed_area(ring) > 0) != (index == 0):
+                ring = ring[::-1]
+            rings.append(ring)
+    return rings
+
+
+def _clip_ring(ring, west, south, east, north):
+    """Clips a ring to a rectangle with the Sutherland-Hodgman algorithm, the area of the result is exact"""
+    edges = ((0, west, 1), (0, east, -1), (1, south, 1), (1, north, -1))
+    for axis, limit, direction in edges:
+        if not ring:
+            break
+        clipped = []
+        previous = ring[-1]
+        previous_inside = (previous[axis] - limit) * direction >= 0
+        for current in ring:
+            current_inside = (current[axis] - limit) * direction >= 0
+            if current_inside != previous_inside:
+                ratio = (limit - previous[axis]) / (current[axis] - previous[axis])
+                intersection = [previous[0] + ratio * (current[0] - previous[0]),
+                                previous[1] + ratio * (current[1] - previous[1])]
+                intersection[axis] = limit
+                clipped.append(tuple(intersection))
+            if current_inside:
+                clipped.append(current)
+            previous, previous_inside = current, current_inside
+        ring = clipped
+    return ring
+
+
+def _tiles_at_zoom(tile, zoom):
+    """Yields the tiles within the tile at the given zoom"""
+    if zoom == tile.zoom:
+        yield tile
+        return
+    shift = zoom - tile.zoom
+    min_x, min_y = tile.tms_x << shift, tile.tms_y << shift
+    for tms_y in range(min_y + (1 << shift) - 1, min_y - 1, -1):
+        for tms_x in range(min_x, min_x + (1 << shift)):
+            yield Tile(tms_x=tms_x, tms_y=tms_y, zoom=zoom)
+
+
+def tiles_for_polygon(geometry, min_zoom, max_zoom, compact=False):
+    """Yields the tiles covering a GeoJSON like Polygon, MultiPolygon or Feature with (lon, lat) coordinates in WGS84
+
+    The pyramid is descended from zoom 0 and only tiles partially intersecting the geometry are refined, the
+    geometry being clipped to each tile so deeper levels test fewer edges. Without compact all tiles are of max_zoom,
+    with compact tiles lying completely within the geometry are yielded at the lowest zoom not below min_zoom.
+    Tiles only touching the geometry are not included. A tile counts as outside if the geometry clipped to it is
+    empty or degenerate and as completely within if the area missing is at most a billionth of a tile of max_zoom.
+    """
+    check(0 <= min_zoom <= max_zoom, 'Min zoom and max zoom need to be ordered values greater or equal 0.')
+    stack = [(Tile(tms_x=0, tms_y=0, zoom=0), _oriented_rings(geometry))]
+    while stack:
+        tile, rings = stack.pop()
+        point_min, point_max = tile.bounds
+        south, west = point_min.latitude_longitude
+        north, east = point_max.latitude_longitude
+        rings = [clipped for clipped in (_clip_ring(ring, west, south, east, north) for ring in rings) if clipped]
+        if not rings:
+            continue
+        area = sum(_signed_area(ring, origin_x=west, origin_y=south) for ring in rings)
+        tile_area = (east - west) * (north - south)
+        tolerance = tile_area * max(4.0 ** (tile.zoom - max_zoom) * _AREA_TOLERANCE, _ROUNDING_TOLERANCE)
+        if area <= tolerance:
+            continue
+        if area >= tile_area - tolerance:
+            for inner_tile in _tiles_at_zoom(tile, zoom=max(tile.zoom, min_zoom) if compact else max_zoom):
+                yield inner_tile
+        elif tile.zoom == max_zoom:
+            yield tile
+        else:
+            stack.extend((child, rings) for child in reversed(tile.children()))
+
+
+__all__ = ['tiles_for_polygon']
@@ -0,0 +1,167 @@
+"""Bulk access to tile stores in the MBTiles format, SQLite databases of tiles by zoom, TMS X and TMS Y
+
+The columns tile_column and tile_row of MBTiles hold Tile.tms. Lookups of many tiles at once go through a temporary
+table joined against the tile index instead of one query per tile.
+"""
+import sqlite3
+
+from .tile import Tile
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS metadata (name TEXT, value TEXT);
+CREATE UNIQUE INDEX IF NOT EXISTS metadata_index ON metadata (name);
+CREATE TABLE IF NOT EXISTS tiles (zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER, tile_data BLOB);
+CREATE UNIQUE INDEX IF NOT EXISTS tile_index ON tiles (zoom_level, tile_column, tile_row);
+'''
+_LOOKUP_SCHEMA = '''
+CREATE TEMP TABLE IF NOT EXISTS pygeotile_lookup (zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER,
+                                                  PRIMARY KEY (zoom_level, tile_column, tile_row)) WITHOUT ROWID
+'''
+_ORDER = ' ORDER BY zoom_level, tile_column, tile_row'
+
+
+def _rows(tiles):
+    for tms_x, tms_y, zoom in tiles:
+        yield zoom, tms_x, tms_y
+
+
+class MBTiles(object):
+    """Tile store in an MBTiles file at path, created with the tables and the tile index if it has no tiles table
+
+    Writes run in one transaction per call. Use it as context manager to close the database afterwards.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        if not self.connection.execute("SELECT 1 FROM sqlite_master WHERE name = 'tiles'").fetchone():
+            self.connection.executescript(_SCHEMA)
+
+    def close(self):
+        """Closes the database"""
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def metadata(self):
+        """Gets the metadata as dictionary of names and values"""
+        return dict(self.connection.execute('SELECT name, value FROM metadata'))
+
+    def set_metadata(self, values):
+        """Sets the metadata of a dictionary of names and values, keeping metadata of other names"""
+        with self.connection:
+            self.connection.executemany('DELETE FROM metadata WHERE name = ?', ((name,) for name in values))
+            self.connection.executemany('INSERT INTO metadata (name, value) VALUES (?, ?)', values.items())
+
+    def write(self, tiles_and_data):
+        """Writes an iterable of tiles and their data as bytes, replacing the data of existing tiles
+
+        The iterable is consumed lazily within a single transaction. Returns the number of tiles written.
+        """
+        with self.connection:
+            cursor = self.connection.executemany(
+                'INSERT OR REPLACE INTO tiles (zoom_level, tile_column, tile_row, tile_data) VALUES (?, ?, ?, ?)',
+                ((zoom, tms_x, tms_y, data) for (tms_x, tms_y, zoom), data in tiles_and_data))
+        return cursor.rowcount
+
+    def delete(self, tiles):
+        """Deletes an iterable of tiles within a single transaction, returns the number of tiles deleted"""
+        with self.connection:
+            cursor = self.connection.executemany(
+                'DELETE FROM tiles WHERE zoom_level = ? AND tile_column = ? AND tile_row = ?', _rows(tiles))
+        return cursor.rowcount
+
+    def get(self, tile, default=None):
+        """Gets the data of a tile, or default if the tile does not exist"""
+        tms_x, tms_y, zoom = tile
+        row = self.connection.execute(
+            'SELECT tile_data FROM tiles WHERE zoom_level = ? AND tile_column = ? AND tile_row = ?',
+            (zoom, tms_x, tms_y)).fetchone()
+        return default if row is None else row[0]
+
+    def _lookup(self, tiles, columns):
+        with self.connection:
+            self.connection.execute(_LOOKUP_SCHEMA)
+            self.connection.execute('DELETE FROM temp.pygeotile_lookup')
+            self.connection.executemany(
+                'INSERT OR IGNORE INTO temp.pygeotile_lookup (zoom_level, tile_column, tile_row) VALUES (?, ?, ?)',
+                _rows(tiles))
+            return self.connection.execute(
+                'SELECT ' + columns + ' FROM temp.pygeotile_lookup JOIN tiles USING (zoom_level, tile_column, tile_row)'
+            ).fetchall()
+
+    def read(self, tiles):
+        """Gets a dictionary of the tiles of an iterable of tiles that exist and their data"""
+        return {Tile(tms_x, tms_y, zoom): data for zoom, tms_x, tms_y, data in
+                self._lookup(tiles, 'zoom_level, tile_column, tile_row, tile_data')}
+
+    def existing(self, tiles):
+        """Gets the set of the tiles of an iterable of tiles that exist, without reading their data"""
+        return {Tile(tms_x, tms_y, zoom) for zoom, tms_x, tms_y in
+                self._lookup(tiles, 'zoom_level, tile_column, tile_row')}
+
+    def tiles(self, zoom=None):
+        """Yields all tiles, or the tiles of a zoom, lazily ordered by zoom, TMS X and TMS Y"""
+        if zoom is None:
+            rows = self.connection.execute('SELECT zoom_level, tile_column, tile_row FROM tiles' + _ORDER)
+        else:
+            rows = self.connection.execute(
+                'SELECT zoom_level, tile_column, tile_row FROM tiles WHERE zoom_level = ?' + _ORDER, (zoom,))
+        for zoom, tms_x, tms_y in rows:
+            yield Tile(tms_x, tms_y, zoom)
+
+    def items(self, zoom=None):
+        """Yields all tiles, or the tiles of a zoom, and their data lazily ordered by zoom, TMS X and TMS Y"""
+        if zoom is None:
+            rows = self.connection.execute('SELECT zoom_level, tile_column, tile_row, tile_data FROM tiles' + _ORDER)
+        else:
+            rows = self.connection.execute(
+                'SELECT zoom_level, tile_column, tile_row, tile_data FROM tiles WHERE zoom_level = ?' + _ORDER, (zoom,))
+        for zoom, tms_x, tms_y, data in rows:
+            yield Tile(tms_x, tms_y, zoom), data
+
+    def _ranges_within(self, tile, max_zoom):
+        """Yields the zoom and the TMS X and TMS Y ranges of the tiles within a tile, one range per zoom"""
+        tms_x, tms_y, tile_zoom = tile
+        if max_zoom is None:
+            max_zoom = self.connection.execute('SELECT MAX(zoom_level) FROM tiles').fetchone()[0]
+        for zoom in range(tile_zoom, -1 if max_zoom is None else max_zoom + 1):
+            shift = zoom - tile_zoom
+            yield (zoom, tms_x << shift, ((tms_x + 1) << shift) - 1, tms_y << shift,
+                   ((tms_y + 1) << shift) - 1)
+
+    def within(self, tile, max_zoom=None):
+        """Yields the existing tiles within a tile, the tile itself included, down to max_zoom or the highest zoom
+
+        Every zoom takes one range query of the tile index, the tiles are ordered like tiles.
+        """
+        for parameters in self._ranges_within(tile, max_zoom):
+            for zoom, tms_x, tms_y in self.connection.execute(
+                    'SELECT zoom_level, tile_column, tile_row FROM tiles WHERE zoom_level = ? AND tile_column '
+                    'BETWEEN ? AND ? AND tile_row BETWEEN ? AND ?' + _ORDER, parameters):
+                yield Tile(tms_x, tms_y, zoom)
+
+    def count_within(self, tile, max_zoom=None):
+        """Gets the number of existing tiles within a tile, the tile itself included, down to max_zoom"""
+        return sum(self.connection.execute(
+            'SELECT COUNT(*) FROM tiles WHERE zoom_level = ? AND tile_column BETWEEN ? AND ? AND tile_row '
+            'BETWEEN ? AND ?', parameters).fetchone()[0] for parameters in self._ranges_within(tile, max_zoom))
+
+    def __contains__(self, tile):
+        tms_x, tms_y, zoom = tile
+        return self.connection.execute(
+            'SELECT 1 FROM tiles WHERE zoom_level = ? AND tile_column = ? AND tile_row = ?',
+            (zoom, tms_x, tms_y)).fetchone() is not None
+
+    def __len__(self):
+        return self.connection.execute('SELECT COUNT(*) FROM tiles').fetchone()[0]
+
+    def __repr__(self):
+        return 'MBTiles({!r})'.format(self.path)
+
+
+__all__ = ['MBTiles']
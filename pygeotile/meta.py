@@ -1,10 +1,49 @@
 import math
+from collections import namedtuple
 
 EARTH_RADIUS = 6378137.0
 TILE_SIZE = 256
 ORIGIN_SHIFT = 2.0 * math.pi * EARTH_RADIUS / 2.0
 INITIAL_RESOLUTION = 2.0 * math.pi * EARTH_RADIUS / float(TILE_SIZE)
+MAX_ZOOM = 30
 
+ZoomConstants = namedtuple('ZoomConstants', 'resolution map_size max_tile half_size')
 
-def resolution(zoom):
-    return INITIAL_RESOLUTION / (2 ** zoom)
+
+class TileGrid(object):
+    """Pyramid of square tiles of tile_size pixels, with the per zoom constants precomputed up to max_zoom"""
+
+    def __init__(self, tile_size=TILE_SIZE, max_zoom=MAX_ZOOM):
+        self.tile_size = tile_size
+        self.initial_resolution = 2.0 * math.pi * EARTH_RADIUS / float(tile_size)
+        self.constants = tuple(self._compute_zoom_constants(zoom) for zoom in range(max_zoom + 1))
+        self._constants_by_zoom = dict(enumerate(self.constants))
+        self._resolutions_by_zoom = dict((zoom, constants.resolution) for zoom, constants in enumerate(self.constants))
+
+    def _compute_zoom_constants(self, zoom):
+        map_size = self.tile_size * 2 ** zoom
+        return ZoomConstants(resolution=self.initial_resolution / (2 ** zoom), map_size=map_size,
+                             max_tile=2 ** zoom - 1, half_size=int(map_size / 2))
+
+    def zoom_constants(self, zoom):
+        """Gets resolution, map size in pixels, max tile index and half map size of a zoom"""
+        try:
+            return self._constants_by_zoom[zoom]
+        except KeyError:
+            return self._compute_zoom_constants(zoom)
+
+    def resolution(self, zoom):
+        """Gets the meters per pixel of a zoom, works as well with numpy arrays of zooms"""
+        try:
+            return self._resolutions_by_zoom[zoom]
+        except (KeyError, TypeError):
+            return self.initial_resolution / (2 ** zoom)
+
+    def __repr__(self):
+        return 'TileGrid(tile_size={}, max_zoom={})'.format(self.tile_size, len(self.constants) - 1)
+
+
+DEFAULT_TILE_GRID = TileGrid()
+ZOOM_CONSTANTS = DEFAULT_TILE_GRID.constants
+zoom_constants = DEFAULT_TILE_GRID.zoom_constants
+resolution = DEFAULT_TILE_GRID.resolution
@@ -1,41 +1,55 @@
 import math
 from collections import namedtuple
-from .meta import resolution, ORIGIN_SHIFT, TILE_SIZE
+from .meta import DEFAULT_TILE_GRID, ORIGIN_SHIFT
+from .compat import require_numpy
+from .validation import is_enabled, check, check_array, _latitude_longitude_masks, _meters_masks, _pixels_masks
 
 BasePoint = namedtuple('BasePoint', 'latitude longitude')
 
+# Fraction of the map size below which unrounded pixels stay in the last tile of the map
+_LAST_PIXEL_FRACTION = 1.0 - 2.0 ** -52
+
 
 class Point(BasePoint):
     """Immutable Point class"""
 
+    __slots__ = ()
+
     @classmethod
-    def from_latitude_longitude(cls, latitude=0.0, longitude=0.0):
-        """Creates a point from lat/lon in WGS84"""
-        assert -180.0 <= longitude <= 180.0, 'Longitude needs to be a value between -180.0 and 180.0.'
-        assert -90.0 <= latitude <= 90.0, 'Latitude needs to be a value between -90.0 and 90.0.'
+    def from_latitude_longitude(cls, latitude=0.0, longitude=0.0, validate=None):
+        """Creates a point from lat/lon in WGS84, raises a ValidationError (ValueError) for values out of range
+
+        Validation follows the policy of pygeotile.validation unless validate is given explicitly.
+        """
+        if is_enabled(validate):
+            check(-180.0 <= longitude <= 180.0, 'Longitude needs to be a value between -180.0 and 180.0.')
+            check(-90.0 <= latitude <= 90.0, 'Latitude needs to be a value between -90.0 and 90.0.')
         return cls(latitude=latitude, longitude=longitude)
 
     @classmethod
-    def from_pixel(cls, pixel_x=0, pixel_y=0, zoom=None):
-        """Creates a point from pixels X Y Z (zoom) in pyramid"""
-        max_pixel = (2 ** zoom) * TILE_SIZE
-        assert 0 <= pixel_x <= max_pixel, 'Point X needs to be a value between 0 and (2^zoom) * 256.'
-        assert 0 <= pixel_y <= max_pixel, 'Point Y needs to be a value between 0 and (2^zoom) * 256.'
-        meter_x = pixel_x * resolution(zoom) - ORIGIN_SHIFT
-        meter_y = pixel_y * resolution(zoom) - ORIGIN_SHIFT
-        meter_x, meter_y = cls._sign_meters(meters=(meter_x, meter_y), pixels=(pixel_x, pixel_y), zoom=zoom)
-        return cls.from_meters(meter_x=meter_x, meter_y=meter_y)
+    def from_pixel(cls, pixel_x=0, pixel_y=0, zoom=None, grid=DEFAULT_TILE_GRID, validate=None):
+        """Creates a point from pixels X Y Z (zoom) in pyramid of the tile grid"""
+        constants = grid.zoom_constants(zoom)
+        if is_enabled(validate):
+            check(0 <= pixel_x <= constants.map_size,
+                  'Point X needs to be a value between 0 and (2^zoom) * {}.'.format(grid.tile_size))
+            check(0 <= pixel_y <= constants.map_size,
+                  'Point Y needs to be a value between 0 and (2^zoom) * {}.'.format(grid.tile_size))
+        meter_x = pixel_x * constants.resolution - ORIGIN_SHIFT
+        meter_y = pixel_y * constants.resolution - ORIGIN_SHIFT
+        meter_x, meter_y = cls._sign_meters(meters=(meter_x, meter_y), pixels=(pixel_x, pixel_y), zoom=zoom,
+                                            grid=grid)
+        return cls.from_meters(meter_x=meter_x, meter_y=meter_y, validate=False)
 
     @classmethod
-    def from_meters(cls, meter_x=0.0, meter_y=0.0):
+    def from_meters(cls, meter_x=0.0, meter_y=0.0, validate=None):
         """Creates a point from X Y Z (zoom) meters in Spherical Mercator EPSG:900913"""
-        assert -ORIGIN_SHIFT <= meter_x <= ORIGIN_SHIFT, \
-            'Meter X needs to be a value between -{0} and {0}.'.format(ORIGIN_SHIFT)
-        assert -ORIGIN_SHIFT <= meter_y <= ORIGIN_SHIFT, \
-            'Meter Y needs to be a value between -{0} and {0}.'.format(ORIGIN_SHIFT)
-        longitude = (meter_x / ORIGIN_SHIFT) * 180.0
-        latitude = (meter_y / ORIGIN_SHIFT) * 180.0
-        latitude = 180.0 / math.pi * (2 * math.atan(math.exp(latitude * math.pi / 180.0)) - math.pi / 2.0)
+        if is_enabled(validate):
+            check(-ORIGIN_SHIFT <= meter_x <= ORIGIN_SHIFT,
+                  'Meter X needs to be a value between -{0} and {0}.'.format(ORIGIN_SHIFT))
+            check(-ORIGIN_SHIFT <= meter_y <= ORIGIN_SHIFT,
+                  'Meter Y needs to be a value between -{0} and {0}.'.format(ORIGIN_SHIFT))
+        latitude, longitude = _meters_to_latitude_longitude(meter_x=meter_x, meter_y=meter_y)
         return cls(latitude=latitude, longitude=longitude)
 
     @property
@@ -43,13 +57,35 @@ class Point(BasePoint):
         """Gets lat/lon in WGS84"""
         return self.latitude, self.longitude
 
-    def pixels(self, zoom=None):
-        """Gets pixels of the EPSG:4326 pyramid by a specific zoom, converted from lat/lon in WGS84"""
+    def pixels(self, zoom=None, grid=DEFAULT_TILE_GRID):
+        """Gets pixels of the EPSG:4326 pyramid of the tile grid by a specific zoom, converted from lat/lon in WGS84"""
         meter_x, meter_y = self.meters
-        pixel_x = (meter_x + ORIGIN_SHIFT) / resolution(zoom=zoom)
-        pixel_y = (meter_y - ORIGIN_SHIFT) / resolution(zoom=zoom)
+        zoom_resolution = grid.resolution(zoom=zoom)
+        pixel_x = (meter_x + ORIGIN_SHIFT) / zoom_resolution
+        pixel_y = (meter_y - ORIGIN_SHIFT) / zoom_resolution
         return abs(round(pixel_x)), abs(round(pixel_y))
 
+    def tile_and_offset(self, zoom, grid=DEFAULT_TILE_GRID, fractional=False):
+        """Gets the tile of the point and the pixel offset of the point from the north west corner of the tile
+
+        Projects only once. The offset is in whole pixels as of pixels, or with fractional in the unrounded pixels,
+        and the tile is the one holding that pixel, so the offsets are at least 0 and below the tile size. Points on
+        the border of two tiles belong to the tile east or south, where Tile.for_point picks the tile west or north.
+        """
+        meter_x, meter_y = self.meters
+        constants = grid.zoom_constants(zoom)
+        pixel_x = abs((meter_x + ORIGIN_SHIFT) / constants.resolution)
+        pixel_y = abs((meter_y - ORIGIN_SHIFT) / constants.resolution)
+        if fractional:
+            last_pixel = constants.map_size * _LAST_PIXEL_FRACTION
+        else:
+            pixel_x, pixel_y, last_pixel = round(pixel_x), round(pixel_y), constants.map_size - 1
+        pixel_x, pixel_y = min(pixel_x, last_pixel), min(pixel_y, last_pixel)
+        tile_size = grid.tile_size
+        google_x, google_y = int(math.floor(pixel_x / float(tile_size))), int(math.floor(pixel_y / float(tile_size)))
+        tile = _tile.Tile(google_x, constants.max_tile - google_y, zoom)
+        return tile, (pixel_x - google_x * tile_size, pixel_y - google_y * tile_size)
+
     @property
     def meters(self):
         """Gets the XY meters in Spherical Mercator EPSG:900913, converted from lat/lon in WGS84"""
@@ -60,8 +96,8 @@ class Point(BasePoint):
         return meter_x, meter_y
 
     @staticmethod
-    def _sign_meters(meters, pixels, zoom):
-        half_size = int((TILE_SIZE * 2 ** zoom) / 2)
+    def _sign_meters(meters, pixels, zoom, grid=DEFAULT_TILE_GRID):
+        half_size = grid.zoom_constants(zoom).half_size
         pixel_x, pixel_y = pixels
         meter_x, meter_y = meters
         meter_x, meter_y = abs(meter_x), abs(meter_y)
@@ -72,4 +108,179 @@ class Point(BasePoint):
         return meter_x, meter_y
 
 
-__all__ = ['Point']
+def _meters_to_latitude_longitude(meter_x, meter_y):
+    """Gets lat/lon in WGS84 from X Y meters in Spherical Mercator EPSG:900913, without validation"""
+    longitude = (meter_x / ORIGIN_SHIFT) * 180.0
+    latitude = (meter_y / ORIGIN_SHIFT) * 180.0
+    latitude = 180.0 / math.pi * (2 * math.atan(math.exp(latitude * math.pi / 180.0)) - math.pi / 2.0)
+    return latitude, longitude
+
+
+def _float_array(np, values):
+    """Gets values as float64 array, without copying numpy arrays or array.array('d') buffers"""
+    return np.asarray(values, dtype=np.float64)
+
+
+def _output_arrays(np, out, shape):
+    """Gets the two output arrays of shape, allocated or as views of the caller's buffers in out"""
+    if out is None:
+        return np.empty(shape), np.empty(shape)
+    check(len(out) == 2, 'Out needs to be a pair of buffers.')
+    outputs = []
+    for buffer in out:
+        array = buffer if isinstance(buffer, np.ndarray) else np.frombuffer(buffer, dtype=np.float64)
+        check(array.dtype == np.float64 and array.size == int(np.prod(shape)),
+              'Out needs to be buffers of float64 with the size of the input.')
+        check(array.flags.writeable, 'Out needs to be writeable buffers.')
+        if array.shape != shape:
+            array = array.reshape(shape)
+        outputs.append(array)
+    return tuple(outputs)
+
+
+def _apply(np, function, ufunc, values, exact):
+    """Applies a transcendental function in place, with the math module instead of numpy if exact"""
+    if exact:
+        values[...] = np.fromiter(map(function, values.ravel().tolist()), dtype=np.float64,
+                                  count=values.size).reshape(values.shape)
+    else:
+        ufunc(values, out=values)
+
+
+def _pixel_constants(np, zoom, grid):
+    """Gets resolution and half map size in pixels of a zoom or an array of zooms"""
+    zooms = np.asarray(zoom)
+    if zooms.ndim == 0:
+        constants = grid.zoom_constants(int(zoom))
+        return constants.resolution, constants.half_size
+    resolutions = grid.resolution(zoom=zooms.astype(np.float64))
+    half_sizes = np.left_shift(1, zooms.astype(np.int64)) * grid.tile_size // 2
+    return resolutions, half_sizes
+
+
+def latitude_longitude_to_meters(latitudes, longitudes, out=None, exact=False, validate=None):
+    """Gets X Y meter arrays in Spherical Mercator EPSG:900913 from lat/lon arrays or buffers in WGS84
+
+    Vectorized equivalent of Point.meters. The results are written to the pair of float64 buffers out if given,
+    which may only overlap the inputs pairwise, X with longitudes and Y with latitudes, for conversions in place.
+    numpy's tan and log may differ by an ulp from the math module, exact evaluates them with the math module to
+    match Point.meters bit for bit at the cost of speed.
+    """
+    np = require_numpy()
+    latitudes, longitudes = _float_array(np, latitudes), _float_array(np, longitudes)
+    if is_enabled(validate):
+        valid_latitudes, valid_longitudes = _latitude_longitude_masks(latitudes, longitudes)
+        check_array(valid_longitudes, 'Longitude needs to be a value between -180.0 and 180.0.')
+        check_array(valid_latitudes, 'Latitude needs to be a value between -90.0 and 90.0.')
+    meters_x, meters_y = _output_arrays(np, out, latitudes.shape)
+    np.multiply(longitudes, ORIGIN_SHIFT, out=meters_x)
+    np.divide(meters_x, 180.0, out=meters_x)
+    np.add(latitudes, 90.0, out=meters_y)
+    np.multiply(meters_y, math.pi, out=meters_y)
+    np.divide(meters_y, 360.0, out=meters_y)
+    _apply(np, math.tan, np.tan, meters_y, exact)
+    _apply(np, math.log, np.log, meters_y, exact)
+    np.divide(meters_y, math.pi / 180.0, out=meters_y)
+    np.multiply(meters_y, ORIGIN_SHIFT, out=meters_y)
+    np.divide(meters_y, 180.0, out=meters_y)
+    return meters_x, meters_y
+
+
+def meters_to_latitude_longitude(meters_x, meters_y, out=None, exact=False, validate=None):
+    """Gets lat/lon arrays in WGS84 from X Y meter arrays or buffers in Spherical Mercator EPSG:900913
+
+    Vectorized equivalent of Point.from_meters, out and exact work as for latitude_longitude_to_meters.
+    """
+    np = require_numpy()
+    meters_x, meters_y = _float_array(np, meters_x), _float_array(np, meters_y)
+    if is_enabled(validate):
+        valid_x, valid_y = _meters_masks(meters_x, meters_y)
+        check_array(valid_x, 'Meter X needs to be a value between -{0} and {0}.'.format(ORIGIN_SHIFT))
+        check_array(valid_y, 'Meter Y needs to be a value between -{0} and {0}.'.format(ORIGIN_SHIFT))
+    latitudes, longitudes = _output_arrays(np, out, meters_x.shape)
+    np.divide(meters_x, ORIGIN_SHIFT, out=longitudes)
+    np.multiply(longitudes, 180.0, out=longitudes)
+    np.divide(meters_y, ORIGIN_SHIFT, out=latitudes)
+    np.multiply(latitudes, 180.0, out=latitudes)
+    np.multiply(latitudes, math.pi, out=latitudes)
+    np.divide(latitudes, 180.0, out=latitudes)
+    _apply(np, math.exp, np.exp, latitudes, exact)
+    _apply(np, math.atan, np.arctan, latitudes, exact)
+    np.multiply(latitudes, 2, out=latitudes)
+    np.subtract(latitudes, math.pi / 2.0, out=latitudes)
+    np.multiply(latitudes, 180.0 / math.pi, out=latitudes)
+    return latitudes, longitudes
+
+
+def latitude_longitude_to_pixels(latitudes, longitudes, zoom, grid=DEFAULT_TILE_GRID, out=None, exact=False,
+                                 validate=None):
+    """Gets pixel X Y arrays of the pyramid of the tile grid by a zoom or an array of zooms from lat/lon arrays
+
+    Vectorized equivalent of Point.pixels, the pixels are rounded but kept as float64 so they fit into out.
+    """
+    np = require_numpy()
+    pixels_x, pixels_y = latitude_longitude_to_meters(latitudes, longitudes, out=out, exact=exact,
+                                                      validate=validate)
+    zoom_resolution = grid.resolution(zoom=zoom if np.ndim(zoom) == 0 else np.asarray(zoom, dtype=np.float64))
+    for pixels, shift in ((pixels_x, ORIGIN_SHIFT), (pixels_y, -ORIGIN_SHIFT)):
+        np.add(pixels, shift, out=pixels)
+        np.divide(pixels, zoom_resolution, out=pixels)
+        np.round(pixels, out=pixels)
+        np.abs(pixels, out=pixels)
+    return pixels_x, pixels_y
+
+
+def tiles_and_offsets(latitudes, longitudes, zoom, grid=DEFAULT_TILE_GRID, fractional=False, exact=False,
+                      validate=None):
+    """Gets arrays of TMS X, TMS Y and the pixel offsets X Y from the north west corner of the tiles from lat/lon arrays
+
+    Vectorized equivalent of Point.tile_and_offset, the offsets are int64 or with fractional float64 arrays.
+    """
+    np = require_numpy()
+    pixels_x, pixels_y = latitude_longitude_to_meters(latitudes, longitudes, exact=exact, validate=validate)
+    constants = grid.zoom_constants(zoom)
+    tile_size = grid.tile_size
+    last_pixel = constants.map_size * _LAST_PIXEL_FRACTION if fractional else constants.map_size - 1
+    offsets = []
+    for pixels, shift in ((pixels_x, ORIGIN_SHIFT), (pixels_y, -ORIGIN_SHIFT)):
+        np.add(pixels, shift, out=pixels)
+        np.divide(pixels, constants.resolution, out=pixels)
+        np.abs(pixels, out=pixels)
+        if not fractional:
+            np.round(pixels, out=pixels)
+        np.minimum(pixels, last_pixel, out=pixels)
+        google = np.floor(pixels / float(tile_size)).astype(np.int64)
+        offsets.append((google, (pixels if fractional else pixels.astype(np.int64)) - google * tile_size))
+    (google_x, offsets_x), (google_y, offsets_y) = offsets
+    return google_x, constants.max_tile - google_y, offsets_x, offsets_y
+
+
+def pixels_to_latitude_longitude(pixels_x, pixels_y, zoom, grid=DEFAULT_TILE_GRID, out=None, exact=False,
+                                 validate=None):
+    """Gets lat/lon arrays in WGS84 from pixel X Y arrays of the tile grid by a zoom or an array of zooms
+
+    Vectorized equivalent of Point.from_pixel, out and exact work as for latitude_longitude_to_meters.
+    """
+    np = require_numpy()
+    pixels_x, pixels_y = _float_array(np, pixels_x), _float_array(np, pixels_y)
+    if is_enabled(validate):
+        valid_x, valid_y = _pixels_masks(pixels_x, pixels_y, zoom, grid=grid)
+        check_array(valid_x, 'Point X needs to be a value between 0 and (2^zoom) * {}.'.format(grid.tile_size))
+        check_array(valid_y, 'Point Y needs to be a value between 0 and (2^zoom) * {}.'.format(grid.tile_size))
+    zoom_resolution, half_size = _pixel_constants(np, zoom, grid)
+    latitudes, longitudes = _output_arrays(np, out, pixels_x.shape)
+    for meters, pixels, negative in ((longitudes, pixels_x, pixels_x < half_size),
+                                     (latitudes, pixels_y, pixels_y > half_size)):
+        np.multiply(pixels, zoom_resolution, out=meters)
+        np.subtract(meters, ORIGIN_SHIFT, out=meters)
+        np.abs(meters, out=meters)
+        np.negative(meters, out=meters, where=negative)
+    return meters_to_latitude_longitude(longitudes, latitudes, out=(latitudes, longitudes), exact=exact,
+                                        validate=False)
+
+
+__all__ = ['Point', 'latitude_longitude_to_meters', 'meters_to_latitude_longitude', 'latitude_longitude_to_pixels',
+           'pixels_to_latitude_longitude', 'tiles_and_offsets']
+
+# Imported last, the module tile itself imports Point from this module
+from . import tile as _tile  # noqa: E402
@@ -1,70 +1,182 @@
 import math
 import re
-from functools import reduce
 from collections import namedtuple
 
-from .point import Point
-from .meta import TILE_SIZE
+from .point import Point, latitude_longitude_to_pixels, _meters_to_latitude_longitude
+from .meta import DEFAULT_TILE_GRID, TILE_SIZE, ORIGIN_SHIFT, resolution, zoom_constants
+from .compat import require_numpy
+from .validation import is_enabled, check
 
 BaseTile = namedtuple('BaseTile', 'tms_x tms_y zoom')
 
+QUAD_KEY_MAX_ZOOM = 29
+QUAD_KEY_ZOOM_BITS = 5
+_QUAD_KEY_ZOOM_MASK = (1 << QUAD_KEY_ZOOM_BITS) - 1
+# Highest zoom whose X Y fit the 32 bits handled by _spread_bits and _compact_bits
+_MORTON_MAX_ZOOM = 32
+_HEX_TO_QUAD_TREE = dict(('{:x}'.format(value), '{}{}'.format(value >> 2, value & 3)) for value in range(16))
+
+
+def _spread_bits(value):
+    """Spreads the lower 32 bits of value to the even bit positions (works on ints and numpy uint64 arrays)"""
+    value = value & 0x00000000FFFFFFFF
+    value = (value | (value << 16)) & 0x0000FFFF0000FFFF
+    value = (value | (value << 8)) & 0x00FF00FF00FF00FF
+    value = (value | (value << 4)) & 0x0F0F0F0F0F0F0F0F
+    value = (value | (value << 2)) & 0x3333333333333333
+    return (value | (value << 1)) & 0x5555555555555555
+
+
+def _compact_bits(value):
+    """Compacts the even bit positions of value to the lower 32 bits, inverse of _spread_bits"""
+    value = value & 0x5555555555555555
+    value = (value | (value >> 1)) & 0x3333333333333333
+    value = (value | (value >> 2)) & 0x0F0F0F0F0F0F0F0F
+    value = (value | (value >> 4)) & 0x00FF00FF00FF00FF
+    value = (value | (value >> 8)) & 0x0000FFFF0000FFFF
+    return (value | (value >> 16)) & 0x00000000FFFFFFFF
+
+
+def _interleave(google_x, google_y):
+    """Gets the Morton code of Google X Y, its base 4 digits are the digits of the QuadTree"""
+    return _spread_bits(google_x) | (_spread_bits(google_y) << 1)
+
+
+def _deinterleave(morton):
+    """Gets Google X Y from a Morton code, inverse of _interleave"""
+    return _compact_bits(morton), _compact_bits(morton >> 1)
+
 
 class Tile(BaseTile):
     """Immutable Tile class"""
 
+    __slots__ = ()
+
     @classmethod
-    def from_quad_tree(cls, quad_tree):
+    def from_quad_tree(cls, quad_tree, validate=None):
         """Creates a tile from a Microsoft QuadTree"""
-        assert bool(re.match('^[0-3]*$', quad_tree)), 'QuadTree value can only consists of the digits 0, 1, 2 and 3.'
+        if is_enabled(validate):
+            check(bool(re.match('^[0-3]*$', quad_tree)),
+                  'QuadTree value can only consists of the digits 0, 1, 2 and 3.')
         zoom = len(str(quad_tree))
-        offset = int(math.pow(2, zoom)) - 1
-        google_x, google_y = [reduce(lambda result, bit: (result << 1) | bit, bits, 0)
-                              for bits in zip(*(reversed(divmod(digit, 2))
-                                                for digit in (int(c) for c in str(quad_tree))))]
-        return cls(tms_x=google_x, tms_y=(offset - google_y), zoom=zoom)
+        if zoom > _MORTON_MAX_ZOOM:
+            google_x = google_y = 0
+            for digit in map(int, quad_tree):
+                google_x, google_y = (google_x << 1) | (digit & 1), (google_y << 1) | (digit >> 1)
+        else:
+            google_x, google_y = _deinterleave(int(quad_tree, 4) if zoom else 0)
+        return cls(tms_x=google_x, tms_y=zoom_constants(zoom).max_tile - google_y, zoom=zoom)
+
+    @classmethod
+    def from_quad_key_int(cls, quad_key_int, validate=None):
+        """Creates a tile from an integer quad key, see Tile.quad_key_int"""
+        zoom = quad_key_int & _QUAD_KEY_ZOOM_MASK
+        if is_enabled(validate):
+            check(0 <= quad_key_int < 2 ** 63 and zoom <= QUAD_KEY_MAX_ZOOM,
+                  'Integer quad key needs to be a 63 bit value with a zoom between 0 and {}.'.format(QUAD_KEY_MAX_ZOOM))
+        google_x, google_y = _deinterleave(quad_key_int >> (2 * (QUAD_KEY_MAX_ZOOM - zoom) + QUAD_KEY_ZOOM_BITS))
+        return cls(tms_x=google_x, tms_y=zoom_constants(zoom).max_tile - google_y, zoom=zoom)
 
     @classmethod
-    def from_tms(cls, tms_x, tms_y, zoom):
+    def from_tms(cls, tms_x, tms_y, zoom, validate=None):
         """Creates a tile from Tile Map Service (TMS) X Y and zoom"""
-        max_tile = (2 ** zoom) - 1
-        assert 0 <= tms_x <= max_tile, 'TMS X needs to be a value between 0 and (2^zoom) -1.'
-        assert 0 <= tms_y <= max_tile, 'TMS Y needs to be a value between 0 and (2^zoom) -1.'
+        if is_enabled(validate):
+            max_tile = zoom_constants(zoom).max_tile
+            check(0 <= tms_x <= max_tile, 'TMS X needs to be a value between 0 and (2^zoom) -1.')
+            check(0 <= tms_y <= max_tile, 'TMS Y needs to be a value between 0 and (2^zoom) -1.')
         return cls(tms_x=tms_x, tms_y=tms_y, zoom=zoom)
 
     @classmethod
-    def from_google(cls, google_x, google_y, zoom):
+    def from_google(cls, google_x, google_y, zoom, validate=None):
         """Creates a tile from Google format X Y and zoom"""
-        max_tile = (2 ** zoom) - 1
-        assert 0 <= google_x <= max_tile, 'Google X needs to be a value between 0 and (2^zoom) -1.'
-        assert 0 <= google_y <= max_tile, 'Google Y needs to be a value between 0 and (2^zoom) -1.'
-        return cls(tms_x=google_x, tms_y=(2 ** zoom - 1) - google_y, zoom=zoom)
+        max_tile = zoom_constants(zoom).max_tile
+        if is_enabled(validate):
+            check(0 <= google_x <= max_tile, 'Google X needs to be a value between 0 and (2^zoom) -1.')
+            check(0 <= google_y <= max_tile, 'Google Y needs to be a value between 0 and (2^zoom) -1.')
+        return cls(tms_x=google_x, tms_y=max_tile - google_y, zoom=zoom)
 
     @classmethod
-    def for_point(cls, point, zoom):
+    def for_point(cls, point, zoom, grid=DEFAULT_TILE_GRID, validate=None):
         """Creates a tile for given point"""
         latitude, longitude = point.latitude_longitude
-        return cls.for_latitude_longitude(latitude=latitude, longitude=longitude, zoom=zoom)
+        return cls.for_latitude_longitude(latitude=latitude, longitude=longitude, zoom=zoom, grid=grid,
+                                          validate=validate)
 
     @classmethod
-    def for_pixels(cls, pixel_x, pixel_y, zoom):
-        """Creates a tile from pixels X Y Z (zoom) in pyramid"""
-        tms_x = int(math.ceil(pixel_x / float(TILE_SIZE)) - 1)
-        tms_y = int(math.ceil(pixel_y / float(TILE_SIZE)) - 1)
-        return cls(tms_x=tms_x, tms_y=(2 ** zoom - 1) - tms_y, zoom=zoom)
+    def for_pixels(cls, pixel_x, pixel_y, zoom, grid=DEFAULT_TILE_GRID):
+        """Creates a tile from pixels X Y Z (zoom) in pyramid of the tile grid, the pixels 0 lie in the first tiles"""
+        tile_size = float(grid.tile_size)
+        tms_x = max(int(math.ceil(pixel_x / tile_size) - 1), 0)
+        tms_y = max(int(math.ceil(pixel_y / tile_size) - 1), 0)
+        return cls(tms_x=tms_x, tms_y=grid.zoom_constants(zoom).max_tile - tms_y, zoom=zoom)
 
     @classmethod
-    def for_meters(cls, meter_x, meter_y, zoom):
+    def for_meters(cls, meter_x, meter_y, zoom, grid=DEFAULT_TILE_GRID, validate=None):
         """Creates a tile from X Y meters in Spherical Mercator EPSG:900913"""
-        point = Point.from_meters(meter_x=meter_x, meter_y=meter_y)
-        pixel_x, pixel_y = point.pixels(zoom=zoom)
-        return cls.for_pixels(pixel_x=pixel_x, pixel_y=pixel_y, zoom=zoom)
+        point = Point.from_meters(meter_x=meter_x, meter_y=meter_y, validate=validate)
+        pixel_x, pixel_y = point.pixels(zoom=zoom, grid=grid)
+        return cls.for_pixels(pixel_x=pixel_x, pixel_y=pixel_y, zoom=zoom, grid=grid)
 
     @classmethod
-    def for_latitude_longitude(cls, latitude, longitude, zoom):
-        """Creates a tile from lat/lon in WGS84"""
-        point = Point.from_latitude_longitude(latitude=latitude, longitude=longitude)
-        pixel_x, pixel_y = point.pixels(zoom=zoom)
-        return cls.for_pixels(pixel_x=pixel_x, pixel_y=pixel_y, zoom=zoom)
+    def for_latitude_longitude(cls, latitude, longitude, zoom, grid=DEFAULT_TILE_GRID, validate=None):
+        """Creates a tile from lat/lon in WGS84, latitudes beyond MAX_LATITUDE get the tiles at the edge of the map"""
+        point = Point.from_latitude_longitude(latitude=latitude, longitude=longitude, validate=validate)
+        if abs(latitude) > MAX_LATITUDE:
+            point = Point(latitude=math.copysign(MAX_LATITUDE, latitude), longitude=longitude)
+        pixel_x, pixel_y = point.pixels(zoom=zoom, grid=grid)
+        return cls.for_pixels(pixel_x=pixel_x, pixel_y=pixel_y, zoom=zoom, grid=grid)
+
+    @classmethod
+    def for_latitude_longitude_array(cls, latitudes, longitudes, zoom, grid=DEFAULT_TILE_GRID, validate=None):
+        """Creates arrays of TMS X, TMS Y and zoom from arrays of lat/lon in WGS84 (requires numpy)
+
+        Invalid lat/lon raise a ValidationError holding the indices of all offending values. The tiles are the same as
+        of for_latitude_longitude, lat/lon on the edge of the map or beyond MAX_LATITUDE get the tiles at the edge.
+        Scalar lat/lon give arrays of one tile.
+        """
+        np = require_numpy()
+        latitudes, longitudes = np.atleast_1d(np.asarray(latitudes, dtype=np.float64), longitudes)
+        with np.errstate(divide='ignore'):
+            pixel_x, pixel_y = latitude_longitude_to_pixels(latitudes=latitudes, longitudes=longitudes, zoom=zoom,
+                                                            grid=grid, validate=validate)
+        constants = grid.zoom_constants(zoom)
+        pixel_y[latitudes >= MAX_LATITUDE] = 0.0
+        pixel_y[latitudes <= -MAX_LATITUDE] = constants.map_size
+        tms_x = np.ceil(pixel_x / float(grid.tile_size)).astype(np.int64) - 1
+        tms_y = np.ceil(pixel_y / float(grid.tile_size)).astype(np.int64) - 1
+        np.maximum(tms_x, 0, out=tms_x)
+        np.maximum(tms_y, 0, out=tms_y)
+        return tms_x, constants.max_tile - tms_y, np.full(tms_x.shape, zoom, dtype=np.uint8)
+
+    @classmethod
+    def for_latitude_longitude_all_zooms(cls, latitude, longitude, min_zoom, max_zoom, grid=DEFAULT_TILE_GRID,
+                                         validate=None):
+        """Creates the tiles of lat/lon in WGS84 for every zoom from min_zoom to max_zoom, projecting only once
+
+        The tile of max_zoom is computed like for_latitude_longitude, the lower zooms are its ancestors derived by bit
+        shifts. They therefore always nest, which may differ from for_latitude_longitude right at a tile edge.
+        """
+        check(0 <= min_zoom <= max_zoom, 'Min zoom and max zoom need to be ordered values greater or equal 0.')
+        tile = cls.for_latitude_longitude(latitude=latitude, longitude=longitude, zoom=max_zoom, grid=grid,
+                                          validate=validate)
+        return [cls(tms_x=tile.tms_x >> (max_zoom - zoom), tms_y=tile.tms_y >> (max_zoom - zoom), zoom=zoom)
+                for zoom in range(min_zoom, max_zoom + 1)]
+
+    @classmethod
+    def for_latitude_longitude_all_zooms_array(cls, latitudes, longitudes, min_zoom, max_zoom, grid=DEFAULT_TILE_GRID,
+                                               validate=None):
+        """Creates arrays of TMS X, TMS Y and zoom of shape (zooms, points) for every zoom from min_zoom to max_zoom
+
+        Vectorized equivalent of for_latitude_longitude_all_zooms, row i holds the tiles of zoom min_zoom + i.
+        """
+        np = require_numpy()
+        check(0 <= min_zoom <= max_zoom, 'Min zoom and max zoom need to be ordered values greater or equal 0.')
+        tms_x, tms_y, _ = cls.for_latitude_longitude_array(latitudes=latitudes, longitudes=longitudes, zoom=max_zoom,
+                                                           grid=grid, validate=validate)
+        zooms = np.arange(min_zoom, max_zoom + 1, dtype=np.int64)
+        shifts = (max_zoom - zooms)[:, np.newaxis]
+        return (tms_x >> shifts, tms_y >> shifts,
+                np.broadcast_to(zooms.astype(np.uint8)[:, np.newaxis], (len(zooms),) + tms_x.shape).copy())
 
     @property
     def tms(self):
@@ -74,35 +186,156 @@ class Tile(BaseTile):
     @property
     def quad_tree(self):
         """Gets the tile in the Microsoft QuadTree format, converted from TMS"""
-        value = ''
-        tms_x, tms_y = self.tms
-        tms_y = (2 ** self.zoom - 1) - tms_y
-        for i in range(self.zoom, 0, -1):
-            digit = 0
-            mask = 1 << (i - 1)
-            if (tms_x & mask) != 0:
-                digit += 1
-            if (tms_y & mask) != 0:
-                digit += 2
-            value += str(digit)
-        return value
+        if self.zoom == 0:
+            return ''
+        google_x, google_y = self.google
+        if self.zoom > _MORTON_MAX_ZOOM:
+            return ''.join(str(((google_x >> shift) & 1) + 2 * ((google_y >> shift) & 1))
+                           for shift in range(self.zoom - 1, -1, -1))
+        morton = _interleave(google_x, google_y)
+        value = ''.join(map(_HEX_TO_QUAD_TREE.__getitem__, '{:0{}x}'.format(morton, (self.zoom + 1) // 2)))
+        return value[self.zoom % 2:]
+
+    @property
+    def quad_key_int(self):
+        """Gets the tile as 63 bit integer quad key, sortable in Morton (Z-order) and parents before children
+
+        The Morton code of Google X Y is stored left aligned to QUAD_KEY_MAX_ZOOM above the 5 lowest bits, which hold
+        the zoom. All descendants of a tile therefore lie in a contiguous key range right after the tile itself.
+        """
+        check(self.zoom <= QUAD_KEY_MAX_ZOOM, 'Zoom needs to be a value between 0 and {}.'.format(QUAD_KEY_MAX_ZOOM))
+        morton = _interleave(*self.google)
+        return (morton << (2 * (QUAD_KEY_MAX_ZOOM - self.zoom) + QUAD_KEY_ZOOM_BITS)) | self.zoom
 
     @property
     def google(self):
         """Gets the tile in the Google format, converted from TMS"""
         tms_x, tms_y = self.tms
-        return tms_x, (2 ** self.zoom - 1) - tms_y
+        return tms_x, zoom_constants(self.zoom).max_tile - tms_y
+
+    def parent(self, levels=1):
+        """Gets the tile containing this tile the given number of levels up the pyramid"""
+        check(0 <= levels <= self.zoom, 'Levels needs to be a value between 0 and the zoom of the tile.')
+        return self.__class__(tms_x=self.tms_x >> levels, tms_y=self.tms_y >> levels, zoom=self.zoom - levels)
+
+    def children(self):
+        """Gets the four tiles of the next zoom in QuadTree order (north west, north east, south west and south east)"""
+        tms_x, tms_y, zoom = self.tms_x << 1, self.tms_y << 1, self.zoom + 1
+        cls = self.__class__
+        return [cls(tms_x=tms_x, tms_y=tms_y + 1, zoom=zoom), cls(tms_x=tms_x + 1, tms_y=tms_y + 1, zoom=zoom),
+                cls(tms_x=tms_x, tms_y=tms_y, zoom=zoom), cls(tms_x=tms_x + 1, tms_y=tms_y, zoom=zoom)]
+
+    def ancestors(self):
+        """Gets all tiles containing this tile, starting with the parent and ending with the tile of zoom 0"""
+        return [self.parent(levels=levels) for levels in range(1, self.zoom + 1)]
+
+    def descendants(self, max_zoom):
+        """Yields all tiles within this tile down to max_zoom, zoom level by zoom level and row by row"""
+        cls = self.__class__
+        for zoom in range(self.zoom + 1, max_zoom + 1):
+            shift = zoom - self.zoom
+            min_x, min_y = self.tms_x << shift, self.tms_y << shift
+            max_x, max_y = min_x + (1 << shift), min_y + (1 << shift)
+            for tms_y in range(max_y - 1, min_y - 1, -1):
+                for tms_x in range(min_x, max_x):
+                    yield cls(tms_x=tms_x, tms_y=tms_y, zoom=zoom)
 
     @property
     def bounds(self):
         """Gets the bounds of a tile represented as the most west and south point and the most east and north point"""
+        (latitude_min, longitude_min), (latitude_max, longitude_max) = self.bounds_latitude_longitude
+        point_min = Point(latitude=latitude_min, longitude=longitude_min)
+        point_max = Point(latitude=latitude_max, longitude=longitude_max)
+        return point_min, point_max
+
+    @property
+    def bounds_latitude_longitude(self):
+        """Gets the bounds of a tile as lat/lon in WGS84 of the most west and south and the most east and north"""
+        (meter_x_west, meter_y_south), (meter_x_east, meter_y_north) = self.bounds_meters
+        return (_meters_to_latitude_longitude(meter_x=meter_x_west, meter_y=meter_y_south),
+                _meters_to_latitude_longitude(meter_x=meter_x_east, meter_y=meter_y_north))
+
+    @property
+    def bounds_meters(self):
+        """Gets the bounds of a tile as X Y meters in EPSG:900913 of the most west and south and east and north"""
         google_x, google_y = self.google
-        pixel_x_west, pixel_y_north = google_x * TILE_SIZE, google_y * TILE_SIZE
-        pixel_x_east, pixel_y_south = (google_x + 1) * TILE_SIZE, (google_y + 1) * TILE_SIZE
+        zoom_resolution = resolution(zoom=self.zoom)
+        meter_x_west, meter_y_north = google_x * TILE_SIZE * zoom_resolution, google_y * TILE_SIZE * zoom_resolution
+        meter_x_east = (google_x + 1) * TILE_SIZE * zoom_resolution
+        meter_y_south = (google_y + 1) * TILE_SIZE * zoom_resolution
+        return ((meter_x_west - ORIGIN_SHIFT, ORIGIN_SHIFT - meter_y_south),
+                (meter_x_east - ORIGIN_SHIFT, ORIGIN_SHIFT - meter_y_north))
 
-        point_min = Point.from_pixel(pixel_x=pixel_x_west, pixel_y=pixel_y_south, zoom=self.zoom)
-        point_max = Point.from_pixel(pixel_x=pixel_x_east, pixel_y=pixel_y_north, zoom=self.zoom)
-        return point_min, point_max
+
+MAX_LATITUDE = 85.0511287798066
+TILE_ORDERS = ('row', 'morton')
+
+
+def _google_ranges_for_bounds(south, west, north, east, min_zoom, max_zoom):
+    """Yields zoom and the inclusive Google X Y ranges of the tiles intersecting the bounds per zoom
+
+    Bounds are clamped to the latitudes of the map, bounds entirely north or south of the map yield nothing.
+    """
+    check(-90.0 <= south <= north <= 90.0, 'South and north need to be ordered values between -90.0 and 90.0.')
+    check(-180.0 <= west <= east <= 180.0, 'West and east need to be ordered values between -180.0 and 180.0.')
+    check(0 <= min_zoom <= max_zoom, 'Min zoom and max zoom need to be ordered values greater or equal 0.')
+    south, north = max(south, -MAX_LATITUDE), min(north, MAX_LATITUDE)
+    if south > north:
+        return
+    meter_west, meter_north = Point(latitude=north, longitude=west).meters
+    meter_east, meter_south = Point(latitude=south, longitude=east).meters
+    for zoom in range(min_zoom, max_zoom + 1):
+        tile_resolution = resolution(zoom=zoom) * TILE_SIZE
+        max_tile = zoom_constants(zoom).max_tile
+        min_x = int(math.floor((meter_west + ORIGIN_SHIFT) / tile_resolution))
+        min_y = int(math.floor((ORIGIN_SHIFT - meter_north) / tile_resolution))
+        max_x = int(math.ceil((meter_east + ORIGIN_SHIFT) / tile_resolution)) - 1
+        max_y = int(math.ceil((ORIGIN_SHIFT - meter_south) / tile_resolution)) - 1
+        min_x, min_y = min(max(min_x, 0), max_tile), min(max(min_y, 0), max_tile)
+        yield zoom, (min_x, max(min(max_x, max_tile), min_x)), (min_y, max(min(max_y, max_tile), min_y))
+
+
+def _morton_google_range(zoom, x_range, y_range):
+    """Yields Google X Y within the ranges in Morton (QuadTree) order by descending the pyramid"""
+    (min_x, max_x), (min_y, max_y) = x_range, y_range
+    stack = [(0, 0, 0)]
+    while stack:
+        google_x, google_y, tile_zoom = stack.pop()
+        shift = zoom - tile_zoom
+        if (google_x + 1) << shift <= min_x or google_x << shift > max_x or \
+                (google_y + 1) << shift <= min_y or google_y << shift > max_y:
+            continue
+        if shift == 0:
+            yield google_x, google_y
+            continue
+        google_x, google_y, tile_zoom = google_x << 1, google_y << 1, tile_zoom + 1
+        stack.extend(((google_x + 1, google_y + 1, tile_zoom), (google_x, google_y + 1, tile_zoom),
+                      (google_x + 1, google_y, tile_zoom), (google_x, google_y, tile_zoom)))
+
+
+def tiles_for_bounds(south, west, north, east, min_zoom, max_zoom, order='row'):
+    """Yields all tiles intersecting the lat/lon bounds in WGS84 from min_zoom to max_zoom
+
+    The tiles are generated lazily zoom level by zoom level, within a zoom either row by row from north west
+    (order='row') or in Morton order like the QuadTree (order='morton'). Tiles only touching the bounds at their
+    edge are not included, bounds entirely north or south of MAX_LATITUDE have no tiles.
+    """
+    check(order in TILE_ORDERS, 'Order needs to be one of {}.'.format(', '.join(TILE_ORDERS)))
+    for zoom, x_range, y_range in _google_ranges_for_bounds(south, west, north, east, min_zoom, max_zoom):
+        max_tile = zoom_constants(zoom).max_tile
+        if order == 'row':
+            google = ((google_x, google_y) for google_y in range(y_range[0], y_range[1] + 1)
+                      for google_x in range(x_range[0], x_range[1] + 1))
+        else:
+            google = _morton_google_range(zoom=zoom, x_range=x_range, y_range=y_range)
+        for google_x, google_y in google:
+            yield Tile(tms_x=google_x, tms_y=max_tile - google_y, zoom=zoom)
+
+
+def count_tiles_for_bounds(south, west, north, east, min_zoom, max_zoom):
+    """Gets the number of tiles tiles_for_bounds yields, without generating them"""
+    return sum((x_range[1] - x_range[0] + 1) * (y_range[1] - y_range[0] + 1) for _, x_range, y_range in
+               _google_ranges_for_bounds(south, west, north, east, min_zoom, max_zoom))
 
 
-__all__ = ['Tile']
+__all__ = ['Tile', 'tiles_for_bounds', 'count_tiles_for_bounds']
@@ -0,0 +1,207 @@
+from .tile import Tile, QUAD_KEY_MAX_ZOOM, QUAD_KEY_ZOOM_BITS, _QUAD_KEY_ZOOM_MASK, _interleave, _deinterleave
+from .point import meters_to_latitude_longitude
+from .meta import DEFAULT_TILE_GRID, TILE_SIZE, ORIGIN_SHIFT, resolution
+from .compat import require_numpy
+from .validation import is_enabled, check, check_array, _tiles_masks
+
+_ITERATION_CHUNK_SIZE = 4096
+
+
+def _unsigned_column(np, values, dtype, name, validate):
+    """Gets values as array of the unsigned dtype, checking that integers of other dtypes fit instead of wrapping"""
+    values = np.asarray(values)
+    if values.dtype != dtype and values.dtype.kind in 'iu' and values.size and is_enabled(validate):
+        max_value = np.iinfo(dtype).max
+        if values.min() < 0 or values.max() > max_value:
+            check_array((values >= 0) & (values <= max_value),
+                        '{} needs to be a value between 0 and {}.'.format(name, max_value))
+    return values.astype(dtype, copy=False)
+
+
+class TileArray(object):
+    """Columnar array of tiles, stores TMS X Y as uint32 and the zoom as uint8 (requires numpy)
+
+    Integer columns of other dtypes are checked to fit, values that would wrap around raise a ValidationError.
+    """
+
+    __slots__ = ('tms_x', 'tms_y', 'zoom')
+
+    def __init__(self, tms_x, tms_y, zoom, validate=None):
+        np = require_numpy()
+        self.tms_x = _unsigned_column(np, tms_x, np.uint32, 'TMS X', validate)
+        self.tms_y = _unsigned_column(np, tms_y, np.uint32, 'TMS Y', validate)
+        self.zoom = _unsigned_column(np, zoom, np.uint8, 'Zoom', validate)
+        if self.zoom.ndim == 0:
+            self.zoom = np.full(self.tms_x.shape, self.zoom, dtype=np.uint8)
+        check(self.tms_x.ndim == 1 and self.tms_x.shape == self.tms_y.shape == self.zoom.shape,
+              'TMS X, TMS Y and zoom need to be one dimensional arrays of the same length.')
+
+    @classmethod
+    def from_tiles(cls, tiles):
+        """Creates a tile array from an iterable of tiles"""
+        np = require_numpy()
+        values = np.array([tuple(tile) for tile in tiles], dtype=np.int64).reshape(-1, 3)
+        return cls(tms_x=values[:, 0], tms_y=values[:, 1], zoom=values[:, 2])
+
+    @classmethod
+    def from_tms(cls, tms_x, tms_y, zoom, validate=None):
+        """Creates a tile array from Tile Map Service (TMS) X Y and zoom arrays"""
+        np = require_numpy()
+        tms_x, tms_y, zoom = np.asarray(tms_x), np.asarray(tms_y), np.asarray(zoom)
+        if is_enabled(validate):
+            valid_x, valid_y = _tiles_masks(tms_x, tms_y, zoom)
+            check_array(valid_x, 'TMS X needs to be a value between 0 and (2^zoom) -1.')
+            check_array(valid_y, 'TMS Y needs to be a value between 0 and (2^zoom) -1.')
+        return cls(tms_x=tms_x, tms_y=tms_y, zoom=zoom, validate=validate)
+
+    @classmethod
+    def from_google(cls, google_x, google_y, zoom, validate=None):
+        """Creates a tile array from Google format X Y and zoom arrays"""
+        np = require_numpy()
+        google_x, google_y, zoom = np.asarray(google_x), np.asarray(google_y), np.asarray(zoom)
+        max_tile = np.left_shift(1, zoom.astype(np.int64)) - 1
+        if is_enabled(validate):
+            valid_x, valid_y = _tiles_masks(google_x, google_y, zoom)
+            check_array(valid_x, 'Google X needs to be a value between 0 and (2^zoom) -1.')
+            check_array(valid_y, 'Google Y needs to be a value between 0 and (2^zoom) -1.')
+        return cls(tms_x=google_x, tms_y=max_tile - google_y, zoom=zoom, validate=validate)
+
+    @classmethod
+    def from_quad_key_int(cls, quad_key_int, validate=None):
+        """Creates a tile array from an array of integer quad keys, see Tile.quad_key_int"""
+        np = require_numpy()
+        quad_key_int = np.asarray(quad_key_int, dtype=np.uint64)
+        zoom = quad_key_int & _QUAD_KEY_ZOOM_MASK
+        if is_enabled(validate):
+            check_array((zoom <= QUAD_KEY_MAX_ZOOM) & (quad_key_int < 2 ** 63),
+                        'Integer quad key needs to be a 63 bit value with a zoom between 0 and {}.'.format(
+                            QUAD_KEY_MAX_ZOOM))
+        google_x, google_y = _deinterleave(quad_key_int >> (2 * (QUAD_KEY_MAX_ZOOM - zoom) + QUAD_KEY_ZOOM_BITS))
+        return cls(tms_x=google_x, tms_y=((np.uint64(1) << zoom) - 1) - google_y, zoom=zoom, validate=validate)
+
+    @classmethod
+    def for_latitude_longitude(cls, latitudes, longitudes, zoom, grid=DEFAULT_TILE_GRID, validate=None):
+        """Creates a tile array from lat/lon arrays in WGS84, see Tile.for_latitude_longitude_array"""
+        tms_x, tms_y, zoom = Tile.for_latitude_longitude_array(latitudes=latitudes, longitudes=longitudes, zoom=zoom,
+                                                               grid=grid, validate=validate)
+        return cls(tms_x=tms_x, tms_y=tms_y, zoom=zoom, validate=validate)
+
+    def to_tiles(self):
+        """Gets the tiles as a list of Tile"""
+        return list(self)
+
+    @property
+    def nbytes(self):
+        """Gets the number of bytes used by the columns"""
+        return self.tms_x.nbytes + self.tms_y.nbytes + self.zoom.nbytes
+
+    @property
+    def tms(self):
+        """Gets the TMS X Y arrays of the tiles"""
+        return self.tms_x, self.tms_y
+
+    @property
+    def google(self):
+        """Gets the Google X Y arrays of the tiles, converted from TMS"""
+        np = require_numpy()
+        google_y = (np.left_shift(1, self.zoom.astype(np.int64)) - 1) - self.tms_y
+        return self.tms_x, google_y.astype(np.uint32)
+
+    @property
+    def quad_tree(self):
+        """Gets an array of Microsoft QuadTree strings, converted from TMS"""
+        np = require_numpy()
+        google_x, google_y = self.google
+        max_zoom = int(self.zoom.max()) if len(self) else 0
+        digits = np.zeros((len(self), max(max_zoom, 1)), dtype=np.uint8)
+        for position in range(max_zoom):
+            shift = self.zoom.astype(np.int64) - 1 - position
+            valid = shift >= 0
+            shift = np.where(valid, shift, 0).astype(np.uint32)
+            digit = ((google_x >> shift) & 1) + 2 * ((google_y >> shift) & 1)
+            digits[:, position] = np.where(valid, digit + ord('0'), 0)
+        return digits.view('S{}'.format(digits.shape[1])).ravel().astype(str)
+
+    @property
+    def quad_key_int(self):
+        """Gets an uint64 array of integer quad keys, see Tile.quad_key_int"""
+        np = require_numpy()
+        check(np.all(self.zoom <= QUAD_KEY_MAX_ZOOM),
+              'Zoom needs to be a value between 0 and {}.'.format(QUAD_KEY_MAX_ZOOM))
+        google_x, google_y = self.google
+        zoom = self.zoom.astype(np.uint64)
+        morton = _interleave(google_x.astype(np.uint64), google_y.astype(np.uint64))
+        return (morton << (2 * (QUAD_KEY_MAX_ZOOM - zoom) + QUAD_KEY_ZOOM_BITS)) | zoom
+
+    @property
+    def bounds(self):
+        """Gets the bounds of the tiles as lat/lon arrays of the most west and south and the most east and north"""
+        (meter_x_west, meter_y_south), (meter_x_east, meter_y_north) = self.bounds_meters
+        return (meters_to_latitude_longitude(meter_x_west, meter_y_south, out=(meter_y_south, meter_x_west),
+                                             validate=False),
+                meters_to_latitude_longitude(meter_x_east, meter_y_north, out=(meter_y_north, meter_x_east),
+                                             validate=False))
+
+    @property
+    def bounds_meters(self):
+        """Gets the bounds of the tiles as X Y meter arrays of the most west and south and the most east and north"""
+        np = require_numpy()
+        google_x, google_y = self.google
+        resolutions = resolution(zoom=self.zoom.astype(np.float64))
+        meter_x_west = google_x * float(TILE_SIZE) * resolutions
+        meter_y_north = google_y * float(TILE_SIZE) * resolutions
+        meter_x_east = (google_x + 1.0) * TILE_SIZE * resolutions
+        meter_y_south = (google_y + 1.0) * TILE_SIZE * resolutions
+        return ((meter_x_west - ORIGIN_SHIFT, ORIGIN_SHIFT - meter_y_south),
+                (meter_x_east - ORIGIN_SHIFT, ORIGIN_SHIFT - meter_y_north))
+
+    @property
+    def centroids(self):
+        """Gets the centers of the tiles as lat/lon arrays in WGS84, the centers being taken in Spherical Mercator"""
+        meters_x, meters_y = self.centroids_meters
+        return meters_to_latitude_longitude(meters_x, meters_y, out=(meters_y, meters_x), validate=False)
+
+    @property
+    def centroids_meters(self):
+        """Gets the centers of the tiles as X Y meter arrays in Spherical Mercator EPSG:900913"""
+        np = require_numpy()
+        google_x, google_y = self.google
+        tile_meters = TILE_SIZE * resolution(zoom=self.zoom.astype(np.float64))
+        return (google_x + 0.5) * tile_meters - ORIGIN_SHIFT, ORIGIN_SHIFT - (google_y + 0.5) * tile_meters
+
+    @property
+    def corners(self):
+        """Gets the corners of the tiles as lat/lon arrays of shape (tiles, 4) ordered NW, NE, SE and SW"""
+        meters_x, meters_y = self.corners_meters
+        return meters_to_latitude_longitude(meters_x, meters_y, out=(meters_y, meters_x), validate=False)
+
+    @property
+    def corners_meters(self):
+        """Gets the corners of the tiles as X Y meter arrays of shape (tiles, 4) ordered like corners"""
+        np = require_numpy()
+        (meter_x_west, meter_y_south), (meter_x_east, meter_y_north) = self.bounds_meters
+        return (np.stack((meter_x_west, meter_x_east, meter_x_east, meter_x_west), axis=1),
+                np.stack((meter_y_north, meter_y_north, meter_y_south, meter_y_south), axis=1))
+
+    def __len__(self):
+        return len(self.tms_x)
+
+    def __iter__(self):
+        for start in range(0, len(self), _ITERATION_CHUNK_SIZE):
+            stop = start + _ITERATION_CHUNK_SIZE
+            columns = (self.tms_x[start:stop].tolist(), self.tms_y[start:stop].tolist(),
+                       self.zoom[start:stop].tolist())
+            for tms_x, tms_y, zoom in zip(*columns):
+                yield Tile(tms_x=tms_x, tms_y=tms_y, zoom=zoom)
+
+    def __getitem__(self, item):
+        np = require_numpy()
+        if isinstance(item, slice) or np.ndim(item) > 0:
+            return TileArray(tms_x=self.tms_x[item], tms_y=self.tms_y[item], zoom=self.zoom[item])
+        return Tile(tms_x=int(self.tms_x[item]), tms_y=int(self.tms_y[item]), zoom=int(self.zoom[item]))
+
+    def __repr__(self):
+        return 'TileArray(size={})'.format(len(self))
+
+
+__all__ = ['TileArray']
@@ -0,0 +1,258 @@
+import mmap
+import struct
+
+from .tile import (QUAD_KEY_MAX_ZOOM, QUAD_KEY_ZOOM_BITS, _QUAD_KEY_ZOOM_MASK, _interleave, _deinterleave,
+                   _google_ranges_for_bounds)
+from .tile_array import TileArray
+from .compat import require_numpy
+from .validation import check
+
+_ZOOM_SHIFT = 2 * QUAD_KEY_MAX_ZOOM
+_MORTON_MASK = (1 << _ZOOM_SHIFT) - 1
+_MAGIC = b'PGTR'
+_VERSION = 1
+_HEADER = struct.Struct('<4sIQ')
+_ITERATION_CHUNK_SIZE = 4096
+
+
+def _morton_ranges(zoom, x_range, y_range):
+    """Yields the Morton code ranges [start, stop) covering the inclusive Google X Y ranges by descending the pyramid
+
+    Blocks completely within the ranges become a single range, so a rectangle yields ranges along its border only.
+    """
+    (min_x, max_x), (min_y, max_y) = x_range, y_range
+    stack = [(0, 0, 0)]
+    while stack:
+        google_x, google_y, tile_zoom = stack.pop()
+        shift = zoom - tile_zoom
+        first_x, last_x = google_x << shift, ((google_x + 1) << shift) - 1
+        first_y, last_y = google_y << shift, ((google_y + 1) << shift) - 1
+        if last_x < min_x or first_x > max_x or last_y < min_y or first_y > max_y:
+            continue
+        if min_x <= first_x and last_x <= max_x and min_y <= first_y and last_y <= max_y:
+            morton = _interleave(google_x, google_y)
+            yield morton << 2 * shift, (morton + 1) << 2 * shift
+            continue
+        google_x, google_y, tile_zoom = google_x << 1, google_y << 1, tile_zoom + 1
+        stack.extend(((google_x + 1, google_y + 1, tile_zoom), (google_x, google_y + 1, tile_zoom),
+                      (google_x + 1, google_y, tile_zoom), (google_x, google_y, tile_zoom)))
+
+
+class TileRanges(object):
+    """Immutable set of tiles up to QUAD_KEY_MAX_ZOOM compressed to ranges of Morton codes (requires numpy)
+
+    Every range [start, stop) holds the zoom above the lowest 2 * QUAD_KEY_MAX_ZOOM bits and the Morton codes of
+    Google X Y below, ranges are sorted, disjoint and never adjacent. Contiguous regions of tiles therefore take
+    16 bytes per range along their border instead of per tile, and can be stored as memory mapped files.
+    """
+
+    __slots__ = ('start', 'stop')
+
+    def __init__(self, start=(), stop=()):
+        np = require_numpy()
+        start, stop = np.asarray(start, dtype=np.uint64), np.asarray(stop, dtype=np.uint64)
+        check(start.ndim == 1 and start.shape == stop.shape and bool(np.all(start < stop)),
+              'Start and stop need to be one dimensional arrays of the same length with start before stop.')
+        self.start, self.stop = self._merged(start, stop)
+
+    @staticmethod
+    def _merged(start, stop):
+        """Gets sorted, disjoint and not adjacent ranges of any ranges"""
+        np = require_numpy()
+        if len(start) < 2:
+            return start, stop
+        order = np.argsort(start, kind='stable')
+        start, stop = start[order], stop[order]
+        reach = np.maximum.accumulate(stop)
+        first = np.ones(len(start), dtype=bool)
+        first[1:] = start[1:] > reach[:-1]
+        indices = np.flatnonzero(first)
+        return start[indices], np.maximum.reduceat(stop, indices)
+
+    @classmethod
+    def _from_merged(cls, start, stop):
+        """Creates tile ranges from already merged ranges without merging them again"""
+        tile_ranges = cls.__new__(cls)
+        tile_ranges.start, tile_ranges.stop = start, stop
+        return tile_ranges
+
+    @classmethod
+    def _from_positions(cls, positions):
+        """Creates tile ranges from sorted unique positions of tiles, each consecutive run becoming a range"""
+        np = require_numpy()
+        if not len(positions):
+            return cls()
+        first = np.ones(len(positions), dtype=bool)
+        first[1:] = positions[1:] != positions[:-1] + np.uint64(1)
+        last = np.ones(len(positions), dtype=bool)
+        last[:-1] = first[1:]
+        return cls._from_merged(positions[first], positions[last] + np.uint64(1))
+
+    @classmethod
+    def from_tiles(cls, tiles):
+        """Creates tile ranges from an iterable of tiles"""
+        return cls.from_tile_array(TileArray.from_tiles(tiles))
+
+    @classmethod
+    def from_tile_array(cls, tile_array):
+        """Creates tile ranges from a tile array"""
+        np = require_numpy()
+        check(bool(np.all(tile_array.zoom <= QUAD_KEY_MAX_ZOOM)),
+              'Zoom needs to be a value between 0 and {}.'.format(QUAD_KEY_MAX_ZOOM))
+        google_x, google_y = tile_array.google
+        morton = _interleave(google_x.astype(np.uint64), google_y.astype(np.uint64))
+        return cls._from_positions(np.unique((tile_array.zoom.astype(np.uint64) << np.uint64(_ZOOM_SHIFT)) | morton))
+
+    @classmethod
+    def from_tile_set(cls, tile_set):
+        """Creates tile ranges from a TileSet"""
+        np = require_numpy()
+        zoom = tile_set.quad_key_int & np.uint64(_QUAD_KEY_ZOOM_MASK)
+        morton = tile_set.quad_key_int >> (np.uint64(2) * (np.uint64(QUAD_KEY_MAX_ZOOM) - zoom) +
+                                           np.uint64(QUAD_KEY_ZOOM_BITS))
+        return cls._from_positions(np.unique((zoom << np.uint64(_ZOOM_SHIFT)) | morton))
+
+    @classmethod
+    def for_bounds(cls, south, west, north, east, min_zoom, max_zoom):
+        """Creates the tile ranges of all tiles intersecting the lat/lon bounds in WGS84, see tiles_for_bounds
+
+        The ranges are computed without generating the tiles, so the ranges of large regions are cheap.
+        """
+        np = require_numpy()
+        check(max_zoom <= QUAD_KEY_MAX_ZOOM, 'Zoom needs to be a value between 0 and {}.'.format(QUAD_KEY_MAX_ZOOM))
+        ranges = [((zoom << _ZOOM_SHIFT) + start, (zoom << _ZOOM_SHIFT) + stop)
+                  for zoom, x_range, y_range in _google_ranges_for_bounds(south, west, north, east, min_zoom, max_zoom)
+                  for start, stop in _morton_ranges(zoom, x_range, y_range)]
+        start, stop = np.array(ranges, dtype=np.uint64).reshape(-1, 2).T
+        return cls(start, stop)
+
+    @classmethod
+    def frombuffer(cls, buffer):
+        """Creates tile ranges from the bytes of tobytes, the ranges are views of buffer without copying"""
+        np = require_numpy()
+        check(len(buffer) >= _HEADER.size, 'Buffer needs to start with a tile ranges header.')
+        magic, version, count = _HEADER.unpack_from(buffer)
+        check(magic == _MAGIC and version == _VERSION, 'Buffer needs to start with a tile ranges header.')
+        check(len(buffer) == _HEADER.size + 16 * count, 'Buffer needs to hold {} ranges.'.format(count))
+        start = np.frombuffer(buffer, dtype='<u8', count=count, offset=_HEADER.size)
+        stop = np.frombuffer(buffer, dtype='<u8', count=count, offset=_HEADER.size + 8 * count)
+        return cls._from_merged(start, stop)
+
+    @classmethod
+    def load(cls, path):
+        """Loads tile ranges saved with save, memory mapping the file read only"""
+        with open(path, 'rb') as ranges_file:
+            return cls.frombuffer(mmap.mmap(ranges_file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def tobytes(self):
+        """Gets the ranges as a header followed by the little endian uint64 starts and stops"""
+        return b''.join((_HEADER.pack(_MAGIC, _VERSION, len(self.start)), self.start.astype('<u8').tobytes(),
+                         self.stop.astype('<u8').tobytes()))
+
+    def save(self, path):
+        """Saves the ranges to a file in the format of tobytes"""
+        with open(path, 'wb') as ranges_file:
+            ranges_file.write(self.tobytes())
+
+    @property
+    def range_count(self):
+        """Gets the number of ranges"""
+        return len(self.start)
+
+    @property
+    def nbytes(self):
+        """Gets the bytes used by the ranges"""
+        return self.start.nbytes + self.stop.nbytes
+
+    def tile_arrays(self, chunk_size=2 ** 16):
+        """Yields the tiles as tile arrays of at most chunk_size tiles, by zoom and in Morton order within a zoom"""
+        np = require_numpy()
+        check(chunk_size > 0, 'Chunk size needs to be a value greater than 0.')
+        for start, stop in zip(self.start.tolist(), self.stop.tolist()):
+            for chunk_start in range(start, stop, chunk_size):
+                positions = np.arange(chunk_start, min(chunk_start + chunk_size, stop), dtype=np.uint64)
+                zoom = (positions >> np.uint64(_ZOOM_SHIFT)).astype(np.int64)
+                google_x, google_y = _deinterleave(positions & np.uint64(_MORTON_MASK))
+                yield TileArray.from_google(google_x, google_y, zoom, validate=False)
+
+    def to_tile_array(self):
+        """Gets all tiles as one tile array"""
+        np = require_numpy()
+        tile_arrays = list(self.tile_arrays()) or [TileArray.from_tiles([])]
+        return TileArray(tms_x=np.concatenate([tile_array.tms_x for tile_array in tile_arrays]),
+                         tms_y=np.concatenate([tile_array.tms_y for tile_array in tile_arrays]),
+                         zoom=np.concatenate([tile_array.zoom for tile_array in tile_arrays]))
+
+    def contains(self, tile_array):
+        """Gets a boolean array telling for every tile of a tile array whether it is in the ranges"""
+        np = require_numpy()
+        google_x, google_y = tile_array.google
+        morton = _interleave(google_x.astype(np.uint64), google_y.astype(np.uint64))
+        positions = (tile_array.zoom.astype(np.uint64) << np.uint64(_ZOOM_SHIFT)) | morton
+        return self._covers(positions) & (tile_array.zoom <= QUAD_KEY_MAX_ZOOM)
+
+    def _combined(self, other, keep):
+        """Gets the ranges of the segments between all range bounds for which keep(in self, in other) is true"""
+        np = require_numpy()
+        bounds = np.unique(np.concatenate((self.start, self.stop, other.start, other.stop)))
+        if len(bounds) < 2:
+            return TileRanges()
+        segment_start, segment_stop = bounds[:-1], bounds[1:]
+        kept = keep(self._covers(segment_start), other._covers(segment_start))
+        return TileRanges(segment_start[kept], segment_stop[kept])
+
+    def _covers(self, positions):
+        """Gets a boolean array telling for every position whether it lies in a range"""
+        np = require_numpy()
+        if not self.range_count:
+            return np.zeros(len(positions), dtype=bool)
+        indices = np.searchsorted(self.start, positions, side='right') - 1
+        return (indices >= 0) & (positions < self.stop[np.maximum(indices, 0)])
+
+    def union(self, other):
+        """Gets the tiles in these or the other tile ranges, merging their ranges"""
+        np = require_numpy()
+        return TileRanges(np.concatenate((self.start, other.start)), np.concatenate((self.stop, other.stop)))
+
+    def intersection(self, other):
+        """Gets the tiles in these and the other tile ranges"""
+        return self._combined(other, lambda in_self, in_other: in_self & in_other)
+
+    def difference(self, other):
+        """Gets the tiles in these but not in the other tile ranges"""
+        return self._combined(other, lambda in_self, in_other: in_self & ~in_other)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def __len__(self):
+        return int((self.stop - self.start).sum())
+
+    def __iter__(self):
+        for tile_array in self.tile_arrays(chunk_size=_ITERATION_CHUNK_SIZE):
+            for tile in tile_array:
+                yield tile
+
+    def __contains__(self, tile):
+        if tile.zoom > QUAD_KEY_MAX_ZOOM:
+            return False
+        position = (tile.zoom << _ZOOM_SHIFT) | _interleave(*tile.google)
+        index = int(self.start.searchsorted(require_numpy().uint64(position), side='right')) - 1
+        return index >= 0 and position < int(self.stop[index])
+
+    def __eq__(self, other):
+        np = require_numpy()
+        return isinstance(other, TileRanges) and np.array_equal(self.start, other.start) and \
+            np.array_equal(self.stop, other.stop)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return 'TileRanges(tiles={}, ranges={})'.format(len(self), self.range_count)
+
+
+__all__ = ['TileRanges']
@@ -0,0 +1,192 @@
+from .tile import Tile, QUAD_KEY_MAX_ZOOM, QUAD_KEY_ZOOM_BITS, _QUAD_KEY_ZOOM_MASK, _interleave
+from .tile_array import TileArray
+from .meta import DEFAULT_TILE_GRID
+from .compat import require_numpy
+from .validation import is_enabled, check_array
+
+
+def _shifts(zoom):
+    """Gets the bit shift of the Morton code within the integer quad keys of a zoom or an array of zooms"""
+    return 2 * (QUAD_KEY_MAX_ZOOM - zoom) + QUAD_KEY_ZOOM_BITS
+
+
+class TileSet(object):
+    """Immutable set of tiles up to QUAD_KEY_MAX_ZOOM, stored as sorted uint64 integer quad keys (requires numpy)
+
+    Sorted by Tile.quad_key_int every tile lies right before its descendants, so membership, the tiles within a parent
+    and the deepest tile containing a point are binary searches. A tile set takes 8 bytes per tile.
+    """
+
+    __slots__ = ('quad_key_int', 'zooms')
+
+    def __init__(self, quad_key_int=()):
+        np = require_numpy()
+        self._set_sorted(np.unique(np.asarray(quad_key_int, dtype=np.uint64)))
+
+    def _set_sorted(self, quad_key_int):
+        np = require_numpy()
+        self.quad_key_int = quad_key_int
+        self.zooms = np.unique((quad_key_int & _QUAD_KEY_ZOOM_MASK).astype(np.uint8))
+
+    @classmethod
+    def _from_sorted(cls, quad_key_int):
+        """Creates a tile set from sorted unique integer quad keys without sorting them again"""
+        tile_set = cls.__new__(cls)
+        tile_set._set_sorted(quad_key_int)
+        return tile_set
+
+    @classmethod
+    def from_tiles(cls, tiles):
+        """Creates a tile set from an iterable of tiles"""
+        return cls.from_tile_array(TileArray.from_tiles(tiles))
+
+    @classmethod
+    def from_tile_array(cls, tile_array):
+        """Creates a tile set from a tile array"""
+        return cls(tile_array.quad_key_int)
+
+    @classmethod
+    def from_quad_key_int(cls, quad_key_int, validate=None):
+        """Creates a tile set from an array of integer quad keys in any order, see Tile.quad_key_int"""
+        np = require_numpy()
+        quad_key_int = np.asarray(quad_key_int, dtype=np.uint64)
+        if is_enabled(validate):
+            check_array(((quad_key_int & _QUAD_KEY_ZOOM_MASK) <= QUAD_KEY_MAX_ZOOM) & (quad_key_int < 2 ** 63),
+                        'Integer quad key needs to be a 63 bit value with a zoom between 0 and {}.'.format(
+                            QUAD_KEY_MAX_ZOOM))
+        return cls(quad_key_int)
+
+    def to_tile_array(self):
+        """Gets the tiles as tile array in the order of their integer quad keys"""
+        return TileArray.from_quad_key_int(self.quad_key_int, validate=False)
+
+    @property
+    def nbytes(self):
+        """Gets the bytes used by the integer quad keys"""
+        return self.quad_key_int.nbytes
+
+    def contains(self, tile_array):
+        """Gets a boolean array telling for every tile of a tile array whether it is in the set"""
+        return self._contains_keys(tile_array.quad_key_int)
+
+    def _contains_keys(self, quad_key_int):
+        np = require_numpy()
+        if not len(self):
+            return np.zeros(quad_key_int.shape, dtype=bool)
+        indices = np.searchsorted(self.quad_key_int, quad_key_int)
+        return self.quad_key_int[np.minimum(indices, len(self) - 1)] == quad_key_int
+
+    def _range_within(self, tile):
+        """Gets start and stop index of the keys within a tile, which form a contiguous range"""
+        np = require_numpy()
+        first = tile.quad_key_int
+        last = first | ((1 << _shifts(tile.zoom)) - 1)
+        return (int(self.quad_key_int.searchsorted(np.uint64(first), side='left')),
+                int(self.quad_key_int.searchsorted(np.uint64(last), side='right')))
+
+    def within(self, tile):
+        """Gets the tiles of the set within a tile, the tile itself included, sharing the keys of this tile set"""
+        start, stop = self._range_within(tile)
+        return self._from_sorted(self.quad_key_int[start:stop])
+
+    def count_within(self, tile):
+        """Gets the number of tiles of the set within a tile, the tile itself included"""
+        start, stop = self._range_within(tile)
+        return stop - start
+
+    def deepest_tile(self, latitude, longitude, grid=DEFAULT_TILE_GRID, validate=None):
+        """Gets the tile of the set with the highest zoom containing lat/lon in WGS84, or None if there is none
+
+        The tiles of the lower zooms are derived by bit shifts from the tile of the highest zoom in the set, as in
+        Tile.for_latitude_longitude_all_zooms. Lat/lon on the edge of the map or beyond MAX_LATITUDE lie in the tiles at
+        the edge, like in deepest_tiles.
+        """
+        np = require_numpy()
+        if not len(self):
+            return None
+        max_zoom = int(self.zooms[-1])
+        tile = Tile.for_latitude_longitude(latitude=latitude, longitude=longitude, zoom=max_zoom, grid=grid,
+                                           validate=validate)
+        morton = _interleave(*tile.google)
+        for zoom in self.zooms.tolist()[::-1]:
+            quad_key_int = (morton >> 2 * (max_zoom - zoom)) << _shifts(zoom) | zoom
+            index = self.quad_key_int.searchsorted(np.uint64(quad_key_int))
+            if index < len(self) and int(self.quad_key_int[index]) == quad_key_int:
+                return Tile.from_quad_key_int(quad_key_int, validate=False)
+        return None
+
+    def deepest_tiles(self, latitudes, longitudes, grid=DEFAULT_TILE_GRID, validate=None):
+        """Gets the deepest tiles of the set containing lat/lon arrays in WGS84, vectorized equivalent of deepest_tile
+
+        Returns a tile array and a boolean array telling which points lie in a tile of the set, the tile array holds
+        the tile 0/0/0 for points outside of all tiles.
+        """
+        np = require_numpy()
+        latitudes = np.asarray(latitudes, dtype=np.float64)
+        keys = np.zeros(latitudes.shape, dtype=np.uint64)
+        found = np.zeros(latitudes.shape, dtype=bool)
+        if len(self):
+            max_zoom = int(self.zooms[-1])
+            tms_x, tms_y, _ = Tile.for_latitude_longitude_array(latitudes=latitudes, longitudes=longitudes,
+                                                                zoom=max_zoom, grid=grid, validate=validate)
+            google_y = grid.zoom_constants(max_zoom).max_tile - tms_y
+            morton = _interleave(tms_x.astype(np.uint64), google_y.astype(np.uint64))
+            pending = np.arange(len(morton))
+            for zoom in self.zooms.tolist()[::-1]:
+                candidates = (morton[pending] >> np.uint64(2 * (max_zoom - zoom))) << np.uint64(_shifts(zoom))
+                candidates |= np.uint64(zoom)
+                hits = self._contains_keys(candidates)
+                keys[pending[hits]] = candidates[hits]
+                found[pending[hits]] = True
+                pending = pending[~hits]
+                if not len(pending):
+                    break
+        return TileArray.from_quad_key_int(keys, validate=False), found
+
+    def union(self, other):
+        """Gets the tiles in this or the other tile set"""
+        np = require_numpy()
+        return self._from_sorted(np.union1d(self.quad_key_int, other.quad_key_int))
+
+    def intersection(self, other):
+        """Gets the tiles in this and the other tile set"""
+        np = require_numpy()
+        return self._from_sorted(np.intersect1d(self.quad_key_int, other.quad_key_int, assume_unique=True))
+
+    def difference(self, other):
+        """Gets the tiles in this but not in the other tile set"""
+        np = require_numpy()
+        return self._from_sorted(np.setdiff1d(self.quad_key_int, other.quad_key_int, assume_unique=True))
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def __len__(self):
+        return len(self.quad_key_int)
+
+    def __iter__(self):
+        return iter(self.to_tile_array())
+
+    def __contains__(self, tile):
+        np = require_numpy()
+        if tile.zoom > QUAD_KEY_MAX_ZOOM:
+            return False
+        quad_key_int = tile.quad_key_int
+        index = self.quad_key_int.searchsorted(np.uint64(quad_key_int))
+        return index < len(self) and int(self.quad_key_int[index]) == quad_key_int
+
+    def __eq__(self, other):
+        np = require_numpy()
+        return isinstance(other, TileSet) and np.array_equal(self.quad_key_int, other.quad_key_int)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return 'TileSet(size={})'.format(len(self))
+
+
+__all__ = ['TileSet']
@@ -0,0 +1,76 @@
+"""Formatting of tiles into the URLs of tile servers and the paths of tile stores
+
+Templates hold the placeholders {z} for the zoom, {x} and {y} for X Y in the Google (XYZ) format, {-y} for Y in the
+TMS format, {q} for the QuadTree, {s} for a subdomain and {x_shards} and {y_shards} for X and Google Y zero padded
+to 9 digits and split into directories of 3 digits. Format specifications like {z:02d} work as in str.format.
+"""
+import re
+from string import Formatter
+
+from .tile_array import TileArray
+from .validation import check
+
+XYZ = '{z}/{x}/{y}'
+TMS = '{z}/{x}/{-y}'
+QUAD_TREE = '{q}'
+SHARDED = '{z:02d}/{x_shards}/{y_shards}'
+LAYOUTS = {'xyz': XYZ, 'tms': TMS, 'quad_tree': QUAD_TREE, 'sharded': SHARDED}
+
+_TMS_Y_PATTERN = re.compile(r'\{-y([:!}])')
+_FIELDS = ('z', 'x', 'y', 'tms_y', 'q', 's', 'x_shards', 'y_shards')
+
+
+def _shards(value):
+    digits = '{:09d}'.format(value)
+    return '/'.join((digits[:-6], digits[-6:-3], digits[-3:]))
+
+
+class TileUrlTemplate(object):
+    """Template of URLs or paths of tiles, see the module for the placeholders"""
+
+    __slots__ = ('template', 'subdomains', '_format', '_fields')
+
+    def __init__(self, template, subdomains=()):
+        self.template = LAYOUTS.get(template, template)
+        self.subdomains = tuple(subdomains)
+        template = _TMS_Y_PATTERN.sub(r'{tms_y\1', self.template)
+        self._format = template.format
+        self._fields = frozenset(field for _, field, _, _ in Formatter().parse(template) if field is not None)
+        unknown = self._fields - set(_FIELDS)
+        check(not unknown, 'Template placeholders need to be any of {}, not {}.'.format(
+            ', '.join('{' + ('-y' if field == 'tms_y' else field) + '}' for field in _FIELDS),
+            ', '.join(sorted(unknown))))
+        check('s' not in self._fields or bool(self.subdomains), 'Template placeholder {s} needs subdomains.')
+
+    def format(self, tile):
+        """Gets the URL or path of a tile"""
+        tms_x, tms_y, zoom = tile
+        return self._format_values(tms_x, tms_y, zoom, tile.quad_tree if 'q' in self._fields else None)
+
+    def _format_values(self, tms_x, tms_y, zoom, quad_tree):
+        google_y = (1 << zoom) - 1 - tms_y
+        values = {'z': zoom, 'x': tms_x, 'y': google_y, 'tms_y': tms_y, 'q': quad_tree}
+        if 's' in self._fields:
+            values['s'] = self.subdomains[(tms_x + google_y) % len(self.subdomains)]
+        if 'x_shards' in self._fields:
+            values['x_shards'] = _shards(tms_x)
+        if 'y_shards' in self._fields:
+            values['y_shards'] = _shards(google_y)
+        return self._format(**values)
+
+    def format_tiles(self, tiles):
+        """Yields the URLs or paths of an iterable of tiles or of a TileArray, whose columns are converted at once"""
+        if isinstance(tiles, TileArray):
+            quad_trees = tiles.quad_tree.tolist() if 'q' in self._fields else [None] * len(tiles)
+            for tms_x, tms_y, zoom, quad_tree in zip(tiles.tms_x.tolist(), tiles.tms_y.tolist(), tiles.zoom.tolist(),
+                                                     quad_trees):
+                yield self._format_values(tms_x, tms_y, zoom, quad_tree)
+        else:
+            for tile in tiles:
+                yield self.format(tile)
+
+    def __repr__(self):
+        return 'TileUrlTemplate({!r})'.format(self.template)
+
+
+__all__ = ['TileUrlTemplate', 'XYZ', 'TMS', 'QUAD_TREE', 'SHARDED', 'LAYOUTS']
@@ -0,0 +1,111 @@
+import threading
+from contextlib import contextmanager
+
+from .meta import DEFAULT_TILE_GRID, ORIGIN_SHIFT
+from .compat import require_numpy
+
+_context = threading.local()
+_MAX_REPORTED_INDICES = 10
+
+
+class ValidationError(ValueError):
+    """Raised for values out of range, indices holds the offending positions when arrays were validated"""
+
+    def __init__(self, message, indices=None):
+        super(ValidationError, self).__init__(message)
+        self.indices = indices
+
+
+def is_enabled(validate=None):
+    """Gets whether to validate, validate of a single call overrides the policy of the current context"""
+    if validate is None:
+        return getattr(_context, 'validate', True)
+    return validate
+
+
+@contextmanager
+def validation(validate=True):
+    """Context manager setting the validation policy of the current thread, validate=False skips all range checks"""
+    previous = getattr(_context, 'validate', True)
+    _context.validate = validate
+    try:
+        yield
+    finally:
+        _context.validate = previous
+
+
+def unchecked():
+    """Context manager skipping the validation of already validated values, e.g. in trusted pipelines"""
+    return validation(validate=False)
+
+
+def check(condition, message):
+    """Raises a ValidationError with message if condition is false"""
+    if not condition:
+        raise ValidationError(message)
+
+
+def check_array(valid, message):
+    """Raises a ValidationError reporting the indices of all false values of the boolean array valid"""
+    np = require_numpy()
+    indices = np.flatnonzero(~np.asarray(valid, dtype=bool))
+    if len(indices):
+        shown = ', '.join(str(index) for index in indices[:_MAX_REPORTED_INDICES])
+        more = ', ...' if len(indices) > _MAX_REPORTED_INDICES else ''
+        raise ValidationError('{} Invalid at {} indices: {}{}'.format(message, len(indices), shown, more),
+                              indices=indices)
+
+
+def _latitude_longitude_masks(latitudes, longitudes):
+    return (-90.0 <= latitudes) & (latitudes <= 90.0), (-180.0 <= longitudes) & (longitudes <= 180.0)
+
+
+def _meters_masks(meters_x, meters_y):
+    return ((-ORIGIN_SHIFT <= meters_x) & (meters_x <= ORIGIN_SHIFT),
+            (-ORIGIN_SHIFT <= meters_y) & (meters_y <= ORIGIN_SHIFT))
+
+
+def _pixels_masks(pixels_x, pixels_y, zooms, grid=DEFAULT_TILE_GRID):
+    np = require_numpy()
+    map_size = np.left_shift(1, np.asarray(zooms, dtype=np.int64)) * grid.tile_size
+    return (0 <= pixels_x) & (pixels_x <= map_size), (0 <= pixels_y) & (pixels_y <= map_size)
+
+
+def _tiles_masks(tiles_x, tiles_y, zooms):
+    np = require_numpy()
+    max_tile = np.left_shift(1, np.asarray(zooms, dtype=np.int64)) - 1
+    return (0 <= tiles_x) & (tiles_x <= max_tile), (0 <= tiles_y) & (tiles_y <= max_tile)
+
+
+def _invalid_indices(masks):
+    np = require_numpy()
+    valid_x, valid_y = masks
+    return np.flatnonzero(~(valid_x & valid_y))
+
+
+def invalid_latitude_longitude(latitudes, longitudes):
+    """Gets the indices of all invalid lat/lon in WGS84 of two arrays in one pass"""
+    np = require_numpy()
+    return _invalid_indices(_latitude_longitude_masks(np.asarray(latitudes), np.asarray(longitudes)))
+
+
+def invalid_meters(meters_x, meters_y):
+    """Gets the indices of all invalid X Y meters in Spherical Mercator of two arrays in one pass"""
+    np = require_numpy()
+    return _invalid_indices(_meters_masks(np.asarray(meters_x), np.asarray(meters_y)))
+
+
+def invalid_pixels(pixels_x, pixels_y, zooms, grid=DEFAULT_TILE_GRID):
+    """Gets the indices of all invalid pixels X Y Z (zoom) of the tile grid of three arrays in one pass"""
+    np = require_numpy()
+    return _invalid_indices(_pixels_masks(np.asarray(pixels_x), np.asarray(pixels_y), zooms, grid=grid))
+
+
+def invalid_tiles(tiles_x, tiles_y, zooms):
+    """Gets the indices of all invalid TMS or Google X Y and zoom of three arrays in one pass"""
+    np = require_numpy()
+    return _invalid_indices(_tiles_masks(np.asarray(tiles_x), np.asarray(tiles_y), zooms))
+
+
+__all__ = ['ValidationError', 'validation', 'unchecked', 'invalid_latitude_longitude', 'invalid_meters',
+           'invalid_pixels', 'invalid_tiles']
@@ -14,5 +14,11 @@ setup(
     author_email='geometalab@hsr.ch',
     url='https://github.com/geometalab/pyGeoTile',
     license='MIT',
-    packages=find_packages(exclude=('tests', 'docs'))
+    packages=find_packages(exclude=('tests', 'docs', 'benchmarks')),
+    extras_require={
+        'numpy': ['numpy'],
+    },
+    entry_points={
+        'console_scripts': ['pygeotile = pygeotile.cli:main [numpy]'],
+    }
 )
@@ -1,5 +1,10 @@
+import sys
+
 import pytest
 
+# Test modules using async syntax and asyncio.run fail to even collect on Pythons before 3.7
+collect_ignore = ['test_aio.py'] if sys.version_info < (3, 7) else []
+
 '''
 Chicago, IL
 LatLng: (41.85, -87.64999999999998)
@@ -0,0 +1,132 @@
+import pickle
+from collections import Counter
+
+import pytest
+from pygeotile.tile import Tile
+from pygeotile.meta import TileGrid
+
+np = pytest.importorskip('numpy')
+from pygeotile.aggregate import TileCounts  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def points():
+    random = np.random.RandomState(21)
+    return random.normal(41.85, 0.05, 3000), random.normal(-87.65, 0.05, 3000), random.uniform(0.0, 2.0, 3000)
+
+
+def expected_counts(latitudes, longitudes, zooms, weights=None):
+    weights = [1] * len(latitudes) if weights is None else weights
+    counts = Counter()
+    for latitude, longitude, weight in zip(latitudes.tolist(), longitudes.tolist(), list(weights)):
+        for tile in Tile.for_latitude_longitude_all_zooms(latitude, longitude, min_zoom=0, max_zoom=max(zooms)):
+            if tile.zoom in zooms:
+                counts[tile] += weight
+    return counts
+
+
+def test_add(points):
+    latitudes, longitudes, _ = points
+
+    tile_counts = TileCounts(zooms=[14, 10, 16]).add(latitudes=latitudes, longitudes=longitudes)
+
+    assert tile_counts.zooms == (10, 14, 16)
+    assert dict(tile_counts.items()) == expected_counts(latitudes, longitudes, zooms=(10, 14, 16))
+    assert tile_counts.values.dtype == np.int64
+    assert tile_counts.values[tile_counts.quad_key_int & 31 == 10].sum() == len(latitudes)
+
+
+def test_add_weighted(points):
+    latitudes, longitudes, weights = points
+
+    tile_counts = TileCounts(zooms=12, weighted=True).add(latitudes=latitudes, longitudes=longitudes, weights=weights)
+
+    expected = expected_counts(latitudes, longitudes, zooms=(12,), weights=weights.tolist())
+    assert set(dict(tile_counts.items())) == set(expected)
+    assert all(value == pytest.approx(expected[tile]) for tile, value in tile_counts.items())
+    with pytest.raises(ValueError):
+        tile_counts.add(latitudes=latitudes, longitudes=longitudes)
+    with pytest.raises(ValueError):
+        TileCounts(zooms=12).add(latitudes=latitudes, longitudes=longitudes, weights=weights)
+
+
+def test_incremental_batches_and_merge(points):
+    latitudes, longitudes, _ = points
+    whole = TileCounts(zooms=(8, 15)).add(latitudes=latitudes, longitudes=longitudes)
+
+    batched = TileCounts(zooms=(8, 15))
+    for start in range(0, len(latitudes), 100):
+        batched.add(latitudes=latitudes[start:start + 100], longitudes=longitudes[start:start + 100])
+    first = TileCounts(zooms=(8, 15)).add(latitudes=latitudes[:1000], longitudes=longitudes[:1000])
+    second = TileCounts(zooms=(8, 15)).add(latitudes=latitudes[1000:], longitudes=longitudes[1000:])
+    merged = first.merge(pickle.loads(pickle.dumps(second)))
+
+    for tile_counts in (batched, merged):
+        assert tile_counts.quad_key_int.tolist() == whole.quad_key_int.tolist()
+        assert tile_counts.values.tolist() == whole.values.tolist()
+
+
+def test_numpy_zooms():
+    assert TileCounts(zooms=np.int64(5)).zooms == (5,)
+    assert TileCounts(zooms=np.array([12, 3, 12], dtype=np.uint8)).zooms == (3, 12)
+    assert type(TileCounts(zooms=np.uint8(7)).zooms[0]) is int
+
+
+def test_merge_needs_same_zooms(points):
+    latitudes, longitudes, _ = points
+    tile_counts = TileCounts(zooms=10).add(latitudes=latitudes, longitudes=longitudes)
+
+    with pytest.raises(ValueError):
+        tile_counts.merge(TileCounts(zooms=12).add(latitudes=latitudes, longitudes=longitudes))
+    with pytest.raises(ValueError):
+        tile_counts.merge(TileCounts(zooms=10, grid=TileGrid(tile_size=512)))
+    assert tile_counts.values.sum() == len(latitudes)
+
+
+def test_rollup(points):
+    latitudes, longitudes, _ = points
+    tile_counts = TileCounts(zooms=16).add(latitudes=latitudes, longitudes=longitudes)
+
+    rolled_up = tile_counts.rollup(min_zoom=5)
+
+    assert rolled_up.zooms == tuple(range(5, 17))
+    assert dict(rolled_up.items()) == expected_counts(latitudes, longitudes, zooms=range(5, 17))
+    with pytest.raises(ValueError):
+        tile_counts.rollup(min_zoom=17)
+
+
+def test_get_and_at_zoom(points, chicago_latitude_longitude):
+    latitudes, longitudes, _ = points
+    tile_counts = TileCounts(zooms=(3, 9)).add(latitudes=latitudes, longitudes=longitudes)
+    tile = Tile.for_latitude_longitude(*chicago_latitude_longitude, zoom=3)
+
+    assert tile_counts[tile] == len(latitudes)
+    assert tile_counts.get(Tile.from_quad_tree('3')) == 0
+    assert tile_counts.get(Tile.from_tms(tms_x=0, tms_y=0, zoom=30), default=None) is None
+    tile_array, counts = tile_counts.at_zoom(3)
+    assert tile_array.to_tiles() == [tile]
+    assert counts.tolist() == [len(latitudes)]
+
+
+def test_from_quad_key_int():
+    keys = [Tile.from_quad_tree('01').quad_key_int, Tile.from_quad_tree('0').quad_key_int,
+            Tile.from_quad_tree('01').quad_key_int]
+
+    tile_counts = TileCounts.from_quad_key_int(keys, [1, 2, 3])
+
+    assert tile_counts.zooms == (1, 2)
+    assert dict(tile_counts.items()) == {Tile.from_quad_tree('0'): 2, Tile.from_quad_tree('01'): 4}
+
+
+def test_validation():
+    with pytest.raises(ValueError) as assertion_info:
+        TileCounts(zooms=10).add(latitudes=[0.0, 95.0], longitudes=[0.0, 0.0])
+    assert assertion_info.value.indices.tolist() == [1]
+    with pytest.raises(ValueError):
+        TileCounts(zooms=30)
+    with pytest.raises(ValueError):
+        TileCounts(zooms=[])
+
+
+def test_repr():
+    assert repr(TileCounts(zooms=(3, 5))) == 'TileCounts(zooms=(3, 5), tiles=0)'
@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+from pygeotile.tile import Tile, tiles_for_bounds
+from pygeotile.aio import fetch_tiles
+
+
+def collect(async_iterable):
+    async def gather():
+        return [item async for item in async_iterable]
+    return asyncio.run(gather())
+
+
+def test_fetch_tiles_bounded_concurrency():
+    tiles = list(tiles_for_bounds(45.8, 5.9, 47.8, 10.5, min_zoom=0, max_zoom=8))
+    running, peak, taken = [0], [0], []
+
+    def lazy_tiles():
+        for tile in tiles:
+            taken.append(tile)
+            yield tile
+
+    async def fetch(url):
+        running[0] += 1
+        peak[0] = max(peak[0], running[0])
+        assert len(taken) - len(results) <= 4
+        await asyncio.sleep(0.001 * (hash(url) % 3))
+        running[0] -= 1
+        return url
+
+    results = []
+
+    async def consume():
+        async for tile, url in fetch_tiles(lazy_tiles(), fetch, template='{z}/{x}/{y}', concurrency=4):
+            results.append((tile, url))
+
+    asyncio.run(consume())
+
+    assert peak[0] == 4
+    assert sorted(results) == sorted((tile, '{}/{}/{}'.format(tile.zoom, *tile.google)) for tile in tiles)
+
+
+def test_fetch_tiles_async_iterable():
+    async def tiles():
+        for quad_tree in ('0', '1', '12'):
+            await asyncio.sleep(0)
+            yield Tile.from_quad_tree(quad_tree)
+
+    async def fetch(url):
+        return len(url)
+
+    results = collect(fetch_tiles(tiles(), fetch, template='quad_tree', concurrency=2))
+
+    assert sorted(results) == sorted([(Tile.from_quad_tree('0'), 1), (Tile.from_quad_tree('1'), 1),
+                                      (Tile.from_quad_tree('12'), 2)])
+
+
+def test_fetch_tiles_error_cancels():
+    cancelled = []
+
+    async def fetch(url):
+        if url == '1/0/0':
+            raise IOError(url)
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(url)
+            raise
+
+    with pytest.raises(IOError):
+        collect(fetch_tiles(Tile.from_quad_tree('').children(), fetch, template='xyz', concurrency=4))
+    assert sorted(cancelled) == ['1/0/1', '1/1/0', '1/1/1']
+    with pytest.raises(ValueError):
+        collect(fetch_tiles([], fetch, template='xyz', concurrency=0))
+
+
+def test_fetch_tiles_stub_server():
+    async def handle(reader, writer):
+        request_line = (await reader.readline()).decode()
+        while (await reader.readline()) not in (b'\r\n', b''):
+            pass
+        body = request_line.split()[1].encode()
+        writer.write(b'HTTP/1.0 200 OK\r\nContent-Length: ' + str(len(body)).encode() + b'\r\n\r\n' + body)
+        await writer.drain()
+        writer.close()
+
+    async def run():
+        server = await asyncio.start_server(handle, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+
+        async def fetch(url):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write('GET {} HTTP/1.0\r\n\r\n'.format(url).encode())
+            response = await reader.read()
+            writer.close()
+            return response.split(b'\r\n\r\n', 1)[1].decode()
+
+        tiles = list(tiles_for_bounds(47.0, 8.0, 47.5, 8.5, min_zoom=10, max_zoom=11))
+        try:
+            results = [result async for result in fetch_tiles(tiles, fetch, template='/tiles/{z}/{x}/{-y}.png',
+                                                              concurrency=3)]
+        finally:
+            server.close()
+            await server.wait_closed()
+        return tiles, results
+
+    tiles, results = asyncio.run(run())
+
+    assert sorted(results) == sorted((tile, '/tiles/{}/{}/{}.png'.format(tile.zoom, tile.tms_x, tile.tms_y))
+                                     for tile in tiles)
@@ -0,0 +1,20 @@
+import pytest
+from benchmarks.cases import all_cases
+from benchmarks.run import regressions
+
+
+@pytest.mark.parametrize("case", all_cases(), ids=lambda case: case.name)
+def test_case_runs(case):
+    if case.name.startswith(('batch', 'query')):
+        pytest.importorskip('numpy')
+    namespace = {}
+
+    exec(case.setup, namespace)
+    exec(case.statement, namespace)
+
+
+def test_regressions():
+    baseline = {'fast': 100.0, 'slow': 100.0}
+    results = {'fast': 120.0, 'slow': 200.0, 'new': 1000.0}
+
+    assert regressions(results, baseline, threshold=1.5) == [('slow', 2.0)]
@@ -0,0 +1,81 @@
+import pytest
+from pygeotile.point import Point
+from pygeotile.tile import Tile
+
+np = pytest.importorskip('numpy')
+from pygeotile import binary  # noqa: E402
+from pygeotile.tile_array import TileArray  # noqa: E402
+from pygeotile.tile_set import TileSet  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def tile_array():
+    random = np.random.RandomState(24)
+    zoom = random.randint(0, 30, 1000)
+    return TileArray(tms_x=random.randint(0, 2 ** 30, 1000) % (1 << zoom),
+                     tms_y=random.randint(0, 2 ** 30, 1000) % (1 << zoom), zoom=zoom)
+
+
+def test_tiles(tile_array):
+    packed = binary.pack_tiles(tile_array)
+
+    unpacked = binary.unpack(packed)
+
+    assert len(packed) == 16 + 9 * len(tile_array)
+    assert unpacked.to_tiles() == tile_array.to_tiles()
+    assert binary.unpack(binary.pack_tiles(tile_array.to_tiles())).to_tiles() == tile_array.to_tiles()
+    assert not unpacked.tms_x.flags.owndata
+    assert len(binary.unpack(binary.pack_tiles([]))) == 0
+
+
+def test_points():
+    points = [Point.from_latitude_longitude(41.85, -87.65), Point.from_latitude_longitude(-33.86, 151.21)]
+
+    latitudes, longitudes = binary.unpack(memoryview(binary.pack_points(points)))
+
+    assert [Point.from_latitude_longitude(*values) for values in zip(latitudes, longitudes)] == points
+    assert binary.pack_latitude_longitude(latitudes, longitudes) == binary.pack_points(points)
+    with pytest.raises(ValueError):
+        binary.pack_latitude_longitude([0.0, 1.0], [0.0])
+
+
+def test_quad_key_int(tile_array):
+    quad_key_int = tile_array.quad_key_int
+    keys = [Tile.from_quad_tree(quad_tree).quad_key_int for quad_tree in ('', '3', '01', '0', '3', '00')]
+
+    unpacked = binary.unpack(binary.pack_quad_key_int(quad_key_int))
+
+    assert sorted(unpacked.tolist()) == sorted(quad_key_int.tolist())
+    assert (unpacked & 31).tolist() == sorted((quad_key_int & 31).tolist())
+    unpacked_keys = binary.unpack(binary.pack_quad_key_int(keys)).tolist()
+    assert [Tile.from_quad_key_int(key).quad_tree for key in unpacked_keys] == ['', '0', '3', '3', '00', '01']
+    assert binary.unpack(binary.pack_quad_key_int([])).tolist() == []
+    with pytest.raises(ValueError):
+        binary.pack_quad_key_int([30])
+
+
+def test_dense_quad_key_int():
+    tile_array = TileSet.from_tiles(Tile.from_quad_tree('1202').descendants(max_zoom=12)).to_tile_array()
+
+    packed = binary.pack_quad_key_int(tile_array.quad_key_int)
+
+    assert len(packed) < 16 + 1.01 * len(tile_array)
+    assert sorted(binary.unpack(packed).tolist()) == tile_array.quad_key_int.tolist()
+
+
+def test_load(tmpdir, tile_array):
+    path = str(tmpdir.join('tiles.bin'))
+    with open(path, 'wb') as binary_file:
+        binary_file.write(binary.pack_tiles(tile_array))
+
+    loaded = binary.load(path)
+
+    assert loaded.to_tiles() == tile_array.to_tiles()
+    assert not loaded.zoom.flags.writeable
+
+
+def test_invalid_buffers(tile_array):
+    packed = binary.pack_tiles(tile_array)
+    for buffer in (b'', b'PGTB', b'JSON' + packed[4:], packed[:-1], binary.pack_quad_key_int([200])[:-1]):
+        with pytest.raises(ValueError):
+            binary.unpack(buffer)
@@ -0,0 +1,52 @@
+import pytest
+from pygeotile.tile import Tile
+from pygeotile.validation import ValidationError
+
+np = pytest.importorskip('numpy')
+bulk = pytest.importorskip('pygeotile.bulk')
+from pygeotile.tile_array import TileArray  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def latitudes_longitudes():
+    random = np.random.RandomState(7)
+    return random.uniform(-85.0, 85.0, 5000), random.uniform(-179.0, 179.0, 5000)
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, 1000), (3, 1000), (2, 10 ** 6)])
+def test_tiles_for_latitude_longitude(latitudes_longitudes, workers, chunk_size):
+    latitudes, longitudes = latitudes_longitudes
+
+    tms_x, tms_y, zoom = bulk.tiles_for_latitude_longitude(latitudes, longitudes, zoom=14, workers=workers,
+                                                           chunk_size=chunk_size)
+
+    expected_x, expected_y, expected_zoom = Tile.for_latitude_longitude_array(latitudes, longitudes, zoom=14)
+    assert np.array_equal(tms_x, expected_x)
+    assert np.array_equal(tms_y, expected_y)
+    assert np.array_equal(zoom, expected_zoom)
+
+
+def test_bounds_for_tiles(latitudes_longitudes):
+    latitudes, longitudes = latitudes_longitudes
+    tms_x, tms_y, zoom = Tile.for_latitude_longitude_array(latitudes, longitudes, zoom=9)
+
+    (latitude_min, longitude_min), (latitude_max, longitude_max) = bulk.bounds_for_tiles(
+        tms_x, tms_y, zoom=9, workers=2, chunk_size=999)
+
+    expected_min, expected_max = TileArray(tms_x=tms_x, tms_y=tms_y, zoom=zoom).bounds
+    assert np.array_equal(latitude_min, expected_min[0]) and np.array_equal(longitude_min, expected_min[1])
+    assert np.array_equal(latitude_max, expected_max[0]) and np.array_equal(longitude_max, expected_max[1])
+    point_min, point_max = Tile.from_tms(int(tms_x[42]), int(tms_y[42]), 9).bounds
+    assert (latitude_min[42], longitude_min[42]) == point_min.latitude_longitude
+    assert (latitude_max[42], longitude_max[42]) == point_max.latitude_longitude
+
+
+def test_validation_reports_global_indices(latitudes_longitudes):
+    latitudes, longitudes = latitudes_longitudes
+    latitudes = latitudes.copy()
+    latitudes[[10, 4321]] = 95.0
+
+    with pytest.raises(ValidationError) as error_info:
+        _ = bulk.tiles_for_latitude_longitude(latitudes, longitudes, zoom=3, workers=2, chunk_size=1000)
+
+    assert error_info.value.indices.tolist() == [10, 4321]
@@ -0,0 +1,81 @@
+import threading
+
+import pytest
+from pygeotile.cache import TileCache
+from pygeotile.compat import _lru_cache
+from pygeotile.tile import Tile
+from pygeotile.validation import ValidationError
+
+
+def test_for_latitude_longitude(chicago_latitude_longitude, chicago_zoom, chicago_tms):
+    latitude, longitude = chicago_latitude_longitude
+    cache = TileCache()
+
+    tiles = [cache.for_latitude_longitude(latitude=latitude, longitude=longitude, zoom=chicago_zoom)
+             for _ in range(3)]
+    tiles.append(cache.for_latitude_longitude(latitude=latitude + 1e-9, longitude=longitude, zoom=chicago_zoom))
+
+    assert all(tile.tms == chicago_tms for tile in tiles)
+    info = cache.cache_info()['for_latitude_longitude']
+    assert (info.hits, info.misses, info.currsize) == (3, 1, 1)
+
+
+def test_bounds(chicago_quad_tree):
+    tile = Tile.from_quad_tree(chicago_quad_tree)
+    cache = TileCache()
+
+    assert cache.bounds(tile) == tile.bounds
+    assert cache.bounds(tile) == tile.bounds
+    info = cache.cache_info()['bounds']
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_max_size_and_clear():
+    cache = TileCache(max_size=2)
+
+    for longitude in (1.0, 2.0, 3.0, 1.0):
+        _ = cache.for_latitude_longitude(latitude=0.0, longitude=longitude, zoom=10)
+
+    info = cache.cache_info()['for_latitude_longitude']
+    assert (info.hits, info.misses, info.currsize) == (0, 4, 2)
+    cache.clear()
+    info = cache.cache_info()['for_latitude_longitude']
+    assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
+
+
+def test_invalid_not_cached():
+    cache = TileCache()
+
+    with pytest.raises(ValidationError):
+        _ = cache.for_latitude_longitude(latitude=91.0, longitude=0.0, zoom=1)
+
+    assert cache.cache_info()['for_latitude_longitude'].currsize == 0
+
+
+def test_threads():
+    cache = TileCache(max_size=16)
+    expected = [Tile.for_latitude_longitude(latitude=45.0, longitude=index, zoom=12) for index in range(32)]
+    results = []
+
+    def lookup():
+        results.append([cache.for_latitude_longitude(latitude=45.0, longitude=index, zoom=12) for index in range(32)])
+
+    threads = [threading.Thread(target=lookup) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [expected] * 8
+    assert cache.cache_info()['for_latitude_longitude'].currsize == 16
+
+
+def test_python_2_lru_cache():
+    calls = []
+    square = _lru_cache(maxsize=2)(lambda value: calls.append(value) or value * value)
+
+    assert [square(2), square(3), square(2), square(4), square(3)] == [4, 9, 4, 16, 9]
+    assert calls == [2, 3, 4, 3]
+    assert tuple(square.cache_info()) == (1, 4, 2, 2)
+    square.cache_clear()
+    assert tuple(square.cache_info()) == (0, 0, 2, 0)
@@ -0,0 +1,104 @@
+import io
+
+import pytest
+from pygeotile.tile import Tile
+
+pytest.importorskip('numpy')
+from pygeotile.cli import main  # noqa: E402
+
+
+@pytest.fixture()
+def csv_file(tmpdir, chicago_latitude_longitude):
+    path = tmpdir.join('points.csv')
+    path.write('id,lat,lon\n1,{0},{1}\n2,47.0,8.0\n3,{0},{1}\n'.format(*chicago_latitude_longitude))
+    return str(path)
+
+
+def run(arguments):
+    output = io.StringIO()
+    return main(arguments, output=output), output.getvalue().splitlines()
+
+
+def test_csv_tms(csv_file, chicago_tms, chicago_zoom):
+    tms_x, tms_y = chicago_tms
+    swiss = Tile.for_latitude_longitude(latitude=47.0, longitude=8.0, zoom=chicago_zoom)
+
+    exit_code, lines = run(['--header', '--fields', '1,2', '--zooms', '19', '--batch-size', '2', csv_file])
+
+    assert exit_code == 0
+    assert lines == ['19/{}/{}'.format(tms_x, tms_y), '19/{}/{}'.format(swiss.tms_x, swiss.tms_y),
+                     '19/{}/{}'.format(tms_x, tms_y)]
+
+
+def test_multiple_zooms_quad_tree(csv_file, chicago_quad_tree):
+    _, lines = run(['--header', '--fields', '1,2', '--zooms', '7,19', '--tile-format', 'quad_tree', csv_file])
+
+    assert lines[0] == '{},{}'.format(chicago_quad_tree[:7], chicago_quad_tree)
+
+
+def test_count(csv_file, chicago_quad_tree):
+    _, lines = run(['--header', '--fields', '1,2', '--zooms', '19', '--tile-format', 'quad_tree', '--count', csv_file])
+
+    assert '{},2'.format(chicago_quad_tree) in lines
+    assert len(lines) == 2
+
+
+def test_ndjson_meters(tmpdir, chicago_meters, chicago_google):
+    path = tmpdir.join('points.ndjson')
+    path.write('{{"x": {}, "y": {}}}\n'.format(*chicago_meters))
+
+    _, lines = run(['--input-format', 'ndjson', '--coordinates', 'meters', '--tile-format', 'google', '--zooms', '19',
+                    str(path)])
+
+    assert lines == ['19/{}/{}'.format(*chicago_google)]
+
+
+def test_map_edges(tmpdir):
+    path = tmpdir.join('points.csv')
+    path.write('0,-180\n0,180\n90,0\n-90,0\n85.06,0\n')
+
+    _, lines = run(['--zooms', '2', str(path)])
+    _, google_lines = run(['--zooms', '2', '--tile-format', 'google', str(path)])
+    _, count_lines = run(['--zooms', '2', '--count', str(path)])
+
+    assert lines == ['2/0/2', '2/3/2', '2/1/3', '2/1/0', '2/1/3']
+    assert google_lines == ['2/0/1', '2/3/1', '2/1/0', '2/1/3', '2/1/0']
+    assert sorted(count_lines) == ['2/0/2,1', '2/1/0,1', '2/1/3,2', '2/3/2,1']
+
+
+def test_invalid_records(tmpdir):
+    path = tmpdir.join('points.csv')
+    path.write('10.0,10.0\nnot,a number\n95.0,0.0\n20.0,20.0\n')
+
+    exit_code, lines = run(['--zooms', '3', str(path)])
+    assert exit_code == 1
+    assert lines == []
+
+    exit_code, lines = run(['--zooms', '3', '--skip-invalid', str(path)])
+    assert exit_code == 0
+    assert len(lines) == 2
+
+
+@pytest.mark.parametrize("arguments, message", [
+    (['--zooms', '33'], '--zooms need to be values between 0 and 32'),
+    (['--zooms', '3,-1'], '--zooms need to be values between 0 and 32'),
+    (['--zooms', '3,a'], '--zooms needs comma separated integers'),
+    (['--zooms', '30', '--tile-format', 'quad_key_int'], 'quad_key_int support zooms up to 29'),
+    (['--zooms', '30', '--count'], 'quad_key_int support zooms up to 29'),
+    (['--batch-size', '0'], '--batch-size needs to be greater than 0'),
+    (['--batch-size', '-1'], '--batch-size needs to be greater than 0'),
+])
+def test_invalid_arguments(csv_file, capsys, arguments, message):
+    with pytest.raises(SystemExit) as exit_info:
+        run(arguments + [csv_file])
+
+    assert exit_info.value.code == 2
+    assert message in capsys.readouterr().err
+
+
+def test_highest_zoom(csv_file, chicago_quad_tree):
+    exit_code, lines = run(['--header', '--fields', '1,2', '--zooms', '32', '--tile-format', 'quad_tree', csv_file])
+
+    assert exit_code == 0
+    assert len(lines[0]) == 32
+    assert lines[0].startswith(chicago_quad_tree)
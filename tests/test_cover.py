@@ -0,0 +1,87 @@
+import pytest
+from pygeotile.cover import tiles_for_polygon
+from pygeotile.tile import Tile, tiles_for_bounds
+
+
+@pytest.fixture(scope='module')
+def square():
+    return {'type': 'Polygon', 'coordinates': [[[8.0, 47.0], [9.0, 47.0], [9.0, 48.0], [8.0, 48.0], [8.0, 47.0]]]}
+
+
+@pytest.fixture(scope='module')
+def triangle():
+    return {'type': 'Polygon', 'coordinates': [[[0.0, 0.0], [0.0, 20.0], [20.0, 0.0], [0.0, 0.0]]]}
+
+
+def test_square_equals_bounds(square):
+    tiles = list(tiles_for_polygon(square, min_zoom=0, max_zoom=10))
+
+    assert len(tiles) == len(set(tiles))
+    assert set(tiles) == set(tiles_for_bounds(47.0, 8.0, 48.0, 9.0, min_zoom=10, max_zoom=10))
+
+
+def test_triangle_prunes(triangle):
+    tiles = set(tiles_for_polygon(triangle, min_zoom=0, max_zoom=9))
+    bounds_tiles = set(tiles_for_bounds(0.0, 0.0, 20.0, 20.0, min_zoom=9, max_zoom=9))
+
+    assert tiles < bounds_tiles
+    assert Tile.for_latitude_longitude(latitude=2.0, longitude=2.0, zoom=9) in tiles
+    assert Tile.for_latitude_longitude(latitude=18.0, longitude=18.0, zoom=9) not in tiles
+
+
+def test_compact(triangle):
+    tiles = set(tiles_for_polygon(triangle, min_zoom=0, max_zoom=9))
+    compact = list(tiles_for_polygon(triangle, min_zoom=3, max_zoom=9, compact=True))
+
+    assert len(compact) < len(tiles)
+    assert min(tile.zoom for tile in compact) >= 3
+    expanded = set(tile for compact_tile in compact for tile in [compact_tile] + list(compact_tile.descendants(9))
+                   if tile.zoom == 9)
+    assert expanded == tiles
+
+
+def test_hole_and_multi_polygon(square):
+    hole = [[8.25, 47.25], [8.25, 47.75], [8.75, 47.75], [8.75, 47.25], [8.25, 47.25]]
+    polygon = {'type': 'Polygon', 'coordinates': [square['coordinates'][0], hole]}
+    feature = {'type': 'Feature', 'properties': {},
+               'geometry': {'type': 'MultiPolygon', 'coordinates': [polygon['coordinates']]}}
+
+    tiles = set(tiles_for_polygon(polygon, min_zoom=0, max_zoom=11))
+
+    assert Tile.for_latitude_longitude(latitude=47.5, longitude=8.5, zoom=11) not in tiles
+    assert Tile.for_latitude_longitude(latitude=47.1, longitude=8.1, zoom=11) in tiles
+    assert set(tiles_for_polygon(feature, min_zoom=0, max_zoom=11)) == tiles
+
+
+def test_small_polygon():
+    square = {'type': 'Polygon', 'coordinates': [[[8.5, 47.37], [8.507, 47.37], [8.507, 47.377], [8.5, 47.377]]]}
+    (latitude_min, longitude_min), _ = Tile.from_google(google_x=137000, google_y=91000, zoom=18).bounds
+    _, (latitude_max, longitude_max) = Tile.from_google(google_x=137002, google_y=90998, zoom=18).bounds
+    three_by_three = {'type': 'Polygon', 'coordinates': [[
+        [longitude_min, latitude_min], [longitude_max, latitude_min], [longitude_max, latitude_max],
+        [longitude_min, latitude_max]]]}
+
+    tiles = set(tiles_for_polygon(square, min_zoom=0, max_zoom=16))
+
+    assert tiles == set(tiles_for_bounds(47.37, 8.5, 47.377, 8.507, min_zoom=16, max_zoom=16))
+    assert set(tiles_for_polygon(three_by_three, min_zoom=0, max_zoom=18)) == set(
+        Tile.from_google(google_x=google_x, google_y=google_y, zoom=18)
+        for google_x in range(137000, 137003) for google_y in range(90998, 91001))
+
+
+def test_small_hole():
+    hole = [[10.0, 10.0], [10.0, 10.0005], [10.0005, 10.0005], [10.0005, 10.0], [10.0, 10.0]]
+    polygon = {'type': 'Polygon', 'coordinates': [[[0.0, 0.0], [40.0, 0.0], [40.0, 40.0], [0.0, 40.0]], hole]}
+    hole_tile = Tile.for_latitude_longitude(latitude=10.00025, longitude=10.00025, zoom=12)
+
+    compact = list(tiles_for_polygon(polygon, min_zoom=0, max_zoom=12, compact=True))
+
+    assert [tile for tile in compact if hole_tile.quad_tree.startswith(tile.quad_tree)] == [hole_tile]
+    assert min(tile.zoom for tile in compact) < 6
+
+
+def test_assert_geometry():
+    with pytest.raises(ValueError) as assertion_info:
+        _ = list(tiles_for_polygon({'type': 'Point', 'coordinates': [0.0, 0.0]}, min_zoom=0, max_zoom=1))
+
+    assert 'Geometry needs to be a Polygon or MultiPolygon.' in str(assertion_info.value)
@@ -0,0 +1,104 @@
+import sqlite3
+
+import pytest
+from pygeotile.tile import Tile
+from pygeotile.mbtiles import MBTiles
+
+
+@pytest.fixture
+def mbtiles():
+    with MBTiles(':memory:') as mbtiles:
+        mbtiles.write((tile, tile.quad_tree.encode()) for tile in Tile.from_quad_tree('12').descendants(max_zoom=6))
+        mbtiles.write([(Tile.from_quad_tree('12'), b'12'), (Tile.from_quad_tree('3'), b'3')])
+        yield mbtiles
+
+
+def test_write_and_get(mbtiles):
+    tile = Tile.from_quad_tree('1230')
+
+    assert len(mbtiles) == 4 + 16 + 64 + 256 + 2
+    assert mbtiles.get(tile) == b'1230'
+    assert mbtiles.get(Tile.from_quad_tree('0'), default=b'') == b''
+    assert tile in mbtiles
+    assert Tile.from_quad_tree('0') not in mbtiles
+    assert mbtiles.write([(tile, b'replaced')]) == 1
+    assert mbtiles.get(tile) == b'replaced'
+    assert len(mbtiles) == 342
+
+
+def test_tms_rows():
+    tile = Tile.from_google(google_x=1, google_y=0, zoom=1)
+
+    with MBTiles(':memory:') as mbtiles:
+        mbtiles.write([(tile, b'north east')])
+
+        row = mbtiles.connection.execute('SELECT zoom_level, tile_column, tile_row FROM tiles').fetchone()
+    assert row == (1, 1, 1)
+
+
+def test_read_and_existing(mbtiles):
+    tiles = [Tile.from_quad_tree(quad_tree) for quad_tree in ('12', '120', '120', '0', '1203333', '')]
+
+    assert mbtiles.read(tiles) == {Tile.from_quad_tree('12'): b'12', Tile.from_quad_tree('120'): b'120'}
+    assert mbtiles.existing(tiles) == {Tile.from_quad_tree('12'), Tile.from_quad_tree('120')}
+    assert mbtiles.existing([]) == set()
+
+
+def test_delete(mbtiles):
+    assert mbtiles.delete([Tile.from_quad_tree('3'), Tile.from_quad_tree('0')]) == 1
+    assert Tile.from_quad_tree('3') not in mbtiles
+
+
+def test_tiles_and_items(mbtiles):
+    tiles = list(mbtiles.tiles())
+
+    assert tiles == sorted(tiles, key=lambda tile: (tile.zoom, tile.tms))
+    assert set(tiles) == {Tile.from_quad_tree('3')} | set(Tile.from_quad_tree('12').descendants(max_zoom=6)) | \
+        {Tile.from_quad_tree('12')}
+    assert list(mbtiles.tiles(zoom=1)) == [Tile.from_quad_tree('3')]
+    assert [(tile.quad_tree.encode(), data) for tile, data in mbtiles.items(zoom=3)] == \
+        [(data, data) for _, data in mbtiles.items(zoom=3)]
+    assert isinstance(next(mbtiles.items())[0], Tile)
+
+
+def test_within(mbtiles):
+    parent = Tile.from_quad_tree('1230')
+
+    within = list(mbtiles.within(parent))
+
+    assert set(within) == {parent} | set(parent.descendants(max_zoom=6))
+    assert mbtiles.count_within(parent) == len(within) == 21
+    assert list(mbtiles.within(parent, max_zoom=4)) == [parent]
+    assert mbtiles.count_within(Tile.from_quad_tree('0')) == 0
+    assert mbtiles.count_within(Tile.from_quad_tree('')) == len(mbtiles)
+    assert list(MBTiles(':memory:').within(parent)) == []
+
+
+def test_metadata(tmpdir):
+    path = str(tmpdir.join('tiles.mbtiles'))
+    with MBTiles(path) as mbtiles:
+        mbtiles.set_metadata({'name': 'test', 'format': 'png'})
+        mbtiles.set_metadata({'name': 'renamed'})
+        mbtiles.write([(Tile.from_quad_tree('0'), b'0')])
+
+    with MBTiles(path) as mbtiles:
+        assert mbtiles.metadata() == {'name': 'renamed', 'format': 'png'}
+        assert list(mbtiles.tiles()) == [Tile.from_quad_tree('0')]
+        assert repr(mbtiles) == 'MBTiles({!r})'.format(path)
+
+
+def test_existing_schema(tmpdir):
+    path = str(tmpdir.join('view.mbtiles'))
+    connection = sqlite3.connect(path)
+    connection.executescript('''
+        CREATE TABLE map (zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER, tile_id TEXT);
+        CREATE TABLE images (tile_id TEXT, tile_data BLOB);
+        CREATE VIEW tiles AS SELECT zoom_level, tile_column, tile_row, tile_data FROM map JOIN images USING (tile_id);
+        INSERT INTO map VALUES (1, 0, 1, 'a');
+        INSERT INTO images VALUES ('a', 'data');
+    ''')
+    connection.commit()
+    connection.close()
+
+    with MBTiles(path) as mbtiles:
+        assert dict(mbtiles.items()) == {Tile.from_tms(tms_x=0, tms_y=1, zoom=1): 'data'}
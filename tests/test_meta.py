@@ -0,0 +1,30 @@
+import pytest
+from pygeotile.meta import INITIAL_RESOLUTION, MAX_ZOOM, TILE_SIZE, ZOOM_CONSTANTS, TileGrid, resolution, zoom_constants
+
+
+@pytest.mark.parametrize("zoom", range(MAX_ZOOM + 1))
+def test_zoom_constants(zoom):
+    constants = ZOOM_CONSTANTS[zoom]
+
+    assert constants.resolution == INITIAL_RESOLUTION / (2 ** zoom)
+    assert constants.map_size == TILE_SIZE * 2 ** zoom
+    assert constants.max_tile == 2 ** zoom - 1
+    assert constants.half_size == int((TILE_SIZE * 2 ** zoom) / 2)
+    assert zoom_constants(zoom) is constants
+    assert resolution(zoom) == constants.resolution
+
+
+@pytest.mark.parametrize("zoom", [MAX_ZOOM + 1, 40])
+def test_zoom_constants_above_max_zoom(zoom):
+    assert zoom_constants(zoom).max_tile == 2 ** zoom - 1
+    assert resolution(zoom) == INITIAL_RESOLUTION / (2 ** zoom)
+
+
+def test_tile_grid():
+    grid = TileGrid(tile_size=512, max_zoom=20)
+
+    assert len(grid.constants) == 21
+    assert grid.resolution(0) == INITIAL_RESOLUTION / 2
+    assert grid.zoom_constants(3).map_size == 512 * 8
+    assert grid.zoom_constants(3).max_tile == ZOOM_CONSTANTS[3].max_tile
+    assert grid.zoom_constants(25).half_size == 512 * 2 ** 24
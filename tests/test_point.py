@@ -1,7 +1,12 @@
+import array
+import pickle
+
 import pytest
 
-from pygeotile.meta import ORIGIN_SHIFT
-from pygeotile.point import Point
+from pygeotile.meta import ORIGIN_SHIFT, TileGrid
+from pygeotile.point import (Point, latitude_longitude_to_meters, meters_to_latitude_longitude,
+                             latitude_longitude_to_pixels, pixels_to_latitude_longitude, tiles_and_offsets)
+from pygeotile.tile import Tile
 
 
 @pytest.fixture(scope='module')
@@ -91,7 +96,7 @@ def test_meters_to_pixels(meter_x, meter_y, expected):
 def test_assert_longitude(longitude):
     latitude = 0.0
 
-    with pytest.raises(AssertionError) as assertion_info:
+    with pytest.raises(ValueError) as assertion_info:
         _ = Point.from_latitude_longitude(latitude=latitude, longitude=longitude)
 
     assert 'Longitude needs to be a value between -180.0 and 180.0.' in str(assertion_info.value)
@@ -108,7 +113,7 @@ def test_no_assert_longitude(longitude):
 def test_assert_latitude(latitude):
     longitude = 0.0
 
-    with pytest.raises(AssertionError) as assertion_info:
+    with pytest.raises(ValueError) as assertion_info:
         _ = Point.from_latitude_longitude(latitude=latitude, longitude=longitude)
 
     assert 'Latitude needs to be a value between -90.0 and 90.0.' in str(assertion_info.value)
@@ -129,7 +134,7 @@ no_assert_pixels = [(10, 1), (0.1, 1), (512.0, 1), (1024.0, 2)]
 def test_assert_pixel_x(pixel_x, zoom):
     pixel_y = 1
 
-    with pytest.raises(AssertionError) as assertion_info:
+    with pytest.raises(ValueError) as assertion_info:
         _ = Point.from_pixel(pixel_x=pixel_x, pixel_y=pixel_y, zoom=zoom)
 
     assert 'Point X needs to be a value between 0 and (2^zoom) * 256.' in str(assertion_info.value)
@@ -146,7 +151,7 @@ def test_no_assert_pixel_x(pixel_x, zoom):
 def test_assert_pixel_y(pixel_y, zoom):
     pixel_x = 1
 
-    with pytest.raises(AssertionError) as assertion_info:
+    with pytest.raises(ValueError) as assertion_info:
         _ = Point.from_pixel(pixel_x=pixel_x, pixel_y=pixel_y, zoom=zoom)
 
     assert 'Point Y needs to be a value between 0 and (2^zoom) * 256.' in str(assertion_info.value)
@@ -167,7 +172,7 @@ no_assert_meters = [-ORIGIN_SHIFT, -ORIGIN_SHIFT + 0.1, ORIGIN_SHIFT, ORIGIN_SHI
 def test_assert_meter_x(meter_x):
     meter_y = 0.0
 
-    with pytest.raises(AssertionError) as assertion_info:
+    with pytest.raises(ValueError) as assertion_info:
         _ = Point.from_meters(meter_x=meter_x, meter_y=meter_y)
 
     assert 'Meter X needs to be a value between -{0} and {0}.'.format(ORIGIN_SHIFT) in str(assertion_info.value)
@@ -184,7 +189,7 @@ def test_no_assert_meter_x(meter_x):
 def test_assert_meter_y(meter_y):
     meter_x = 0.0
 
-    with pytest.raises(AssertionError) as assertion_info:
+    with pytest.raises(ValueError) as assertion_info:
         _ = Point.from_meters(meter_x=meter_x, meter_y=meter_y)
 
     assert 'Meter Y needs to be a value between -{0} and {0}.'.format(ORIGIN_SHIFT) in str(assertion_info.value)
@@ -195,3 +200,201 @@ def test_no_assert_meter_y(meter_y):
     meter_x = 10.0
     _ = Point.from_meters(meter_x=meter_x, meter_y=meter_y)
     assert "No assertion raise :)"
+
+
+def test_pixels_tile_grid(chicago_latitude_longitude, chicago_zoom):
+    grid = TileGrid(tile_size=512)
+    point = Point.from_latitude_longitude(*chicago_latitude_longitude)
+    default_pixel_x, default_pixel_y = point.pixels(zoom=chicago_zoom)
+
+    pixel_x, pixel_y = point.pixels(zoom=chicago_zoom, grid=grid)
+
+    assert (pixel_x, pixel_y) == pytest.approx((2 * default_pixel_x, 2 * default_pixel_y), abs=1)
+    point = Point.from_pixel(pixel_x=pixel_x, pixel_y=pixel_y, zoom=chicago_zoom, grid=grid)
+    assert point.latitude_longitude == pytest.approx(chicago_latitude_longitude, abs=1e-5)
+
+
+def test_assert_pixel_tile_grid():
+    with pytest.raises(ValueError) as assertion_info:
+        _ = Point.from_pixel(pixel_x=1025, pixel_y=0, zoom=1, grid=TileGrid(tile_size=512))
+
+    assert 'Point X needs to be a value between 0 and (2^zoom) * 512.' in str(assertion_info.value)
+
+
+def test_slots_and_pickle(chicago_latitude_longitude):
+    point = Point.from_latitude_longitude(*chicago_latitude_longitude)
+
+    assert not hasattr(point, '__dict__')
+    with pytest.raises(AttributeError):
+        point.zoom = 1
+    unpickled = pickle.loads(pickle.dumps(point, protocol=pickle.HIGHEST_PROTOCOL))
+    assert unpickled == point
+    assert type(unpickled) is Point
+
+
+@pytest.fixture(scope='module')
+def random_latitude_longitude():
+    np = pytest.importorskip('numpy')
+    random = np.random.RandomState(18)
+    return random.uniform(-85.0, 85.0, 2000), random.uniform(-179.0, 179.0, 2000)
+
+
+def test_latitude_longitude_to_meters_exact(random_latitude_longitude):
+    np = pytest.importorskip('numpy')
+    latitudes, longitudes = random_latitude_longitude
+    expected = [Point(latitude, longitude).meters
+                for latitude, longitude in zip(latitudes.tolist(), longitudes.tolist())]
+
+    meters_x, meters_y = latitude_longitude_to_meters(latitudes, longitudes, exact=True)
+
+    assert list(zip(meters_x.tolist(), meters_y.tolist())) == expected
+    np.testing.assert_allclose(np.column_stack(latitude_longitude_to_meters(latitudes, longitudes)), expected,
+                               rtol=1e-12, atol=1e-6)
+
+
+def test_meters_to_latitude_longitude_exact(random_latitude_longitude):
+    np = pytest.importorskip('numpy')
+    meters_x, meters_y = latitude_longitude_to_meters(*random_latitude_longitude)
+    expected = [Point.from_meters(meter_x, meter_y).latitude_longitude
+                for meter_x, meter_y in zip(meters_x.tolist(), meters_y.tolist())]
+
+    latitudes, longitudes = meters_to_latitude_longitude(meters_x, meters_y, exact=True)
+
+    assert list(zip(latitudes.tolist(), longitudes.tolist())) == expected
+    np.testing.assert_allclose(np.column_stack(meters_to_latitude_longitude(meters_x, meters_y)), expected,
+                               rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize('zoom', [0, 3, 19, 30])
+def test_latitude_longitude_to_pixels_exact(random_latitude_longitude, zoom):
+    latitudes, longitudes = random_latitude_longitude
+    expected = [Point(latitude, longitude).pixels(zoom=zoom)
+                for latitude, longitude in zip(latitudes.tolist(), longitudes.tolist())]
+
+    pixels_x, pixels_y = latitude_longitude_to_pixels(latitudes, longitudes, zoom=zoom, exact=True)
+
+    assert list(zip(pixels_x.tolist(), pixels_y.tolist())) == expected
+
+
+@pytest.mark.parametrize('zoom', [1, 3, 19])
+def test_pixels_to_latitude_longitude_exact(random_latitude_longitude, zoom):
+    np = pytest.importorskip('numpy')
+    pixels_x, pixels_y = latitude_longitude_to_pixels(*random_latitude_longitude, zoom=zoom)
+    half_size = 2 ** zoom * 128.0
+    pixels_x, pixels_y = np.append(pixels_x, [0.0, half_size]), np.append(pixels_y, [half_size, 0.0])
+    expected = [Point.from_pixel(pixel_x, pixel_y, zoom=zoom).latitude_longitude
+                for pixel_x, pixel_y in zip(pixels_x.tolist(), pixels_y.tolist())]
+
+    latitudes, longitudes = pixels_to_latitude_longitude(pixels_x, pixels_y, zoom=zoom, exact=True)
+
+    assert list(zip(latitudes.tolist(), longitudes.tolist())) == expected
+
+
+def test_pixels_to_latitude_longitude_zoom_array(chicago_latitude_longitude, chicago_pixel, chicago_zoom):
+    np = pytest.importorskip('numpy')
+    pixels_x, pixels_y = np.array([chicago_pixel[0], 128.0]), np.array([chicago_pixel[1], 128.0])
+
+    latitudes, longitudes = pixels_to_latitude_longitude(pixels_x, pixels_y, zoom=np.array([chicago_zoom, 0]))
+
+    assert (latitudes[0], longitudes[0]) == pytest.approx(chicago_latitude_longitude, abs=1e-5)
+    assert (latitudes[1], longitudes[1]) == (0.0, 0.0)
+
+
+def test_latitude_longitude_to_meters_array_buffers(chicago_latitude_longitude):
+    pytest.importorskip('numpy')
+    latitude, longitude = chicago_latitude_longitude
+    latitudes, longitudes = array.array('d', [latitude, 0.0]), array.array('d', [longitude, 0.0])
+    meters_x, meters_y = array.array('d', [1.0, 1.0]), array.array('d', [1.0, 1.0])
+
+    latitude_longitude_to_meters(latitudes, longitudes, out=(meters_x, meters_y))
+
+    assert (meters_x[0], meters_y[0]) == pytest.approx(Point(latitude, longitude).meters, rel=1e-12)
+    assert (meters_x[1], meters_y[1]) == pytest.approx((0.0, 0.0), abs=1e-6)
+
+
+def test_meters_to_latitude_longitude_in_place(chicago_meters):
+    np = pytest.importorskip('numpy')
+    meters_x, meters_y = np.array([chicago_meters[0]]), np.array([chicago_meters[1]])
+    expected = Point.from_meters(*chicago_meters).latitude_longitude
+
+    latitudes, longitudes = meters_to_latitude_longitude(meters_x, meters_y, out=(meters_y, meters_x))
+
+    assert latitudes is meters_y and longitudes is meters_x
+    assert (latitudes[0], longitudes[0]) == pytest.approx(expected, rel=1e-12)
+
+
+def test_assert_out_buffers():
+    np = pytest.importorskip('numpy')
+    with pytest.raises(ValueError) as assertion_info:
+        latitude_longitude_to_meters([0.0, 1.0], [0.0, 1.0], out=(np.empty(2), np.empty(3)))
+
+    assert 'Out needs to be buffers of float64 with the size of the input.' in str(assertion_info.value)
+
+
+def test_assert_vectorized_projections():
+    pytest.importorskip('numpy')
+    with pytest.raises(ValueError) as assertion_info:
+        latitude_longitude_to_meters([0.0, 91.0], [0.0, 0.0])
+    assert assertion_info.value.indices.tolist() == [1]
+    with pytest.raises(ValueError) as assertion_info:
+        meters_to_latitude_longitude([2.1e7, 0.0], [0.0, 0.0])
+    assert assertion_info.value.indices.tolist() == [0]
+    with pytest.raises(ValueError) as assertion_info:
+        pixels_to_latitude_longitude([0.0, 0.0], [0.0, 513.0], zoom=1)
+    assert 'Point Y needs to be a value between 0 and (2^zoom) * 256.' in str(assertion_info.value)
+
+
+def test_tile_and_offset(chicago_latitude_longitude, chicago_zoom, chicago_google):
+    point = Point.from_latitude_longitude(*chicago_latitude_longitude)
+    pixel_x, pixel_y = point.pixels(zoom=chicago_zoom)
+    google_x, google_y = chicago_google
+
+    tile, offset = point.tile_and_offset(zoom=chicago_zoom)
+
+    assert tile == Tile.for_point(point=point, zoom=chicago_zoom)
+    assert offset == (pixel_x - google_x * 256, pixel_y - google_y * 256)
+    _, fractional_offset = point.tile_and_offset(zoom=chicago_zoom, fractional=True)
+    assert fractional_offset == pytest.approx(offset, abs=0.5)
+    assert fractional_offset != offset
+
+
+def test_tile_and_offset_tile_grid(chicago_latitude_longitude, chicago_zoom):
+    point = Point.from_latitude_longitude(*chicago_latitude_longitude)
+    grid = TileGrid(tile_size=512)
+
+    tile, (offset_x, offset_y) = point.tile_and_offset(zoom=chicago_zoom, grid=grid)
+
+    assert tile == Tile.for_point(point=point, zoom=chicago_zoom, grid=grid)
+    assert 0 <= offset_x < 512 and 0 <= offset_y < 512
+
+
+def test_tile_and_offset_within_tile(random_latitude_longitude):
+    latitudes, longitudes = random_latitude_longitude
+    points = [Point(latitude, longitude) for latitude, longitude in zip(latitudes.tolist(), longitudes.tolist())]
+    points += [Point(0.0, 0.0), Point(0.0, 180.0), Point(-85.05112877980659, -180.0), Point(85.05112877980659, 180.0)]
+
+    for point in points:
+        for fractional in (False, True):
+            tile, (offset_x, offset_y) = point.tile_and_offset(zoom=10, fractional=fractional)
+            assert 0 <= offset_x < 256 and 0 <= offset_y < 256
+            assert 0 <= tile.tms_x < 1024 and 0 <= tile.tms_y < 1024
+    assert Point(0.0, 0.0).tile_and_offset(zoom=1) == (Tile.from_google(google_x=1, google_y=1, zoom=1), (0, 0))
+    assert Point(0.0, 180.0).tile_and_offset(zoom=1, fractional=True)[0] == Tile.from_google(1, 1, zoom=1)
+
+
+@pytest.mark.parametrize('zoom', [0, 1, 12, 19])
+def test_tiles_and_offsets(random_latitude_longitude, zoom):
+    latitudes, longitudes = random_latitude_longitude
+    expected = [Point(latitude, longitude).tile_and_offset(zoom=zoom)
+                for latitude, longitude in zip(latitudes.tolist(), longitudes.tolist())]
+    expected_fractional = [Point(latitude, longitude).tile_and_offset(zoom=zoom, fractional=True)[1]
+                           for latitude, longitude in zip(latitudes.tolist(), longitudes.tolist())]
+
+    tms_x, tms_y, offsets_x, offsets_y = tiles_and_offsets(latitudes, longitudes, zoom=zoom, exact=True)
+    _, _, fractional_x, fractional_y = tiles_and_offsets(latitudes, longitudes, zoom=zoom, fractional=True,
+                                                         exact=True)
+
+    assert [(Tile(tms_x=x, tms_y=y, zoom=zoom), (offset_x, offset_y)) for x, y, offset_x, offset_y in
+            zip(tms_x.tolist(), tms_y.tolist(), offsets_x.tolist(), offsets_y.tolist())] == expected
+    assert list(zip(fractional_x.tolist(), fractional_y.tolist())) == expected_fractional
+    assert offsets_x.dtype.kind == 'i' and fractional_x.dtype.kind == 'f'
@@ -1,6 +1,9 @@
+import pickle
+
 import pytest
-from pygeotile.tile import Tile
+from pygeotile.tile import Tile, tiles_for_bounds, count_tiles_for_bounds
 from pygeotile.tile import Point
+from pygeotile.meta import TileGrid
 
 
 @pytest.fixture(scope='module')
@@ -127,7 +130,7 @@ no_assert_tms = [(0, 2), (1, 2), (2, 2), (3, 2)]
 def test_assert_tms_x(tms_x, zoom):
     tms_y = 0
 
-    with pytest.raises(AssertionError) as assertion_info:
+    with pytest.raises(ValueError) as assertion_info:
         _ = Tile.from_tms(tms_x=tms_x, tms_y=tms_y, zoom=zoom)
 
     assert 'TMS X needs to be a value between 0 and (2^zoom) -1.' in str(assertion_info.value)
@@ -144,7 +147,7 @@ def test_no_assert_tms_x(tms_x, zoom):
 def test_assert_tms_y(tms_y, zoom):
     tms_x = 0
 
-    with pytest.raises(AssertionError) as assertion_info:
+    with pytest.raises(ValueError) as assertion_info:
         _ = Tile.from_tms(tms_x=tms_x, tms_y=tms_y, zoom=zoom)
 
     assert 'TMS Y needs to be a value between 0 and (2^zoom) -1.' in str(assertion_info.value)
@@ -161,7 +164,7 @@ def test_no_assert_tms_y(tms_y, zoom):
 def test_assert_google_x(google_x, zoom):
     google_y = 0
 
-    with pytest.raises(AssertionError) as assertion_info:
+    with pytest.raises(ValueError) as assertion_info:
         _ = Tile.from_google(google_x=google_x, google_y=google_y, zoom=zoom)
 
     assert 'Google X needs to be a value between 0 and (2^zoom) -1.' in str(assertion_info.value)
@@ -178,7 +181,7 @@ def test_no_assert_google_x(google_x, zoom):
 def test_assert_google_y(google_y, zoom):
     google_x = 0
 
-    with pytest.raises(AssertionError) as assertion_info:
+    with pytest.raises(ValueError) as assertion_info:
         _ = Tile.from_google(google_x=google_x, google_y=google_y, zoom=zoom)
 
     assert 'Google Y needs to be a value between 0 and (2^zoom) -1.' in str(assertion_info.value)
@@ -193,7 +196,7 @@ def test_no_assert_google_y(google_y, zoom):
 
 @pytest.mark.parametrize("quad_tree", ['-1', '1235', 'aba', '9988'])
 def test_assert_quad_tree(quad_tree):
-    with pytest.raises(AssertionError) as assertion_info:
+    with pytest.raises(ValueError) as assertion_info:
         _ = Tile.from_quad_tree(quad_tree=quad_tree)
 
     assert 'QuadTree value can only consists of the digits 0, 1, 2 and 3.' in str(assertion_info.value)
@@ -203,3 +206,280 @@ def test_assert_quad_tree(quad_tree):
 def test_no_assert_quad_tree(quad_tree):
     _ = Tile.from_quad_tree(quad_tree=quad_tree)
     assert "No assertion raise :)"
+
+
+def test_for_latitude_longitude_array(chicago_latitude_longitude, chicago_zoom, chicago_tms):
+    np = pytest.importorskip('numpy')
+    latitude, longitude = chicago_latitude_longitude
+    latitudes, longitudes = np.array([latitude, 0.0, -33.87, 85.0]), np.array([longitude, 0.0, 151.21, -180.0])
+
+    tms_x, tms_y, zoom = Tile.for_latitude_longitude_array(latitudes=latitudes, longitudes=longitudes,
+                                                           zoom=chicago_zoom)
+
+    assert (tms_x[0], tms_y[0]) == chicago_tms
+    assert np.all(zoom == chicago_zoom)
+    for index, (latitude, longitude) in enumerate(zip(latitudes, longitudes)):
+        tile = Tile.for_latitude_longitude(latitude=latitude, longitude=longitude, zoom=chicago_zoom)
+        assert (tms_x[index], tms_y[index]) == tile.tms
+    assert tms_x[3] == 0
+
+
+def test_for_latitude_longitude_array_edges():
+    np = pytest.importorskip('numpy')
+    latitudes, longitudes = np.array([0.0, 0.0, 90.0, -90.0, 85.06, -85.06]), np.array([-180.0, 180.0, 0, 0, 0, 0])
+
+    tms_x, tms_y, _ = Tile.for_latitude_longitude_array(latitudes=latitudes, longitudes=longitudes, zoom=2)
+
+    assert list(zip(tms_x.tolist(), tms_y.tolist())) == [(0, 2), (3, 2), (1, 3), (1, 0), (1, 3), (1, 0)]
+    for latitude, longitude, expected in zip(latitudes, longitudes, zip(tms_x.tolist(), tms_y.tolist())):
+        assert Tile.for_latitude_longitude(latitude=latitude, longitude=longitude, zoom=2).tms == expected
+
+
+@pytest.mark.parametrize("latitude, longitude, zoom", [(45.0, -179.9, 1), (0.0, -180.0, 10), (89.0, 0.0, 10),
+                                                       (-90.0, 10.0, 10), (85.0511287798066, 0.0, 10)])
+def test_for_latitude_longitude_map_edges(latitude, longitude, zoom):
+    np = pytest.importorskip('numpy')
+    tile = Tile.for_latitude_longitude(latitude=latitude, longitude=longitude, zoom=zoom)
+
+    tms_x, tms_y, _ = Tile.for_latitude_longitude_array(latitudes=latitude, longitudes=longitude, zoom=zoom)
+
+    assert tms_x.shape == (1,)
+    assert tile.tms == (tms_x[0], tms_y[0])
+    assert np.all((tms_x >= 0) & (tms_y >= 0))
+
+
+@pytest.mark.parametrize("latitude, longitude, message", [
+    (0.0, 180.1, 'Longitude needs to be a value between -180.0 and 180.0.'),
+    (-90.1, 0.0, 'Latitude needs to be a value between -90.0 and 90.0.'),
+])
+def test_assert_for_latitude_longitude_array(latitude, longitude, message):
+    np = pytest.importorskip('numpy')
+
+    with pytest.raises(ValueError) as assertion_info:
+        _ = Tile.for_latitude_longitude_array(latitudes=np.array([0.0, latitude]),
+                                              longitudes=np.array([0.0, longitude]), zoom=3)
+
+    assert message in str(assertion_info.value)
+
+
+def test_quad_key_int_chicago(chicago_tms, chicago_zoom, chicago_quad_tree):
+    tms_x, tms_y = chicago_tms
+    tile = Tile.from_tms(tms_x=tms_x, tms_y=tms_y, zoom=chicago_zoom)
+
+    quad_key_int = tile.quad_key_int
+
+    assert quad_key_int >> (2 * (29 - chicago_zoom) + 5) == int(chicago_quad_tree, 4)
+    assert quad_key_int & 31 == chicago_zoom
+    assert Tile.from_quad_key_int(quad_key_int) == tile
+
+
+@pytest.mark.parametrize("quad_tree", ['', '0', '3', '1202211', '0302222310303211330', '3' * 29, '0123' * 8,
+                                       '1' * 33, '0123' * 8 + '2', '3210' * 12])
+def test_quad_tree_round_trip(quad_tree):
+    tile = Tile.from_quad_tree(quad_tree=quad_tree)
+
+    assert tile.zoom == len(quad_tree)
+    assert tile.quad_tree == quad_tree
+
+
+def test_quad_tree_zoom_33():
+    tile = Tile(tms_x=2 ** 33 - 1, tms_y=0, zoom=33)
+
+    assert tile.quad_tree == '3' * 33
+    assert Tile.from_quad_tree('3' * 33) == tile
+    assert Tile.from_quad_tree('2' + '0' * 32) == Tile(tms_x=0, tms_y=2 ** 32 - 1, zoom=33)
+
+
+def test_quad_key_int_order():
+    parent = Tile.from_quad_tree('1202')
+    children = [Tile.from_quad_tree('1202' + digit) for digit in '0123']
+    sibling = Tile.from_quad_tree('1203')
+
+    keys = [parent.quad_key_int] + [child.quad_key_int for child in children] + [sibling.quad_key_int]
+
+    assert keys == sorted(keys)
+    assert [Tile.from_quad_key_int(key) for key in keys] == [parent] + children + [sibling]
+
+
+@pytest.mark.parametrize("quad_key_int", [-1, 30, 2 ** 63])
+def test_assert_quad_key_int(quad_key_int):
+    with pytest.raises(ValueError) as assertion_info:
+        _ = Tile.from_quad_key_int(quad_key_int)
+
+    assert 'Integer quad key needs to be a 63 bit value with a zoom between 0 and 29.' in str(assertion_info.value)
+
+
+def test_parent(chicago_quad_tree):
+    tile = Tile.from_quad_tree(chicago_quad_tree)
+
+    assert tile.parent() == Tile.from_quad_tree(chicago_quad_tree[:-1])
+    assert tile.parent(levels=5) == Tile.from_quad_tree(chicago_quad_tree[:-5])
+    assert tile.parent(levels=0) == tile
+    assert tile.parent(levels=tile.zoom) == Tile.from_tms(tms_x=0, tms_y=0, zoom=0)
+
+
+@pytest.mark.parametrize("levels", [-1, 8])
+def test_assert_parent(quad_tree, levels):
+    tile = Tile.from_quad_tree(quad_tree)
+
+    with pytest.raises(ValueError) as assertion_info:
+        _ = tile.parent(levels=levels)
+
+    assert 'Levels needs to be a value between 0 and the zoom of the tile.' in str(assertion_info.value)
+
+
+def test_children(quad_tree):
+    tile = Tile.from_quad_tree(quad_tree)
+
+    children = tile.children()
+
+    assert [child.quad_tree for child in children] == [quad_tree + digit for digit in '0123']
+    assert all(child.parent() == tile for child in children)
+
+
+def test_ancestors(quad_tree):
+    tile = Tile.from_quad_tree(quad_tree)
+
+    ancestors = tile.ancestors()
+
+    assert [ancestor.quad_tree for ancestor in ancestors] == [quad_tree[:i] for i in range(len(quad_tree) - 1, -1, -1)]
+
+
+def test_descendants(quad_tree, zoom):
+    tile = Tile.from_quad_tree(quad_tree)
+
+    descendants = list(tile.descendants(max_zoom=zoom + 3))
+
+    assert len(descendants) == 4 + 16 + 64
+    assert len(set(descendants)) == len(descendants)
+    assert all(descendant.quad_tree.startswith(quad_tree) for descendant in descendants)
+    assert [descendant.zoom for descendant in descendants] == sorted(descendant.zoom for descendant in descendants)
+    assert descendants[:4] == sorted(tile.children(), key=lambda child: child.google[::-1])
+    assert list(tile.descendants(max_zoom=zoom)) == []
+
+
+@pytest.fixture(scope='module')
+def chicago_bounds(chicago_latitude_longitude):
+    latitude, longitude = chicago_latitude_longitude
+    return latitude - 0.05, longitude - 0.1, latitude + 0.05, longitude + 0.1
+
+
+@pytest.mark.parametrize("order", ['row', 'morton'])
+def test_tiles_for_bounds(chicago_bounds, order):
+    south, west, north, east = chicago_bounds
+
+    tiles = list(tiles_for_bounds(south, west, north, east, min_zoom=0, max_zoom=14, order=order))
+
+    assert len(tiles) == len(set(tiles))
+    assert len(tiles) == count_tiles_for_bounds(south, west, north, east, min_zoom=0, max_zoom=14)
+    for zoom in range(15):
+        zoom_tiles = [tile for tile in tiles if tile.zoom == zoom]
+        corners = [Tile.for_latitude_longitude(latitude=latitude, longitude=longitude, zoom=zoom)
+                   for latitude in (south, north) for longitude in (west, east)]
+        google_x, google_y = zip(*(corner.google for corner in corners))
+        assert len(zoom_tiles) == (max(google_x) - min(google_x) + 1) * (max(google_y) - min(google_y) + 1)
+        assert set(corners) <= set(zoom_tiles)
+
+
+def test_tiles_for_bounds_order(chicago_bounds):
+    south, west, north, east = chicago_bounds
+
+    rows = list(tiles_for_bounds(south, west, north, east, min_zoom=12, max_zoom=12, order='row'))
+    morton = list(tiles_for_bounds(south, west, north, east, min_zoom=12, max_zoom=12, order='morton'))
+
+    assert rows == sorted(rows, key=lambda tile: tile.google[::-1])
+    assert morton == sorted(rows, key=lambda tile: tile.quad_tree)
+
+
+def test_tiles_for_bounds_world():
+    tiles = list(tiles_for_bounds(-90.0, -180.0, 90.0, 180.0, min_zoom=0, max_zoom=2))
+
+    assert len(tiles) == 1 + 4 + 16
+    assert count_tiles_for_bounds(-90.0, -180.0, 90.0, 180.0, min_zoom=0, max_zoom=25) == sum(4 ** z for z in range(26))
+
+
+def test_tiles_for_bounds_edge():
+    tiles = list(tiles_for_bounds(0.0, 0.0, 10.0, 10.0, min_zoom=1, max_zoom=1))
+
+    assert tiles == [Tile.from_google(google_x=1, google_y=0, zoom=1)]
+
+
+@pytest.mark.parametrize("south, north", [(86.0, 89.0), (-89.0, -86.0), (90.0, 90.0)])
+def test_tiles_for_bounds_beyond_map(south, north):
+    assert list(tiles_for_bounds(south, 0.0, north, 10.0, min_zoom=0, max_zoom=3)) == []
+    assert count_tiles_for_bounds(south, 0.0, north, 10.0, min_zoom=0, max_zoom=3) == 0
+    assert list(tiles_for_bounds(80.0, 0.0, 89.0, 10.0, min_zoom=1, max_zoom=1)) == [Tile(tms_x=1, tms_y=1, zoom=1)]
+
+
+@pytest.mark.parametrize("south, west, north, east, message", [
+    (10.0, 0.0, 0.0, 10.0, 'South and north need to be ordered values between -90.0 and 90.0.'),
+    (0.0, 10.0, 10.0, 0.0, 'West and east need to be ordered values between -180.0 and 180.0.'),
+    (0.0, 0.0, 10.0, 190.0, 'West and east need to be ordered values between -180.0 and 180.0.'),
+])
+def test_assert_tiles_for_bounds(south, west, north, east, message):
+    with pytest.raises(ValueError) as assertion_info:
+        _ = count_tiles_for_bounds(south, west, north, east, min_zoom=0, max_zoom=1)
+
+    assert message in str(assertion_info.value)
+
+
+def test_tile_grids_side_by_side(chicago_latitude_longitude, chicago_zoom, chicago_tms, chicago_pixel):
+    latitude, longitude = chicago_latitude_longitude
+    grid = TileGrid(tile_size=512)
+
+    tile = Tile.for_latitude_longitude(latitude=latitude, longitude=longitude, zoom=chicago_zoom, grid=grid)
+
+    assert tile.tms == chicago_tms
+    assert Tile.for_latitude_longitude(latitude=latitude, longitude=longitude, zoom=chicago_zoom).tms == chicago_tms
+    pixel_x, pixel_y = chicago_pixel
+    assert Tile.for_pixels(pixel_x=2 * pixel_x, pixel_y=2 * pixel_y, zoom=chicago_zoom, grid=grid).tms == chicago_tms
+
+
+def test_bounds_meters_chicago(chicago_quad_tree, chicago_meter_bounds, chicago_latitude_longitude_bounds):
+    tile = Tile.from_quad_tree(chicago_quad_tree)
+
+    meters_min, meters_max = tile.bounds_meters
+    latitude_longitude_min, latitude_longitude_max = tile.bounds_latitude_longitude
+
+    assert meters_min == pytest.approx(chicago_meter_bounds[0], abs=1e-6)
+    assert meters_max == pytest.approx(chicago_meter_bounds[1], abs=1e-6)
+    assert latitude_longitude_min == pytest.approx(chicago_latitude_longitude_bounds[0], abs=1e-9)
+    assert latitude_longitude_max == pytest.approx(chicago_latitude_longitude_bounds[1], abs=1e-9)
+
+
+def test_slots_and_pickle(chicago_quad_tree):
+    tile = Tile.from_quad_tree(chicago_quad_tree)
+
+    assert not hasattr(tile, '__dict__')
+    with pytest.raises(AttributeError):
+        tile.name = 'chicago'
+    unpickled = pickle.loads(pickle.dumps(tile, protocol=pickle.HIGHEST_PROTOCOL))
+    assert unpickled == tile
+    assert type(unpickled) is Tile
+
+
+def test_for_latitude_longitude_all_zooms(chicago_latitude_longitude, chicago_zoom, chicago_tms):
+    latitude, longitude = chicago_latitude_longitude
+
+    tiles = Tile.for_latitude_longitude_all_zooms(latitude=latitude, longitude=longitude, min_zoom=0,
+                                                  max_zoom=chicago_zoom)
+
+    assert [tile.zoom for tile in tiles] == list(range(chicago_zoom + 1))
+    assert tiles[-1].tms == chicago_tms
+    assert tiles[:-1] == tiles[-1].ancestors()[::-1]
+    for tile in tiles:
+        assert tile == Tile.for_latitude_longitude(latitude=latitude, longitude=longitude, zoom=tile.zoom)
+
+
+def test_for_latitude_longitude_all_zooms_array(chicago_latitude_longitude):
+    np = pytest.importorskip('numpy')
+    latitude, longitude = chicago_latitude_longitude
+    latitudes, longitudes = np.array([latitude, -33.87]), np.array([longitude, 151.21])
+
+    tms_x, tms_y, zoom = Tile.for_latitude_longitude_all_zooms_array(latitudes=latitudes, longitudes=longitudes,
+                                                                     min_zoom=3, max_zoom=18)
+
+    assert tms_x.shape == tms_y.shape == zoom.shape == (16, 2)
+    for index, (latitude, longitude) in enumerate(zip(latitudes, longitudes)):
+        tiles = Tile.for_latitude_longitude_all_zooms(latitude=latitude, longitude=longitude, min_zoom=3, max_zoom=18)
+        assert [(x, y, z) for x, y, z in zip(tms_x[:, index], tms_y[:, index], zoom[:, index])] == tiles
@@ -0,0 +1,155 @@
+import pytest
+from pygeotile.tile import Tile
+
+np = pytest.importorskip('numpy')
+from pygeotile.tile_array import TileArray  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def tiles(chicago_tms, chicago_zoom):
+    tms_x, tms_y = chicago_tms
+    return [Tile.from_tms(tms_x=tms_x, tms_y=tms_y, zoom=chicago_zoom), Tile.from_tms(tms_x=67, tms_y=83, zoom=7),
+            Tile.from_tms(tms_x=0, tms_y=0, zoom=0), Tile.from_tms(tms_x=1, tms_y=0, zoom=1)]
+
+
+def test_round_trip(tiles):
+    tile_array = TileArray.from_tiles(tiles)
+
+    assert len(tile_array) == len(tiles)
+    assert tile_array.to_tiles() == tiles
+    assert all(isinstance(tile, Tile) for tile in tile_array)
+    assert tile_array.nbytes == 9 * len(tiles)
+
+
+def test_empty():
+    tile_array = TileArray.from_tiles([])
+
+    assert len(tile_array) == 0
+    assert tile_array.to_tiles() == []
+    assert list(tile_array.quad_tree) == []
+
+
+def test_getitem(tiles):
+    tile_array = TileArray.from_tiles(tiles)
+
+    assert tile_array[1] == tiles[1]
+    assert tile_array[-1] == tiles[-1]
+    assert tile_array[1:3].to_tiles() == tiles[1:3]
+    assert tile_array[np.array([True, False, False, True])].to_tiles() == [tiles[0], tiles[3]]
+    assert tile_array[[3, 0]].to_tiles() == [tiles[3], tiles[0]]
+    assert tile_array[[]].to_tiles() == []
+    assert tile_array[np.int64(2)] == tiles[2]
+
+
+def test_conversions(tiles):
+    tile_array = TileArray.from_tiles(tiles)
+
+    google_x, google_y = tile_array.google
+    assert list(zip(google_x.tolist(), google_y.tolist())) == [tile.google for tile in tiles]
+    assert list(tile_array.quad_tree) == [tile.quad_tree for tile in tiles]
+    tms_x, tms_y = tile_array.tms
+    assert list(zip(tms_x.tolist(), tms_y.tolist())) == [tile.tms for tile in tiles]
+
+
+def test_bounds(tiles):
+    tile_array = TileArray.from_tiles(tiles)
+
+    (latitude_min, longitude_min), (latitude_max, longitude_max) = tile_array.bounds
+
+    for index, tile in enumerate(tiles):
+        point_min, point_max = tile.bounds
+        assert (latitude_min[index], longitude_min[index]) == pytest.approx(point_min.latitude_longitude)
+        assert (latitude_max[index], longitude_max[index]) == pytest.approx(point_max.latitude_longitude)
+
+
+def test_from_google(tiles):
+    google = [tile.google for tile in tiles]
+    google_x, google_y = zip(*google)
+
+    tile_array = TileArray.from_google(google_x=google_x, google_y=google_y, zoom=[tile.zoom for tile in tiles])
+
+    assert tile_array.to_tiles() == tiles
+
+
+def test_for_latitude_longitude(chicago_latitude_longitude, chicago_zoom, chicago_tms):
+    latitude, longitude = chicago_latitude_longitude
+
+    tile_array = TileArray.for_latitude_longitude(latitudes=[latitude], longitudes=[longitude], zoom=chicago_zoom)
+
+    assert tile_array[0].tms == chicago_tms
+    assert tile_array[0].zoom == chicago_zoom
+
+
+@pytest.mark.parametrize("tms_x, tms_y, message", [
+    ([0, 4], [0, 0], 'TMS X needs to be a value between 0 and (2^zoom) -1.'),
+    ([0, 0], [-1, 0], 'TMS Y needs to be a value between 0 and (2^zoom) -1.'),
+])
+def test_assert_from_tms(tms_x, tms_y, message):
+    with pytest.raises(ValueError) as assertion_info:
+        _ = TileArray.from_tms(tms_x=tms_x, tms_y=tms_y, zoom=[2, 2])
+
+    assert message in str(assertion_info.value)
+
+
+def test_assert_wrapping_columns():
+    with pytest.raises(ValueError) as assertion_info:
+        _ = TileArray(tms_x=[0, -1], tms_y=[0, 0], zoom=[1, 1])
+    assert 'TMS X needs to be a value between 0 and 4294967295.' in str(assertion_info.value)
+    assert assertion_info.value.indices.tolist() == [1]
+    with pytest.raises(ValueError):
+        _ = TileArray(tms_x=[0], tms_y=[2 ** 32], zoom=[1])
+    with pytest.raises(ValueError):
+        _ = TileArray(tms_x=[0], tms_y=[0], zoom=[256])
+    with pytest.raises(ValueError):
+        _ = TileArray.from_google(google_x=[0], google_y=[2], zoom=[1])
+    assert TileArray(tms_x=[-1], tms_y=[0], zoom=[1], validate=False).tms_x.tolist() == [2 ** 32 - 1]
+
+
+def test_quad_key_int(tiles):
+    tile_array = TileArray.from_tiles(tiles)
+
+    quad_key_int = tile_array.quad_key_int
+
+    assert quad_key_int.tolist() == [tile.quad_key_int for tile in tiles]
+    assert TileArray.from_quad_key_int(quad_key_int).to_tiles() == tiles
+
+
+def test_bounds_meters(tiles):
+    tile_array = TileArray.from_tiles(tiles)
+
+    (meter_x_west, meter_y_south), (meter_x_east, meter_y_north) = tile_array.bounds_meters
+
+    for index, tile in enumerate(tiles):
+        meters_min, meters_max = tile.bounds_meters
+        assert (meter_x_west[index], meter_y_south[index]) == meters_min
+        assert (meter_x_east[index], meter_y_north[index]) == meters_max
+
+
+def test_centroids(tiles):
+    tile_array = TileArray.from_tiles(tiles)
+
+    meters_x, meters_y = tile_array.centroids_meters
+    latitudes, longitudes = tile_array.centroids
+
+    for index, tile in enumerate(tiles):
+        (meter_x_west, meter_y_south), (meter_x_east, meter_y_north) = tile.bounds_meters
+        assert (meters_x[index], meters_y[index]) == pytest.approx(((meter_x_west + meter_x_east) / 2.0,
+                                                                    (meter_y_south + meter_y_north) / 2.0))
+        (latitude_min, longitude_min), (latitude_max, longitude_max) = tile.bounds_latitude_longitude
+        assert latitude_min < latitudes[index] < latitude_max
+        assert longitudes[index] == pytest.approx((longitude_min + longitude_max) / 2.0)
+        assert Tile.for_latitude_longitude(latitude=latitudes[index], longitude=longitudes[index],
+                                           zoom=tile.zoom) == tile
+
+
+def test_corners(tiles):
+    tile_array = TileArray.from_tiles(tiles)
+
+    latitudes, longitudes = tile_array.corners
+    meters_x, meters_y = tile_array.corners_meters
+
+    assert latitudes.shape == longitudes.shape == meters_x.shape == meters_y.shape == (len(tiles), 4)
+    for index, tile in enumerate(tiles):
+        (latitude_min, longitude_min), (latitude_max, longitude_max) = tile.bounds_latitude_longitude
+        assert latitudes[index].tolist() == [latitude_max, latitude_max, latitude_min, latitude_min]
+        assert longitudes[index].tolist() == [longitude_min, longitude_max, longitude_max, longitude_min]
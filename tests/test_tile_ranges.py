@@ -0,0 +1,110 @@
+import pytest
+from pygeotile.tile import Tile, tiles_for_bounds
+
+np = pytest.importorskip('numpy')
+from pygeotile.tile_array import TileArray  # noqa: E402
+from pygeotile.tile_set import TileSet  # noqa: E402
+from pygeotile.tile_ranges import TileRanges  # noqa: E402
+
+SWITZERLAND = 45.8, 5.9, 47.8, 10.5
+
+
+@pytest.fixture(scope='module')
+def tiles():
+    return list(tiles_for_bounds(*SWITZERLAND, min_zoom=0, max_zoom=12, order='morton'))
+
+
+def test_for_bounds(tiles):
+    tile_ranges = TileRanges.for_bounds(*SWITZERLAND, min_zoom=0, max_zoom=12)
+
+    assert list(tile_ranges) == tiles
+    assert len(tile_ranges) == len(tiles)
+    assert tile_ranges.range_count < len(tiles) / 10
+    assert tile_ranges.nbytes == 16 * tile_ranges.range_count
+
+
+def test_from_tiles(tiles):
+    tile_ranges = TileRanges.for_bounds(*SWITZERLAND, min_zoom=0, max_zoom=12)
+
+    assert TileRanges.from_tiles(tiles[::-1] + tiles[:10]) == tile_ranges
+    assert TileRanges.from_tile_array(TileArray.from_tiles(tiles)) == tile_ranges
+    assert TileRanges.from_tile_set(TileSet.from_tiles(tiles)) == tile_ranges
+
+
+def test_world_and_empty():
+    world = TileRanges.for_bounds(-90.0, -180.0, 90.0, 180.0, min_zoom=0, max_zoom=29)
+
+    assert world.range_count == 30
+    assert len(world) == sum(4 ** zoom for zoom in range(30))
+    assert Tile.from_google(google_x=2 ** 29 - 1, google_y=0, zoom=29) in world
+    assert len(TileRanges()) == 0
+    assert list(TileRanges.from_tiles([])) == []
+
+
+def test_merge_adjacent_ranges():
+    tile_ranges = TileRanges(start=[4, 0, 3, 9], stop=[8, 3, 4, 10])
+
+    assert (tile_ranges.start.tolist(), tile_ranges.stop.tolist()) == ([0, 9], [8, 10])
+    with pytest.raises(ValueError):
+        TileRanges(start=[3], stop=[3])
+
+
+def test_membership(tiles, chicago_quad_tree):
+    tile_ranges = TileRanges.from_tiles(tiles)
+    outside = Tile.from_quad_tree(chicago_quad_tree)
+
+    assert all(tile in tile_ranges for tile in tiles)
+    assert outside not in tile_ranges
+    assert Tile.from_tms(tms_x=0, tms_y=0, zoom=30) not in tile_ranges
+    contained = tile_ranges.contains(TileArray.from_tiles(tiles[:3] + [outside, outside.parent(levels=15)]))
+    assert contained.tolist() == [True, True, True, False, False]
+
+
+def test_set_operations(tiles):
+    first, second = TileRanges.from_tiles(tiles[::2]), TileRanges.from_tiles(tiles[:100])
+
+    assert set(first | second) == set(tiles[::2]) | set(tiles[:100])
+    assert set(first & second) == set(tiles[:100:2])
+    assert set(first - second) == set(tiles[100::2])
+    assert TileRanges.from_tiles(tiles[::2]) | TileRanges.from_tiles(tiles[1::2]) == TileRanges.from_tiles(tiles)
+    assert len(first & TileRanges()) == 0
+
+
+def test_tile_arrays(tiles):
+    tile_ranges = TileRanges.from_tiles(tiles)
+
+    tile_arrays = list(tile_ranges.tile_arrays(chunk_size=100))
+
+    assert all(len(tile_array) <= 100 for tile_array in tile_arrays)
+    assert [tile for tile_array in tile_arrays for tile in tile_array] == tiles
+    assert tile_ranges.to_tile_array().to_tiles() == tiles
+
+
+def test_bytes_round_trip(tiles):
+    tile_ranges = TileRanges.from_tiles(tiles)
+
+    loaded = TileRanges.frombuffer(tile_ranges.tobytes())
+
+    assert loaded == tile_ranges
+    assert len(tile_ranges.tobytes()) == 16 + tile_ranges.nbytes
+    with pytest.raises(ValueError):
+        TileRanges.frombuffer(b'PGTX' + tile_ranges.tobytes()[4:])
+    with pytest.raises(ValueError):
+        TileRanges.frombuffer(tile_ranges.tobytes()[:-1])
+
+
+def test_save_load(tmpdir, tiles):
+    tile_ranges = TileRanges.from_tiles(tiles)
+    path = str(tmpdir.join('tiles.ranges'))
+
+    tile_ranges.save(path)
+    loaded = TileRanges.load(path)
+
+    assert loaded == tile_ranges
+    assert not loaded.start.flags.writeable
+    assert list(loaded) == tiles
+
+
+def test_repr():
+    assert repr(TileRanges.from_tiles([Tile.from_quad_tree('0'), Tile.from_quad_tree('1')])) == \
+        'TileRanges(tiles=2, ranges=1)'
@@ -0,0 +1,136 @@
+import pytest
+from pygeotile.tile import Tile
+
+np = pytest.importorskip('numpy')
+from pygeotile.tile_array import TileArray  # noqa: E402
+from pygeotile.tile_set import TileSet  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def chicago_tile(chicago_quad_tree):
+    return Tile.from_quad_tree(chicago_quad_tree)
+
+
+@pytest.fixture(scope='module')
+def tile_set(chicago_tile):
+    return TileSet.from_tiles([chicago_tile.parent(levels=9), chicago_tile.parent(levels=3), chicago_tile,
+                               Tile.from_quad_tree('1'), Tile.from_quad_tree('0302')])
+
+
+def test_from_tiles(tile_set, chicago_tile):
+    tiles = list(tile_set)
+
+    assert len(tile_set) == 5
+    assert tiles == sorted(tiles, key=lambda tile: tile.quad_key_int)
+    assert chicago_tile in tiles
+    assert tile_set.zooms.tolist() == [1, 4, 10, 16, 19]
+    assert tile_set.nbytes == 8 * len(tile_set)
+
+
+def test_duplicates_and_order(chicago_tile):
+    tiles = [chicago_tile, Tile.from_quad_tree('1'), chicago_tile]
+
+    assert TileSet.from_tiles(tiles) == TileSet.from_tiles(tiles[::-1])
+    assert len(TileSet.from_tiles(tiles)) == 2
+    assert TileSet.from_tile_array(TileArray.from_tiles(tiles)) == TileSet.from_tiles(tiles)
+
+
+def test_from_quad_key_int(tile_set):
+    assert TileSet.from_quad_key_int(tile_set.quad_key_int[::-1]) == tile_set
+    with pytest.raises(ValueError) as assertion_info:
+        TileSet.from_quad_key_int([Tile.from_quad_tree('1').quad_key_int, 30])
+    assert assertion_info.value.indices.tolist() == [1]
+
+
+def test_membership(tile_set, chicago_tile):
+    assert chicago_tile in tile_set
+    assert chicago_tile.parent() not in tile_set
+    assert Tile.from_quad_tree('') not in tile_set
+    assert Tile.from_tms(tms_x=0, tms_y=0, zoom=30) not in tile_set
+    assert chicago_tile not in TileSet()
+    others = TileArray.from_tiles([chicago_tile, chicago_tile.parent(), Tile.from_quad_tree('1')])
+    assert tile_set.contains(others).tolist() == [True, False, True]
+
+
+def test_within(tile_set, chicago_tile):
+    parent = chicago_tile.parent(levels=9)
+
+    within = tile_set.within(parent)
+
+    assert list(within) == [parent, chicago_tile.parent(levels=3), chicago_tile]
+    assert tile_set.count_within(parent) == 3
+    assert tile_set.count_within(Tile.from_quad_tree('')) == len(tile_set)
+    assert list(tile_set.within(Tile.from_quad_tree('2'))) == []
+    assert list(tile_set.within(chicago_tile)) == [chicago_tile]
+
+
+def test_deepest_tile(tile_set, chicago_tile, chicago_latitude_longitude):
+    latitude, longitude = chicago_latitude_longitude
+    bounds = Tile.from_quad_tree('0302').bounds
+    inside_0302 = ((bounds[0].latitude + bounds[1].latitude) / 2, (bounds[0].longitude + bounds[1].longitude) / 2)
+
+    assert tile_set.deepest_tile(latitude=latitude, longitude=longitude) == chicago_tile
+    assert tile_set.deepest_tile(*inside_0302) == Tile.from_quad_tree('0302')
+    assert tile_set.deepest_tile(latitude=45.0, longitude=45.0) == Tile.from_quad_tree('1')
+    assert tile_set.deepest_tile(latitude=-45.0, longitude=45.0) is None
+    assert TileSet().deepest_tile(latitude=latitude, longitude=longitude) is None
+
+
+def test_deepest_tiles(tile_set, chicago_latitude_longitude):
+    latitudes = np.array([chicago_latitude_longitude[0], 45.0, -45.0, 41.0])
+    longitudes = np.array([chicago_latitude_longitude[1], 45.0, 45.0, -87.0])
+
+    tile_array, found = tile_set.deepest_tiles(latitudes=latitudes, longitudes=longitudes)
+
+    assert found.tolist() == [True, True, False, True]
+    expected = [tile_set.deepest_tile(latitude, longitude) for latitude, longitude in zip(latitudes, longitudes)]
+    assert [tile if hit else None for tile, hit in zip(tile_array, found)] == expected
+    _, found = TileSet().deepest_tiles(latitudes=latitudes, longitudes=longitudes)
+    assert not found.any()
+
+
+@pytest.mark.parametrize("latitude, longitude, expected", [
+    (89.0, -180.0, Tile(0, 1023, 10)),
+    (-90.0, -180.0, Tile(0, 0, 10)),
+    (10.0, -180.0, Tile(0, 0, 0)),
+    (89.0, 10.0, Tile(0, 0, 0)),
+])
+def test_deepest_tile_map_edges(latitude, longitude, expected):
+    tile_set = TileSet.from_tiles([Tile(0, 0, 0), Tile(0, 0, 10), Tile(0, 1023, 10)])
+
+    tile_array, found = tile_set.deepest_tiles(latitudes=[latitude], longitudes=[longitude])
+
+    assert tile_set.deepest_tile(latitude=latitude, longitude=longitude) == expected
+    assert found.tolist() == [True]
+    assert tile_array[0] == expected
+
+
+def test_deepest_tiles_random():
+    random = np.random.RandomState(19)
+    tile_array = TileArray.for_latitude_longitude(latitudes=random.uniform(-80.0, 80.0, 50),
+                                                  longitudes=random.uniform(-170.0, 170.0, 50), zoom=12)
+    tile_set = TileSet.from_tiles([tile.parent(levels=level % 12) for level, tile in enumerate(tile_array)])
+    latitudes, longitudes = random.uniform(-80.0, 80.0, 500), random.uniform(-170.0, 170.0, 500)
+
+    deepest, found = tile_set.deepest_tiles(latitudes=latitudes, longitudes=longitudes)
+
+    for latitude, longitude, tile, hit in zip(latitudes, longitudes, deepest, found):
+        candidates = [ancestor for ancestor in Tile.for_latitude_longitude_all_zooms(latitude, longitude, 0, 12)
+                      if ancestor in tile_set]
+        assert (tile if hit else None) == (candidates[-1] if candidates else None)
+
+
+def test_set_operations(tile_set, chicago_tile):
+    other = TileSet.from_tiles([chicago_tile, Tile.from_quad_tree('2')])
+
+    assert list(tile_set & other) == [chicago_tile]
+    assert len(tile_set | other) == 6
+    assert (tile_set | other).zooms.tolist() == [1, 4, 10, 16, 19]
+    assert chicago_tile not in tile_set - other
+    assert len(tile_set - other) == 4
+    assert tile_set.union(TileSet()) == tile_set
+    assert tile_set != other
+
+
+def test_repr(tile_set):
+    assert repr(tile_set) == 'TileSet(size=5)'
@@ -0,0 +1,66 @@
+import pytest
+from pygeotile.tile import Tile
+from pygeotile.url import TileUrlTemplate, XYZ, TMS, QUAD_TREE, SHARDED
+
+
+@pytest.fixture(scope='module')
+def chicago_tile(chicago_tms, chicago_zoom):
+    tms_x, tms_y = chicago_tms
+    return Tile.from_tms(tms_x=tms_x, tms_y=tms_y, zoom=chicago_zoom)
+
+
+@pytest.mark.parametrize("template, expected", [
+    (XYZ, '19/134494/194918'),
+    ('xyz', '19/134494/194918'),
+    (TMS, '19/134494/329369'),
+    ('tms', '19/134494/329369'),
+    (QUAD_TREE, '0302222310303211330'),
+    ('quad_tree', '0302222310303211330'),
+    (SHARDED, '19/000/134/494/000/194/918'),
+    ('sharded', '19/000/134/494/000/194/918'),
+    ('https://tiles.example.org/{z}/{x}/{-y:07d}.png?key={q}',
+     'https://tiles.example.org/19/134494/0329369.png?key=0302222310303211330'),
+])
+def test_format(chicago_tile, template, expected):
+    assert TileUrlTemplate(template).format(chicago_tile) == expected
+
+
+def test_format_world():
+    assert TileUrlTemplate('{z}/{x}/{y}/{q}.png').format(Tile.from_tms(tms_x=0, tms_y=0, zoom=0)) == '0/0/0/.png'
+    assert TileUrlTemplate(SHARDED).format(Tile.from_tms(tms_x=0, tms_y=0, zoom=0)) == '00/000/000/000/000/000/000'
+
+
+def test_subdomains():
+    template = TileUrlTemplate('https://{s}.tiles.example.org/{z}/{x}/{y}.png', subdomains='abc')
+
+    urls = [template.format(Tile.from_google(google_x=google_x, google_y=0, zoom=2)) for google_x in range(4)]
+
+    assert urls == ['https://{}.tiles.example.org/2/{}/0.png'.format(subdomain, google_x)
+                    for google_x, subdomain in enumerate('abca')]
+    with pytest.raises(ValueError):
+        TileUrlTemplate('https://{s}.tiles.example.org/{z}/{x}/{y}.png')
+
+
+def test_unknown_placeholder():
+    with pytest.raises(ValueError) as assertion_info:
+        TileUrlTemplate('{z}/{column}/{y}')
+
+    assert 'not column.' in str(assertion_info.value)
+
+
+@pytest.mark.parametrize("template", [XYZ, TMS, QUAD_TREE, SHARDED])
+def test_format_tiles(chicago_tile, template):
+    pytest.importorskip('numpy')
+    from pygeotile.tile_array import TileArray
+    tiles = [chicago_tile, chicago_tile.parent(levels=7), Tile.from_tms(tms_x=1, tms_y=0, zoom=1)]
+    url_template = TileUrlTemplate(template)
+
+    expected = [url_template.format(tile) for tile in tiles]
+
+    assert list(url_template.format_tiles(tiles)) == expected
+    assert list(url_template.format_tiles(TileArray.from_tiles(tiles))) == expected
+    assert list(url_template.format_tiles(TileArray.from_tiles([]))) == []
+
+
+def test_repr():
+    assert repr(TileUrlTemplate('tms')) == "TileUrlTemplate('{z}/{x}/{-y}')"
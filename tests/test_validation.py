@@ -0,0 +1,80 @@
+import threading
+
+import pytest
+from pygeotile.point import Point
+from pygeotile.tile import Tile
+from pygeotile.validation import ValidationError, validation, unchecked, invalid_latitude_longitude, \
+    invalid_meters, invalid_pixels, invalid_tiles
+
+
+def test_validation_error_is_value_error():
+    with pytest.raises(ValueError) as error_info:
+        _ = Tile.from_tms(tms_x=4, tms_y=0, zoom=2)
+
+    assert isinstance(error_info.value, ValidationError)
+    assert error_info.value.indices is None
+
+
+def test_unchecked_context():
+    with unchecked():
+        tile = Tile.from_tms(tms_x=4, tms_y=0, zoom=2)
+        point = Point.from_latitude_longitude(latitude=91.0, longitude=0.0)
+
+    assert tile.tms == (4, 0)
+    assert point.latitude == 91.0
+    with pytest.raises(ValidationError):
+        _ = Tile.from_tms(tms_x=4, tms_y=0, zoom=2)
+
+
+def test_validate_overrides_context():
+    with unchecked():
+        with pytest.raises(ValidationError):
+            _ = Tile.from_google(google_x=4, google_y=0, zoom=2, validate=True)
+    assert Point.from_meters(meter_x=1e10, meter_y=0.0, validate=False).longitude > 180.0
+
+
+def test_nested_context():
+    with validation(validate=False):
+        with validation(validate=True):
+            with pytest.raises(ValidationError):
+                _ = Tile.from_quad_tree('4')
+        assert Tile.from_quad_key_int(31).zoom == 31
+
+
+def test_context_is_thread_local():
+    results = []
+
+    def create_tile():
+        try:
+            Tile.from_tms(tms_x=4, tms_y=0, zoom=2)
+            results.append('unchecked')
+        except ValidationError:
+            results.append('validated')
+
+    with unchecked():
+        thread = threading.Thread(target=create_tile)
+        thread.start()
+        thread.join()
+
+    assert results == ['validated']
+
+
+def test_array_indices():
+    np = pytest.importorskip('numpy')
+    latitudes = np.array([0.0, 91.0, 10.0, -95.0, np.nan])
+
+    with pytest.raises(ValidationError) as error_info:
+        _ = Tile.for_latitude_longitude_array(latitudes=latitudes, longitudes=np.zeros(5), zoom=3)
+
+    assert error_info.value.indices.tolist() == [1, 3, 4]
+    assert 'Latitude needs to be a value between -90.0 and 90.0. Invalid at 3 indices: 1, 3, 4' in \
+           str(error_info.value)
+
+
+def test_batch_validators():
+    np = pytest.importorskip('numpy')
+
+    assert invalid_latitude_longitude([0.0, 91.0, 0.0], [0.0, 0.0, 181.0]).tolist() == [1, 2]
+    assert invalid_meters([0.0, 2.1e7, 0.0], [-3e7, 0.0, 0.0]).tolist() == [0, 1]
+    assert invalid_pixels([0, 513, 10], [0, 0, 1024], zooms=[1, 1, 2]).tolist() == [1]
+    assert invalid_tiles(np.array([0, 4, 3]), np.array([-1, 0, 3]), zooms=2).tolist() == [0, 1]